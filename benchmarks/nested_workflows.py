@@ -0,0 +1,77 @@
+"""
+Benchmark validation of large, nested GitHub Actions workflows.
+
+Generates workflows with a growing number of jobs and steps and validates them
+against the bundled GitHub Actions YASL schema, reporting the best of 5 runs
+for each size.  Run from the repository root:
+
+    python benchmarks/nested_workflows.py
+"""
+
+import argparse
+import logging
+import time
+
+from yasl import load_data, load_schema_files
+from yasl.cache import YaslRegistry
+
+SCHEMA = "schemas/gh_actions/github_actions.yasl"
+
+
+def make_workflow(jobs: int, steps: int) -> dict:
+    return {
+        "name": "benchmark",
+        "on": {"schedule": [{"cron": "30 5 * * 1,3"}]},
+        "jobs": {
+            f"job_{j}": {
+                "runs-on": "ubuntu-latest",
+                "env": {"JOB": str(j)},
+                "steps": [
+                    {
+                        "name": f"step {s}",
+                        "if": "github.event_name == 'schedule'",
+                        "uses": "actions/setup-python@v5",
+                        "with": {
+                            "python-version": "3.12",
+                            "matrix": {f"key_{k}": [k, str(k)] for k in range(10)},
+                        },
+                        "env": {"STEP": str(s)},
+                    }
+                    for s in range(steps)
+                ],
+            }
+            for j in range(jobs)
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per size; the best is reported"
+    )
+    args = parser.parse_args()
+
+    logging.getLogger("yasl").setLevel(logging.ERROR)
+    registry = YaslRegistry()
+    registry.clear_caches()
+    if load_schema_files(SCHEMA) is None:
+        raise SystemExit(f"Unable to load '{SCHEMA}'")
+    if registry.get_type("github_actions", "github_actions") is None:
+        raise SystemExit("No 'github_actions' type in the GitHub Actions schema")
+
+    print(f"{'jobs':>6} {'steps':>6} {'best (s)':>10}")
+    for jobs, steps in [(10, 10), (50, 20), (100, 50), (200, 100)]:
+        data = make_workflow(jobs, steps)
+        best = float("inf")
+        for _ in range(args.repeat):
+            registry.clear_unique_values()
+            start = time.perf_counter()
+            if load_data(data, "github_actions", "github_actions") is None:
+                raise SystemExit("Benchmark workflow did not validate")
+            best = min(best, time.perf_counter() - start)
+        print(f"{jobs:>6} {steps:>6} {best:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,34 @@
 # from .cli import main
-from common.utils import advanced_yaml_version
-from yasl.cache import get_yasl_registry
-from yasl.core import (
-    load_data,
-    load_data_files,
-    load_schema,
-    load_schema_files,
-    yasl_eval,
-)
+# The public API is imported on first use, so the CLI can talk to a running
+# `yasl serve` daemon without importing pydantic and the schema machinery.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from common.utils import advanced_yaml_version
+    from yasl.cache import ValidationContext, get_yasl_registry
+    from yasl.core import (
+        CompiledSchema,
+        iter_data_files,
+        load_data,
+        load_data_files,
+        load_schema,
+        load_schema_files,
+        yasl_eval,
+    )
+
+_EXPORTS = {
+    "yasl_eval": "yasl.core",
+    "load_schema": "yasl.core",
+    "load_schema_files": "yasl.core",
+    "load_data": "yasl.core",
+    "load_data_files": "yasl.core",
+    "iter_data_files": "yasl.core",
+    "CompiledSchema": "yasl.core",
+    "get_yasl_registry": "yasl.cache",
+    "ValidationContext": "yasl.cache",
+    "advanced_yaml_version": "common.utils",
+}
 
 __all__ = [
     "yasl_eval",
@@ -15,6 +36,22 @@ __all__ = [
     "load_schema_files",
     "load_data",
     "load_data_files",
+    "iter_data_files",
+    "CompiledSchema",
     "get_yasl_registry",
+    "ValidationContext",
     "advanced_yaml_version",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'yasl' has no attribute '{name}'")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
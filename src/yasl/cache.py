@@ -1,84 +1,322 @@
 import logging
+import threading
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar, Token
 from enum import Enum
 from types import MappingProxyType
-from typing import Any, Optional
+from typing import Any, Optional, get_args
 
 from pydantic import BaseModel
 
+# the registry of the innermost active ValidationContext
+_current_registry: ContextVar[Optional["YaslRegistry"]] = ContextVar(
+    "yasl_registry", default=None
+)
+
+# the reset tokens of the ValidationContexts entered in this thread or task,
+# innermost last; kept per context so that threads entering the same
+# ValidationContext do not pop each other's tokens
+_registry_tokens: ContextVar[tuple[Token, ...]] = ContextVar(
+    "yasl_registry_tokens", default=()
+)
+
+
+class TypeDescriptor:
+    """
+    A registered YASL type whose Pydantic model is generated the first time
+    the type, or a type using it, is looked up.
+
+    Args:
+        name (str): The type name.
+        namespace (str): The namespace of the type.
+        field_names (list[str]): The properties of the type.
+        uses (set[str | None]): The namespaces of the types and enums the
+            properties refer to.
+        build (Callable[[], BaseModel]): Generates the model.
+    """
+
+    __slots__ = ("name", "namespace", "field_names", "uses", "build")
+
+    def __init__(
+        self,
+        name: str,
+        namespace: str,
+        field_names: list[str],
+        uses: set[str | None],
+        build: Callable[[], BaseModel],
+    ):
+        self.name = name
+        self.namespace = namespace
+        self.field_names = field_names
+        self.uses = uses
+        self.build = build
+
+
+def _annotation_namespaces(annotation: Any) -> set[str | None]:
+    """Return the namespaces of the models and enums a field annotation refers to."""
+    namespaces: set[str | None] = set()
+    if isinstance(annotation, type) and issubclass(annotation, (BaseModel, Enum)):
+        namespaces.add(annotation.__module__)
+    for arg in get_args(annotation):
+        namespaces |= _annotation_namespaces(arg)
+    return namespaces
+
 
 class YaslRegistry:
     """
-    Singleton registry for YASL type definitions and enumerations.
+    Registry for YASL type definitions and enumerations.
     Supports registration and lookup by name and optional namespace.
+
+    `YaslRegistry()` returns the registry of the active `ValidationContext`,
+    or the process-wide registry outside of one.
     """
 
     _instance: Optional["YaslRegistry"] = None
 
     def __new__(cls) -> "YaslRegistry":
+        registry = _current_registry.get()
+        if registry is not None:
+            return registry
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._init_registry()
+            cls._instance = cls._create()
         return cls._instance
 
+    @classmethod
+    def _create(cls) -> "YaslRegistry":
+        registry = super().__new__(cls)
+        registry._init_registry()
+        return registry
+
+    def fork(self) -> "YaslRegistry":
+        """
+        Return a registry that shares the types and enums of this one, read
+        only, with its own unique values and reference state.
+        """
+        registry = YaslRegistry._create()
+        registry.yasl_type_defs = self.yasl_type_defs
+        registry._type_descriptors = self._type_descriptors
+        registry._generate_lock = self._generate_lock
+        registry.yasl_enumerations = self.yasl_enumerations
+        registry._type_namespaces = self._type_namespaces
+        registry._enum_namespaces = self._enum_namespaces
+        registry._field_index = self._field_index
+        registry._type_rank = self._type_rank
+        registry._type_count = self._type_count
+        registry.shared = True
+        return registry
+
+    def _check_writable(self) -> None:
+        if self.shared:
+            raise RuntimeError(
+                "The types and enums of this validation context are shared; "
+                "load schemas in the context it was forked from"
+            )
+
     def _init_registry(self) -> None:
+        # set in registries created by `fork`, whose types and enums are read only
+        self.shared = False
+        # generated models, and the types whose models are generated on first use
         self.yasl_type_defs: dict[tuple[str, str | None], BaseModel] = {}
+        self._type_descriptors: dict[tuple[str, str | None], TypeDescriptor] = {}
+        # models may be generated while forked registries validate concurrently
+        self._generate_lock = threading.RLock()
         self.yasl_enumerations: dict[tuple[str, str | None], Enum] = {}
         self.unique_values_store: dict[tuple[str, str | None], dict[str, set]] = {}
+        # secondary indexes from bare name to the namespaces it is registered in
+        self._type_namespaces: dict[str, list[str | None]] = {}
+        self._enum_namespaces: dict[str, list[str | None]] = {}
+        self._unique_namespaces: dict[str, list[str | None]] = {}
+        # inverted index from field name to the types that have that field, and
+        # (field count, registration order) of each type for ranking candidates
+        self._field_index: dict[str, set[tuple[str, str | None]]] = {}
+        self._type_rank: dict[tuple[str, str | None], tuple[int, int]] = {}
+        self._type_count = 0
+        # when set, ref[...] values are collected and checked after all data is loaded
+        self.defer_references: bool = False
+        self.pending_references: dict[str, set] = {}
+        # when set, url_reachable values are collected and checked in one batch
+        self.defer_url_checks: bool = False
+        self.pending_urls: set[str] = set()
+        # when set, unique values are also collected per data file
+        self.record_unique_values: bool = False
+        self.pending_unique_values: dict[tuple[str, str | None], dict[str, set]] = {}
 
     def register_type(self, name: str, type_def: BaseModel, namespace: str) -> None:
+        self._check_writable()
         key = (name, namespace)
-        log = logging.getLogger("yasl")
-        if key in self.yasl_type_defs:
+        if key in self.yasl_type_defs or key in self._type_descriptors:
             raise ValueError(f"Type '{name}' already exists in namespace '{namespace}'")
         self.yasl_type_defs[key] = type_def
-        log.debug(f"Registered type '{name}' in namespace '{namespace}'")
+        self._index_type(key, list(getattr(type_def, "model_fields", {})))
+
+    def register_type_descriptor(self, descriptor: TypeDescriptor) -> None:
+        """
+        Register a type whose model is generated when it is first looked up.
+
+        Raises:
+            ValueError: If the type is already registered.
+        """
+        self._check_writable()
+        key = (descriptor.name, descriptor.namespace)
+        if key in self.yasl_type_defs or key in self._type_descriptors:
+            raise ValueError(
+                f"Type '{descriptor.name}' already exists in namespace '{descriptor.namespace}'"
+            )
+        self._type_descriptors[key] = descriptor
+        self._index_type(key, descriptor.field_names)
+
+    def _index_type(self, key: tuple[str, str | None], field_names: list[str]) -> None:
+        self._type_namespaces.setdefault(key[0], []).append(key[1])
+        for field_name in field_names:
+            self._field_index.setdefault(field_name, set()).add(key)
+        self._type_rank[key] = (len(field_names), self._type_count)
+        self._type_count += 1
+        logging.getLogger("yasl").debug(
+            f"Registered type '{key[0]}' in namespace '{key[1]}'"
+        )
 
     def get_types(self) -> MappingProxyType[tuple[str, str | None], BaseModel]:
-        # Return a read-only view of the registered types
+        # Return a read-only view of the registered types, generating all models
+        for key in self._type_descriptors:
+            self._generate_type(key)
         return MappingProxyType(self.yasl_type_defs)
 
+    def get_namespaces(self) -> set[str | None]:
+        """Return the namespaces that have registered types or enums."""
+        keys = (
+            self.yasl_type_defs.keys()
+            | self._type_descriptors.keys()
+            | self.yasl_enumerations.keys()
+        )
+        return {namespace for _, namespace in keys}
+
+    def get_type_uses(self) -> dict[tuple[str, str | None], set[str | None]]:
+        """
+        Return the namespaces of the types and enums each registered type
+        refers to, without generating any models.
+        """
+        uses = {key: set(d.uses) for key, d in self._type_descriptors.items()}
+        for key, model in self.yasl_type_defs.items():
+            if key not in uses:
+                uses[key] = set()
+                for field in getattr(model, "model_fields", {}).values():
+                    uses[key] |= _annotation_namespaces(field.annotation)
+        return uses
+
     def get_type(
         self,
         name: str,
         namespace: str | None = None,
         default_namespace: str | None = None,
     ) -> BaseModel | None:
+        key = self.find_type(name, namespace, default_namespace)
+        if key is None:
+            return None
+        return self._generate_type(key)
+
+    def find_type(
+        self,
+        name: str,
+        namespace: str | None = None,
+        default_namespace: str | None = None,
+    ) -> tuple[str, str | None] | None:
+        """
+        Resolve a type name like `get_type`, without generating its model.
+
+        Returns:
+            tuple[str, str | None] | None: (name, namespace) of the type, or
+            None if it is not registered.
+
+        Raises:
+            ValueError: If the name is ambiguous.
+        """
         log = logging.getLogger("yasl")
         log.debug(
             f"Looking up type '{name}' in namespace '{namespace}' with default namespace '{default_namespace}'"
         )
         if namespace is not None:
             key = (name, namespace)
-            if key in self.yasl_type_defs:
-                return self.yasl_type_defs[key]
+            if key in self.yasl_type_defs or key in self._type_descriptors:
+                return key
             return None
-        matches = [v for (n, ns), v in self.yasl_type_defs.items() if n == name]
-        if not matches:
+        namespaces = self._type_namespaces.get(name)
+        if not namespaces:
             return None
-        if len(matches) == 1:
-            return matches[0]
+        if len(namespaces) == 1:
+            return (name, namespaces[0])
         elif default_namespace is not None:
             log.debug(
                 f"Trying default namespace '{default_namespace}' for type '{name}'"
             )
             key = (name, default_namespace)
-            if key in self.yasl_type_defs:
-                return self.yasl_type_defs[key]
+            if key in self.yasl_type_defs or key in self._type_descriptors:
+                return key
+        matches = [f"{ns}.{name}" for ns in namespaces]
         raise ValueError(
             f"Ambiguous type name '{name}': found in multiple namespaces {matches}. Specify a namespace."
         )
 
+    def _generate_type(self, key: tuple[str, str | None]) -> BaseModel:
+        """Return the model of a registered type, generating it on first use."""
+        model = self.yasl_type_defs.get(key)
+        if model is not None:
+            return model
+        with self._generate_lock:
+            model = self.yasl_type_defs.get(key)
+            if model is None:
+                # generate in this registry, whatever context is active
+                token = _current_registry.set(self)
+                try:
+                    model = self._type_descriptors[key].build()
+                finally:
+                    _current_registry.reset(token)
+                self.yasl_type_defs[key] = model
+                logging.getLogger("yasl").debug(
+                    f"Generated model of type '{key[0]}' in namespace '{key[1]}'"
+                )
+        return model
+
+    def find_types_for_keys(self, keys: Iterable[str]) -> list[tuple[str, str | None]]:
+        """
+        Find the registered types that have a field for every one of the given keys.
+
+        Args:
+            keys (Iterable[str]): The root keys of a data document.
+
+        Returns:
+            list[tuple[str, str | None]]: (name, namespace) of each matching type,
+            most specific first: types with the fewest fields come first, ties
+            are broken by registration order.
+        """
+        candidates: set[tuple[str, str | None]] | None = None
+        for key in keys:
+            types = self._field_index.get(key)
+            if not types:
+                return []
+            candidates = set(types) if candidates is None else candidates & types
+            if not candidates:
+                return []
+        if candidates is None:
+            candidates = set(self._type_rank)
+        return sorted(candidates, key=self._type_rank.__getitem__)
+
     def register_enum(self, name: str, enum_def: Enum, namespace: str) -> None:
+        self._check_writable()
         log = logging.getLogger("yasl")
         key = (name, namespace)
         if key in self.yasl_enumerations:
             raise ValueError(f"Enum '{name}' already exists in namespace '{namespace}'")
         self.yasl_enumerations[key] = enum_def
+        self._enum_namespaces.setdefault(name, []).append(namespace)
         log.debug(f"Registered enum '{name}' in namespace '{namespace}'")
 
     def get_enums(self) -> list[tuple[str, str | None]]:
         return [(n, ns) for (n, ns) in self.yasl_enumerations.keys()]
 
+    def has_enum_name(self, name: str) -> bool:
+        """Return True if an enum of this name is registered in any namespace."""
+        return name in self._enum_namespaces
+
     def get_enum(
         self,
         name: str,
@@ -94,15 +332,16 @@ class YaslRegistry:
             if key in self.yasl_enumerations:
                 return self.yasl_enumerations[key]
             return None
-        matches = [v for (n, ns), v in self.yasl_enumerations.items() if n == name]
-        if not matches:
+        namespaces = self._enum_namespaces.get(name)
+        if not namespaces:
             return None
-        if len(matches) == 1:
-            return matches[0]
+        if len(namespaces) == 1:
+            return self.yasl_enumerations[name, namespaces[0]]
         elif default_namespace is not None:
             key = (name, default_namespace)
             if key in self.yasl_enumerations:
                 return self.yasl_enumerations[key]
+        matches = [self.yasl_enumerations[name, ns] for ns in namespaces]
         raise ValueError(
             f"Ambiguous enum name '{name}': found in multiple namespaces {matches}. Specify a namespace."
         )
@@ -116,6 +355,7 @@ class YaslRegistry:
     ) -> None:
         if (type_name, type_namespace) not in self.unique_values_store:
             self.unique_values_store[type_name, type_namespace] = {}
+            self._unique_namespaces.setdefault(type_name, []).append(type_namespace)
         if property_name not in self.unique_values_store[type_name, type_namespace]:
             self.unique_values_store[type_name, type_namespace][property_name] = set()
         if value in self.unique_values_store[type_name, type_namespace][property_name]:
@@ -123,6 +363,43 @@ class YaslRegistry:
                 f"Duplicate unique value '{value}' for property '{property_name}' in type '{type_name}'"
             )
         self.unique_values_store[type_name, type_namespace][property_name].add(value)
+        if self.record_unique_values:
+            self.pending_unique_values.setdefault(
+                (type_name, type_namespace), {}
+            ).setdefault(property_name, set()).add(value)
+
+    def register_unique_values(
+        self, unique_values: dict[tuple[str, str | None], dict[str, set]]
+    ) -> None:
+        """
+        Register unique values collected elsewhere, e.g. in a worker process.
+
+        Raises:
+            ValueError: If a value is already registered.
+        """
+        for (type_name, type_namespace), properties in unique_values.items():
+            for property_name, values in properties.items():
+                for value in values:
+                    self.register_unique_value(
+                        type_name, property_name, value, type_namespace
+                    )
+
+    def discard_unique_values(
+        self, unique_values: dict[tuple[str, str | None], dict[str, set]]
+    ) -> None:
+        """Forget unique values registered earlier, e.g. by a file that failed validation."""
+        for key, properties in unique_values.items():
+            store = self.unique_values_store.get(key, {})
+            for property_name, values in properties.items():
+                store.get(property_name, set()).difference_update(values)
+
+    def take_pending_unique_values(
+        self,
+    ) -> dict[tuple[str, str | None], dict[str, set]]:
+        """Return the unique values recorded since the last call and start a new collection."""
+        unique_values = self.pending_unique_values
+        self.pending_unique_values = {}
+        return unique_values
 
     def unique_value_exists(
         self,
@@ -132,15 +409,11 @@ class YaslRegistry:
         type_namespace: str | None = None,
     ) -> bool:
         if type_namespace is None:
-            matches = [
-                (tn, ns)
-                for (tn, ns) in self.unique_values_store.keys()
-                if tn == type_name
-            ]
-            if not matches:
+            namespaces = self._unique_namespaces.get(type_name)
+            if not namespaces:
                 return False
-            if len(matches) == 1:
-                type_namespace = matches[0][1]
+            if len(namespaces) == 1:
+                type_namespace = namespaces[0]
             else:
                 raise ValueError(
                     f"Ambiguous type name '{type_name}': found in multiple namespaces. Specify a namespace."
@@ -153,11 +426,105 @@ class YaslRegistry:
             in self.unique_values_store[type_name, type_namespace][property_name]
         )
 
-    def clear_caches(self) -> None:
-        """Clean up global stores after validation."""
+    def register_reference(self, target: str, value: Any) -> None:
+        """Record a ref[target] value to be checked by `find_missing_references`."""
+        self.pending_references.setdefault(target, set()).add(value)
+
+    def take_pending_references(self) -> dict[str, set]:
+        """Return the recorded ref[...] values and start a new collection."""
+        references = self.pending_references
+        self.pending_references = {}
+        return references
+
+    def register_url(self, url: str) -> None:
+        """Record a URL to be checked for reachability after validation."""
+        self.pending_urls.add(url)
+
+    def take_pending_urls(self) -> set[str]:
+        """Return the recorded URLs and start a new collection."""
+        urls = self.pending_urls
+        self.pending_urls = set()
+        return urls
+
+    def find_missing_references(self, references: dict[str, set]) -> dict[str, set]:
+        """
+        Check recorded ref[...] values against the unique values store in bulk.
+
+        Args:
+            references (dict[str, set]): Referenced values keyed by ref target,
+                e.g. 'acme.customer.name'.
+
+        Returns:
+            dict[str, set]: The referenced values that do not exist, keyed by ref target.
+        """
+        missing: dict[str, set] = {}
+        for target, values in references.items():
+            type_name, property_name = target.rsplit(".", 1)
+            type_namespace = None
+            if type_name and "." in type_name:
+                type_namespace, type_name = type_name.rsplit(".", 1)
+            if type_namespace is None:
+                namespaces = self._unique_namespaces.get(type_name, [])
+                if len(namespaces) > 1:
+                    raise ValueError(
+                        f"Ambiguous type name '{type_name}': found in multiple namespaces. Specify a namespace."
+                    )
+                type_namespace = namespaces[0] if namespaces else None
+            existing = self.unique_values_store.get((type_name, type_namespace), {})
+            not_found = values - existing.get(property_name, set())
+            if not_found:
+                missing[target] = not_found
+        return missing
+
+    def remove_namespace(self, namespace: str | None) -> None:
+        """Forget the types and enums of a namespace, e.g. to generate them again."""
+        self._check_writable()
+        keys = self.yasl_type_defs.keys() | self._type_descriptors.keys()
+        for key in [key for key in keys if key[1] == namespace]:
+            self.yasl_type_defs.pop(key, None)
+            self._type_descriptors.pop(key, None)
+            del self._type_rank[key]
+            self._type_namespaces[key[0]].remove(namespace)
+            if not self._type_namespaces[key[0]]:
+                del self._type_namespaces[key[0]]
+        for field_name in list(self._field_index):
+            keys = self._field_index[field_name]
+            keys.difference_update([key for key in keys if key[1] == namespace])
+            if not keys:
+                del self._field_index[field_name]
+        for key in [key for key in self.yasl_enumerations if key[1] == namespace]:
+            del self.yasl_enumerations[key]
+            self._enum_namespaces[key[0]].remove(namespace)
+            if not self._enum_namespaces[key[0]]:
+                del self._enum_namespaces[key[0]]
+
+    def clear_unique_values(self) -> None:
+        """Forget all registered unique values, keeping types and enums."""
         self.unique_values_store.clear()
+        self._unique_namespaces.clear()
+
+    def clear_caches(self) -> None:
+        """
+        Clean up the stores after validation.  A forked registry only forgets
+        its own state and keeps the shared types and enums.
+        """
+        self.clear_unique_values()
+        self.pending_references.clear()
+        self.defer_references = False
+        self.pending_urls.clear()
+        self.defer_url_checks = False
+        self.pending_unique_values.clear()
+        self.record_unique_values = False
+        if self.shared:
+            return
         self.yasl_type_defs.clear()
+        self._type_descriptors.clear()
         self.yasl_enumerations.clear()
+        self._type_namespaces.clear()
+        self._enum_namespaces.clear()
+        self._field_index.clear()
+        self._type_rank.clear()
+        self._type_count = 0
 
     def export_schema(self) -> str:
         """
@@ -172,6 +539,7 @@ class YaslRegistry:
 
         yaml = YAML()
         yaml.preserve_quotes = True
+        self.get_types()
 
         # Structure to hold the schema
         schema: dict[str, Any] = {"definitions": {}}
@@ -216,9 +584,6 @@ class YaslRegistry:
                 type_def["description"] = model_cls.__doc__
 
             for field_name, field in model_cls.model_fields.items():
-                if field_name == "yaml_line":
-                    continue
-
                 prop_def: dict[str, Any] = {}
 
                 # Determine YASL type from Python type annotation
@@ -332,10 +697,50 @@ class YaslRegistry:
         return stream.getvalue()
 
 
-# Singleton instance
+# Process-wide instance, used outside of a ValidationContext
 yasl_registry = YaslRegistry()
 
 
 def get_yasl_registry() -> YaslRegistry:
-    """Get the singleton YaslRegistry instance."""
-    return yasl_registry
+    """Get the YaslRegistry of the active ValidationContext, or the process-wide one."""
+    return YaslRegistry()
+
+
+class ValidationContext:
+    """
+    An isolated set of YASL types, enums and validation state.
+
+    While a context is active (`with context:`), all YASL functions in the
+    same thread or task use its registry instead of the process-wide one, so
+    validations in different contexts cannot see each other's schemas or
+    unique values.  Contexts are not inherited by new threads; activate one
+    in each thread.  The same context may be active in several threads at
+    once.
+
+    A context from `run()` shares the compiled types and enums of its parent,
+    read only, with its own unique values and ref[...] state.  Load the
+    schemas once in a parent context and validate each dataset in a run
+    context, concurrently if needed; do not load schemas into the parent
+    while runs are active.
+
+    Args:
+        registry (YaslRegistry | None): The registry to use; a new, empty
+            registry if not given.
+    """
+
+    def __init__(self, registry: YaslRegistry | None = None):
+        self.registry = registry if registry is not None else YaslRegistry._create()
+
+    def run(self) -> "ValidationContext":
+        """Return a context for one validation run against this context's schemas."""
+        return ValidationContext(self.registry.fork())
+
+    def __enter__(self) -> "ValidationContext":
+        token = _current_registry.set(self.registry)
+        _registry_tokens.set(_registry_tokens.get() + (token,))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        *outer, token = _registry_tokens.get()
+        _registry_tokens.set(tuple(outer))
+        _current_registry.reset(token)
@@ -6,12 +6,111 @@ import argparse
 import sys
 
 from common import advanced_yaml_version
-from yasl import yasl_eval
+
+# yasl.core and friends are imported only when needed, so that a run served
+# by the `yasl serve` daemon does not import pydantic.
+
+
+def compile_main(argv: list[str]):
+    parser = argparse.ArgumentParser(
+        prog="yasl compile",
+        description="Compile a YASL schema into an importable Python module",
+    )
+    parser.add_argument("schema", help="YASL schema file or directory")
+    parser.add_argument("module", help="Python module file to write")
+    parser.add_argument(
+        "--quiet", action="store_true", help="Suppress output except for errors"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+
+    args = parser.parse_args(argv)
+
+    if args.verbose and args.quiet:
+        print("❌ Cannot use both --quiet and --verbose.")
+        sys.exit(1)
+
+    from yasl.codegen import compile_schema
+    from yasl.core import setup_logging
+
+    setup_logging(disable=False, verbose=args.verbose, quiet=args.quiet, output="text")
+    if not compile_schema(args.schema, args.module):
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+def serve_main(argv: list[str]):
+    parser = argparse.ArgumentParser(
+        prog="yasl serve",
+        description="Run a validation daemon that keeps YASL schemas loaded. "
+        "'yasl SCHEMA DATA' uses it while it is running.",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Unix socket to listen on. Defaults to $YASL_SOCKET, yasl.sock in $XDG_RUNTIME_DIR, or a per-user socket in the temporary directory.",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Suppress output except for errors"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+
+    args = parser.parse_args(argv)
+
+    if args.verbose and args.quiet:
+        print("❌ Cannot use both --quiet and --verbose.")
+        sys.exit(1)
+
+    from yasl.core import setup_logging
+    from yasl.server import serve
+
+    setup_logging(disable=False, verbose=args.verbose, quiet=args.quiet, output="text")
+    if not serve(args.socket):
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+def client_main(args: argparse.Namespace) -> int | None:
+    """
+    Validate with a running `yasl serve` daemon, printing its log messages.
+
+    Returns:
+        int | None: The exit code, or None if no daemon is running.
+    """
+    from yasl.client import validate
+
+    response = validate(
+        args.schema,
+        [args.yaml],
+        model_name=args.model_name,
+        path=args.socket,
+        fast=args.fast,
+        stream=args.stream,
+        defer_refs=args.defer_refs,
+        verbose=args.verbose,
+        cache_dir=args.cache_dir,
+    )
+    if response is None:
+        return None
+    if "error" in response:
+        print(f"❌ YASL daemon error - {response['error']}")
+        return 1
+    for entry in response["log"]:
+        if not args.quiet or entry["level"] in ("ERROR", "CRITICAL"):
+            print(entry["message"])
+    return 0 if response["valid"] else 1
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "compile":
+        compile_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
-        description="YASL - YAML Advanced Schema Language CLI Tool"
+        description="YASL - YAML Advanced Schema Language CLI Tool",
+        epilog="Run 'yasl compile SCHEMA MODULE' to compile a schema into a Python module, "
+        "or 'yasl serve' to start a validation daemon that later runs use.",
     )
     # Removed --project-name argument; 'param' will be used for project name in 'init'
     parser.add_argument(
@@ -42,6 +141,58 @@ def main():
         default="text",
         help="Set output format (text, json, yaml). Default is text.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the compiled-schema cache. Defaults to $YASL_CACHE_DIR; disabled if unset.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate YAML data files in N worker processes (0 = one per CPU). Default is 1.",
+    )
+
+    parser.add_argument(
+        "--defer-refs",
+        action="store_true",
+        help="Check ref[...] values after all YAML data files are loaded, independent of file order. Implied by --jobs.",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Validate the documents of each YAML data file one at a time, keeping memory use flat for large multi-document files.",
+    )
+
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Parse YAML data files with the C-accelerated safe loader; line numbers are only computed for validation errors.",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-validate YAML data files that changed since they last passed, using a state database in the cache directory.",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the schema loaded and re-validate YAML data whenever schema or data files change.",
+    )
+
+    parser.add_argument(
+        "--socket",
+        help="Unix socket of a running 'yasl serve' daemon. Defaults to $YASL_SOCKET, yasl.sock in $XDG_RUNTIME_DIR, or a per-user socket in the temporary directory.",
+    )
+
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Validate in this process even if a 'yasl serve' daemon is running.",
+    )
 
     args = parser.parse_args()
 
@@ -60,6 +211,36 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    # the daemon serves plain text runs; other options are handled locally
+    if (
+        not args.no_daemon
+        and not args.watch
+        and not args.incremental
+        and args.jobs == 1
+        and args.output == "text"
+    ):
+        code = client_main(args)
+        if code is not None:
+            sys.exit(code)
+
+    if args.watch:
+        from yasl.core import setup_logging
+        from yasl.watch import Watcher
+
+        setup_logging(
+            disable=False, verbose=args.verbose, quiet=args.quiet, output=args.output
+        )
+        Watcher(
+            args.schema,
+            args.yaml,
+            args.model_name,
+            cache_dir=args.cache_dir,
+            fast=args.fast,
+        ).run()
+        sys.exit(0)
+
+    from yasl.core import yasl_eval
+
     yasl = yasl_eval(
         args.schema,
         args.yaml,
@@ -68,9 +249,15 @@ def main():
         quiet_log=args.quiet,
         verbose_log=args.verbose,
         output=args.output,
+        cache_dir=args.cache_dir,
+        jobs=args.jobs,
+        defer_refs=args.defer_refs,
+        stream=args.stream,
+        fast=args.fast,
+        incremental=args.incremental,
     )
 
-    if not yasl:
+    if yasl is None:
         sys.exit(1)
     else:
         sys.exit(0)
@@ -0,0 +1,152 @@
+"""
+Client for the `yasl serve` validation daemon.
+
+Only the standard library is imported here, so a client starts in a few
+milliseconds.  Requests and responses are JSON objects, one per line, sent
+over a Unix domain socket; see `yasl.server` for the protocol.
+
+A daemon is only used if its socket belongs to the current user, is not
+accessible to anyone else, and the daemon runs the same YASL version as the
+client; otherwise runs are validated locally.
+"""
+
+import json
+import logging
+import os
+import socket
+import stat
+import tempfile
+from typing import Any
+
+from common.utils import advanced_yaml_version
+
+# Seconds to wait for the daemon to answer a request.
+REQUEST_TIMEOUT = 600.0
+
+
+def socket_path(path: str | None = None) -> str:
+    """
+    Return the socket of the validation daemon.
+
+    Args:
+        path (str | None): An explicit socket path.
+
+    Returns:
+        str: `path` if given, else $YASL_SOCKET, else `yasl.sock` in
+        $XDG_RUNTIME_DIR, else a per-user socket in the temporary directory.
+    """
+    if path:
+        return path
+    if os.environ.get("YASL_SOCKET"):
+        return os.environ["YASL_SOCKET"]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "yasl.sock")
+    return os.path.join(tempfile.gettempdir(), f"yasl-{os.getuid()}.sock")
+
+
+def is_private_socket(path: str) -> bool:
+    """
+    Return True if `path` is a socket owned by the current user that no other
+    user can access, so the process listening on it can be trusted.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and info.st_mode & 0o077 == 0
+    )
+
+
+def send_request(
+    request: dict[str, Any],
+    path: str | None = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> dict[str, Any] | None:
+    """
+    Send a request to the validation daemon and return its response.
+
+    Args:
+        request (dict[str, Any]): The request object.
+        path (str | None): The daemon's socket, see `socket_path`.
+        timeout (float): Seconds to wait for the response.
+
+    Returns:
+        dict[str, Any] | None: The response, or None if no daemon is
+        listening, its socket is not private to the current user, or it runs
+        another YASL version.
+    """
+    log = logging.getLogger("yasl")
+    path = socket_path(path)
+    if not os.path.exists(path):
+        return None
+    if not is_private_socket(path):
+        log.warning(
+            f"⚠️  Warning: Ignoring YASL daemon socket '{path}' - it is not a socket owned by and private to this user"
+        )
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except OSError:
+            return None
+        with sock.makefile("rwb") as f:
+            ping = _exchange(f, {"command": "ping"})
+            version = ping.get("version") if ping else None
+            if version != advanced_yaml_version():
+                log.warning(
+                    f"⚠️  Warning: Ignoring YASL daemon on '{path}' - it runs version {version}, not {advanced_yaml_version()}"
+                )
+                return None
+            if request.get("command") == "ping":
+                return ping
+            return _exchange(f, request)
+
+
+def _exchange(f: Any, request: dict[str, Any]) -> dict[str, Any] | None:
+    """Send one request over a socket file and read its response."""
+    f.write(json.dumps(request).encode() + b"\n")
+    f.flush()
+    line = f.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def validate(
+    yasl_schema: str,
+    yaml_data: list[str] | None = None,
+    documents: list[dict[str, str]] | None = None,
+    model_name: str | None = None,
+    path: str | None = None,
+    **options: Any,
+) -> dict[str, Any] | None:
+    """
+    Validate YAML data files and inline YAML documents with the daemon.
+
+    Args:
+        yasl_schema (str): Path to the YASL schema file or directory.
+        yaml_data (list[str] | None): YAML data files or directories.
+        documents (list[dict[str, str]] | None): Inline YAML, as objects with
+            a `name` used in messages and the YAML `text`.
+        model_name (str | None): Specific model name to use for validation.
+        path (str | None): The daemon's socket, see `socket_path`.
+        **options: `fast`, `stream`, `defer_refs` and `verbose`, as for `yasl_eval`.
+
+    Returns:
+        dict[str, Any] | None: The response, or None if no daemon is listening.
+    """
+    return send_request(
+        {
+            "cwd": os.getcwd(),
+            "schema": yasl_schema,
+            "data": yaml_data or [],
+            "documents": documents or [],
+            "model_name": model_name,
+            **options,
+        },
+        path,
+    )
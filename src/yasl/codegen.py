@@ -0,0 +1,310 @@
+"""
+Ahead-of-time compilation of YASL schemas into importable Python modules.
+
+The generated module contains the enums, Pydantic models and validators for a
+schema and registers them in the YaslRegistry under their original namespaces
+when it is imported, so `load_data` and `load_data_files` can be used without
+parsing any YASL at process start.
+"""
+
+import datetime
+import keyword
+import logging
+import re
+from collections.abc import Sequence
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic.fields import FieldInfo
+
+from common.utils import advanced_yaml_version
+from yasl.cache import YaslRegistry
+from yasl.core import _in_own_context, _load_schema_file, gen_type_fields
+from yasl.primitives import (
+    ASTROPY_TYPES,
+    STANDARD_TYPES,
+    QuantityBatch,
+    ReferenceMarker,
+)
+from yasl.pydantic_types import TypeDef, YaslRoot
+
+_HEADER = '''"""
+Pydantic models compiled from the YASL schema '{source}'.
+
+Generated by `yasl compile` (advanced-yaml {version}).  Do not edit by hand;
+re-run `yasl compile` when the schema changes.
+"""
+
+import datetime  # noqa: F401
+from typing import Annotated, Any, Optional, Union  # noqa: F401
+
+from pydantic import Field, create_model  # noqa: F401
+
+from yasl.codegen import register_compiled
+from yasl.primitives import PRIMITIVE_TYPE_MAP, QuantityBatch, ReferenceMarker  # noqa: F401
+from yasl.pydantic_types import TypeDef, YASLBaseModel, yasl_enum
+from yasl.validators import property_validator_factory, type_validator_factory
+'''
+
+
+def register_compiled(
+    enums: Sequence[tuple[str, str, Any]],
+    types: Sequence[tuple[str, str, Any]],
+    registry: YaslRegistry | None = None,
+) -> None:
+    """
+    Register compiled enums and types in the YaslRegistry.
+    Definitions that are already registered with the same class are skipped, so
+    a compiled module can be registered again after the registry was cleared.
+    """
+    registry = registry or YaslRegistry()
+    for name, namespace, enum_cls in enums:
+        if registry.get_enum(name, namespace) is not enum_cls:
+            registry.register_enum(name, enum_cls, namespace)
+    for name, namespace, model in types:
+        if registry.get_type(name, namespace) is not model:
+            registry.register_type(name, model, namespace)
+
+
+class _ModuleWriter:
+    """Renders registered YASL enums and types as Python source."""
+
+    def __init__(self):
+        self.names: dict[int, str] = {}
+        self.used: set[str] = set()
+
+    def identifier(self, *parts: str) -> str:
+        candidate = re.sub(r"\W", "_", "__".join(parts))
+        if candidate[0].isdigit() or keyword.iskeyword(candidate):
+            candidate = f"_{candidate}"
+        while candidate in self.used:
+            candidate = f"{candidate}_"
+        self.used.add(candidate)
+        return candidate
+
+    def render_type(self, t: Any) -> str:
+        if id(t) in self.names:
+            return self.names[id(t)]
+        if t is Any:
+            return "Any"
+        if t is type(None):
+            return "None"
+        if t in (str, int, float, bool):
+            return t.__name__
+        for key, value in STANDARD_TYPES.items():
+            if value is t or value == t:
+                return f"PRIMITIVE_TYPE_MAP[{key!r}]"
+        type_name = getattr(t, "__name__", "")
+        if type_name in ASTROPY_TYPES and ASTROPY_TYPES[type_name] is t:
+            return f"PRIMITIVE_TYPE_MAP[{type_name!r}]"
+
+        origin = get_origin(t)
+        args = get_args(t)
+        if origin is Union:
+            non_none = [a for a in args if a is not type(None)]
+            if len(non_none) == 1 and len(args) == 2:
+                return f"Optional[{self.render_type(non_none[0])}]"
+            return f"Union[{', '.join(self.render_type(a) for a in args)}]"
+        if origin is list:
+            return f"list[{self.render_type(args[0])}]"
+        if origin is dict:
+            return f"dict[{self.render_type(args[0])}, {self.render_type(args[1])}]"
+        if origin is Annotated:
+            metadata = []
+            for meta in t.__metadata__:
+                if isinstance(meta, ReferenceMarker):
+                    metadata.append(f"ReferenceMarker({meta.target!r})")
+                elif isinstance(meta, QuantityBatch):
+                    metadata.append("QuantityBatch()")
+                else:
+                    raise ValueError(f"Unsupported type annotation '{t}'")
+            return f"Annotated[{self.render_type(args[0])}, {', '.join(metadata)}]"
+        raise ValueError(f"Unsupported type '{t}'")
+
+    def render_value(self, value: Any) -> str:
+        if value is Ellipsis:
+            return "..."
+        if value is None:
+            return "None"
+        if isinstance(value, bool):
+            return repr(bool(value))
+        if isinstance(value, Enum) and id(type(value)) in self.names:
+            return f"{self.names[id(type(value))]}[{value.name!r}]"
+        if isinstance(value, int):
+            return repr(int(value))
+        if isinstance(value, float):
+            return repr(float(value))
+        if isinstance(value, str):
+            return repr(str(value))
+        if isinstance(value, datetime.date | datetime.time):
+            return repr(value)
+        if isinstance(value, list | tuple):
+            return f"[{', '.join(self.render_value(v) for v in value)}]"
+        if isinstance(value, dict):
+            items = (
+                f"{self.render_value(k)}: {self.render_value(v)}"
+                for k, v in value.items()
+            )
+            return f"{{{', '.join(items)}}}"
+        if isinstance(value, FieldInfo):
+            return (
+                f"Field(default={self.render_value(value.default)}, "
+                f"exclude={self.render_value(value.exclude)})"
+            )
+        raise ValueError(f"Unsupported value '{value!r}'")
+
+
+def render_module(documents: Sequence[YaslRoot], source: str) -> str:
+    """
+    Render the enums and types of loaded YASL documents as a Python module.
+    The documents must have been loaded into the YaslRegistry, in generation order.
+
+    Args:
+        documents (Sequence[YaslRoot]): The loaded YASL documents, including imports.
+        source (str): Description of the schema source for the module docstring.
+
+    Returns:
+        str: The Python source of the compiled module.
+    """
+    registry = YaslRegistry()
+    writer = _ModuleWriter()
+    enum_lines: list[str] = []
+    enum_entries: list[str] = []
+    type_lines: list[str] = []
+    type_entries: list[str] = []
+
+    for yasl in documents:
+        for namespace, yasl_item in (yasl.definitions or {}).items():
+            for enum_name, enum_def in (yasl_item.enums or {}).items():
+                enum_cls = registry.get_enum(enum_name, namespace)
+                ident = writer.identifier(namespace, enum_name)
+                writer.names[id(enum_cls)] = ident
+                values = writer.render_value(enum_def.values)
+                enum_lines.append(
+                    f"{ident} = yasl_enum({enum_name!r}, {values}, {namespace!r})"
+                )
+                enum_entries.append(f"    ({enum_name!r}, {namespace!r}, {ident}),")
+
+    for yasl in documents:
+        for namespace, yasl_item in (yasl.definitions or {}).items():
+            type_defs: dict[str, TypeDef] = yasl_item.types or {}
+            for typedef_name, type_def in type_defs.items():
+                model = registry.get_type(typedef_name, namespace)
+                ident = writer.identifier(namespace, typedef_name)
+                def_ident = writer.identifier(namespace, typedef_name, "def")
+                fields, _ = gen_type_fields(
+                    namespace, typedef_name, type_def, type_defs
+                )
+
+                type_def_data = writer.render_value(
+                    type_def.model_dump(exclude_defaults=True)
+                )
+                type_lines.append(
+                    f"{def_ident} = TypeDef.model_validate({type_def_data})"
+                )
+                type_lines.append(f"{ident} = create_model(")
+                type_lines.append(f"    {typedef_name!r},")
+                type_lines.append("    __base__=YASLBaseModel,")
+                type_lines.append(f"    __module__={namespace!r},")
+                type_lines.append("    __validators__={")
+                for prop_name in type_def.properties:
+                    type_lines.append(
+                        f"        {f'{prop_name}__validator'!r}: property_validator_factory("
+                        f"{typedef_name!r}, {namespace!r}, {def_ident}, {prop_name!r}, "
+                        f"{def_ident}.properties[{prop_name!r}]),"
+                    )
+                type_lines.append(
+                    f"        '__validate__': type_validator_factory({def_ident}),"
+                )
+                type_lines.append("    },")
+                type_lines.append("    __config__={'extra': 'forbid'},")
+                type_lines.append("    **{")
+                for field_name, (annotation, default) in fields.items():
+                    type_lines.append(
+                        f"        {field_name!r}: ({writer.render_type(annotation)}, "
+                        f"{writer.render_value(default)}),"
+                    )
+                type_lines.append("    },")
+                type_lines.append(")")
+                type_lines.append(
+                    f"register_compiled([], [({typedef_name!r}, {namespace!r}, {ident})])"
+                )
+                type_lines.append("")
+                writer.names[id(model)] = ident
+                type_entries.append(f"    ({typedef_name!r}, {namespace!r}, {ident}),")
+
+    lines = [_HEADER.format(source=source, version=advanced_yaml_version())]
+    lines.append("# --- Enumerations ---")
+    lines.extend(enum_lines)
+    lines.append("")
+    lines.append("ENUMS = [")
+    lines.extend(enum_entries)
+    lines.append("]")
+    lines.append("")
+    lines.append(
+        "# validator factories look up enums, and the types built before them, in"
+    )
+    lines.append("# the registry while types are built")
+    lines.append("register_compiled(ENUMS, [])")
+    lines.append("")
+    lines.append("# --- Types ---")
+    lines.extend(type_lines)
+    lines.append("TYPES = [")
+    lines.extend(type_entries)
+    lines.append("]")
+    lines.append("")
+    lines.append("")
+    lines.append("def register(registry=None):")
+    lines.append(
+        '    """Register the compiled enums and types in the YaslRegistry under their original namespaces."""'
+    )
+    lines.append("    register_compiled(ENUMS, TYPES, registry)")
+    lines.append("")
+    lines.append("")
+    lines.append("register()")
+    lines.append("")
+    return "\n".join(lines)
+
+
+@_in_own_context
+def compile_schema(yasl_schema: str, output_path: str) -> bool:
+    """
+    Compile a YASL schema into an importable Python module.
+
+    The schema is loaded into its own ValidationContext and rendered, as with
+    `yasl_eval`, so the caller's YaslRegistry is left untouched.
+
+    Args:
+        yasl_schema (str): Path to the YASL schema file or directory.
+        output_path (str): Path of the Python module to write.
+
+    Returns:
+        bool: True if the module was written, False otherwise.
+    """
+    log = logging.getLogger("yasl")
+
+    if Path(yasl_schema).is_dir():
+        yasl_files = sorted(Path(yasl_schema).rglob("*.yasl"))
+        if not yasl_files:
+            log.error(f"❌ No .yasl files found in directory '{yasl_schema}'")
+            return False
+    elif Path(yasl_schema).exists():
+        yasl_files = [Path(yasl_schema)]
+    else:
+        log.error(f"❌ YASL schema file '{yasl_schema}' not found")
+        return False
+
+    try:
+        loaded: list[tuple[str, YaslRoot]] = []
+        for yasl_file in yasl_files:
+            if _load_schema_file(yasl_file.as_posix(), loaded) is None:
+                log.error("❌ YASL schema validation failed. Exiting.")
+                return False
+        source = render_module([yasl for _, yasl in loaded], Path(yasl_schema).name)
+        Path(output_path).write_text(source)
+        log.info(f"✅ Compiled YASL schema '{yasl_schema}' to '{output_path}'")
+        return True
+    except Exception as e:
+        log.error(f"❌ Unable to compile YASL schema '{yasl_schema}' - {e}")
+        return False
@@ -1,27 +1,42 @@
 # validate_config_with_lines.py
+import functools
 import json
 import logging
 import os
 import sys
 import tomllib
 import traceback
-from collections.abc import Callable
-from enum import Enum
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
 from typing import Any, Optional, TextIO, cast
 
 from pydantic import (
     BaseModel,
-    Field,
     ValidationError,
     create_model,
 )
 from ruamel.yaml import YAML, YAMLError
 
-from yasl.cache import YaslRegistry
-from yasl.primitives import PRIMITIVE_TYPE_MAP
-from yasl.pydantic_types import Enumeration, TypeDef, YASLBaseModel, YaslRoot
+from yasl.cache import (
+    TypeDescriptor,
+    ValidationContext,
+    YaslRegistry,
+    _annotation_namespaces,
+)
+from yasl.locations import LineTable, collect_warnings, log_warnings
+from yasl.primitives import PRIMITIVE_TYPE_MAP, quantity_batch
+from yasl.pydantic_types import (
+    Enumeration,
+    TypeDef,
+    YASLBaseModel,
+    YaslRoot,
+    yasl_enum,
+)
+from yasl.reachability import UrlChecker
+from yasl.schema_cache import SchemaCache, resolve_cache_dir
+from yasl.state import FileRecord, ValidationState, schema_key
 from yasl.validators import property_validator_factory, type_validator_factory
 
 
@@ -96,6 +111,18 @@ def yasl_version() -> str:
         return "Unknown due to internal error reading pyproject.toml"
 
 
+def _in_own_context[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Run every call of `func` in a new, empty ValidationContext."""
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with ValidationContext():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@_in_own_context
 def yasl_eval(
     yasl_schema: str,
     yaml_data: str,
@@ -105,22 +132,38 @@ def yasl_eval(
     verbose_log: bool = False,
     output: str = "text",
     log_stream: StringIO | TextIO = sys.stdout,
+    cache_dir: str | None = None,
+    jobs: int = 1,
+    defer_refs: bool = False,
+    stream: bool = False,
+    fast: bool = False,
+    incremental: bool = False,
 ) -> list[BaseModel] | None:
     """
     Evaluate YAML data against a YASL schema.
 
+    Each call loads the schema into its own ValidationContext, so concurrent
+    calls in different threads do not interfere, and the process-wide
+    registry is left untouched.
+
     Args:
         yasl_schema (str): Path to the YASL schema file or directory.
         yaml_data (str): Path to the YAML data file or directory.
-        model_name (str, optional): Specific model name to use for validation. If not provided, the model will be auto-detected.
+        model_name (str, optional): Specific model name to use for validation. If not provided, the model will be auto-detected: the type with the fewest properties that covers every root key of a document is used.
         disable_log (bool): If True, disables all logging output.
         quiet_log (bool): If True, suppresses all output except for errors.
         verbose_log (bool): If True, enables verbose logging output.
         output (str): Output format for logs. Options are 'text', 'json', or 'yaml'. Default is 'text'.
         log_stream (StringIO): Stream to which logs will be written. Default is sys.stdout.
+        cache_dir (str, optional): Directory for the compiled-schema cache. Defaults to the YASL_CACHE_DIR environment variable; caching is disabled if neither is set.
+        jobs (int): Number of worker processes used to validate YAML data files. Default is 1, 0 uses one per CPU.
+        defer_refs (bool): If True, ref[...] values are checked in a second pass after all YAML data files are loaded, so the result does not depend on file order. Always enabled when validating in parallel.
+        stream (bool): If True, the documents of each YAML data file are validated one at a time and only the model of the last document is kept, so memory use does not grow with the size of the files.
+        fast (bool): If True, YAML data files are parsed with the C-accelerated safe loader, and only re-parsed with the round-trip loader to report the line numbers of errors and warnings.
+        incremental (bool): If True, a validation state database in the cache directory records every YAML data file that passes. Files unchanged since they last passed are not validated again; their unique values, references and URLs are taken from the database, and references are always checked across all files. Requires a cache directory.
 
     Returns:
-        Optional[List[BaseModel]]: List of validated Pydantic models if validation is successful, None otherwise.
+        Optional[List[BaseModel]]: List of validated Pydantic models of the last validated YAML data file if validation is successful, None otherwise. In an incremental run the list is empty if no file had to be validated.
     """
 
     setup_logging(
@@ -137,63 +180,238 @@ def yasl_eval(
 
     registry = YaslRegistry()
 
-    yasl_files = []
-    if Path(yasl_schema).is_dir():
-        for p in Path(yasl_schema).rglob("*.yasl"):
-            yasl_files.append(p)
-        if not yasl_files:
-            log.error(f"❌ No .yasl files found in directory '{yasl_schema}'")
-            registry.clear_caches()
-            return None
-        log.debug(f"Found {len(yasl_files)} .yasl files in directory '{yasl_schema}'")
-    else:
-        if not Path(yasl_schema).exists():
-            log.error(f"❌ YASL schema file '{yasl_schema}' not found")
-            registry.clear_caches()
-            return None
-        yasl_files.append(Path(yasl_schema))
-
-    yaml_files = []
-    if Path(yaml_data).is_dir():
-        for p in Path(yaml_data).rglob("*.yaml"):
-            yaml_files.append(p)
-        if not yaml_files:
-            log.error(f"❌ No .yaml files found in directory '{yaml_data}'")
-            registry.clear_caches()
-            return None
-        log.debug(f"Found {len(yaml_files)} .yaml files in directory '{yaml_data}'")
-    else:
-        if not Path(yaml_data).exists():
-            log.error(f"❌ YAML data file '{yaml_data}' not found")
-            registry.clear_caches()
-            return None
-        yaml_files.append(Path(yaml_data))
+    yasl_files = find_files(yasl_schema, ".yasl", "YASL schema", sort=False)
+    if yasl_files is None:
+        registry.clear_caches()
+        return None
+
+    yaml_files = find_files(yaml_data, ".yaml", "YAML data")
+    if yaml_files is None:
+        registry.clear_caches()
+        return None
 
     yasl_results = []
+    # schema files share their imports, each generated once
+    documents: list[tuple[str, YaslRoot]] = []
     for yasl_file in yasl_files:
-        yasl = load_schema_files(yasl_file)
+        yasl = _load_schema_files(str(yasl_file), cache_dir, documents)
         if yasl is None:
             log.error("❌ YASL schema validation failed. Exiting.")
             registry.clear_caches()
             return None
         yasl_results.extend(yasl)
+    yasl_documents = [yasl for _, yasl in documents]
 
     results = []
+    records: list[tuple[Path, FileRecord]] = []
+    registry.defer_url_checks = True
 
-    for yaml_file in yaml_files:
-        results = load_data_files(yaml_file, model_name)
-
-        if not results or len(results) == 0:
+    state = None
+    if incremental:
+        state_dir = resolve_cache_dir(cache_dir)
+        if state_dir is None:
             log.error(
-                f"❌ Validation failed. Unable to validate data in YAML file {yaml_file}."
+                "❌ Incremental validation requires a cache directory (--cache-dir or YASL_CACHE_DIR)"
             )
             registry.clear_caches()
             return None
+        state = ValidationState(
+            state_dir, schema_key(yasl_results, model_name, yasl_version())
+        )
+        yaml_files, current = state.partition(yaml_files)
+        for _, record in current:
+            registry.register_unique_values(record.unique_values)
+        records.extend(current)
+        log.info(
+            f"✅ {len(current)} unchanged YAML files passed before, validating {len(yaml_files)} YAML files"
+        )
+
+    try:
+        if jobs != 1 and len(yaml_files) > 1:
+            from yasl.parallel import validate_files_parallel
+
+            registry.defer_references = True
+            parallel_results = validate_files_parallel(
+                CompiledSchema(yasl_results, yasl_documents, registry),
+                yaml_files,
+                model_name,
+                jobs,
+                stream=stream,
+                fast=fast,
+            )
+            if parallel_results is None:
+                registry.clear_caches()
+                return None
+            results, validated = parallel_results
+            records.extend(validated)
+            if state is not None:
+                for yaml_file, record in validated:
+                    state.store(yaml_file, record)
+        else:
+            # references into unchanged files are checked against their stored values
+            registry.defer_references = defer_refs or state is not None
+            registry.record_unique_values = state is not None
+            for yaml_file in yaml_files:
+                results = validate_data_file(yaml_file, model_name, stream, fast)
+
+                if not results or len(results) == 0:
+                    log.error(
+                        f"❌ Validation failed. Unable to validate data in YAML file {yaml_file}."
+                    )
+                    registry.clear_caches()
+                    return None
+                record = FileRecord(
+                    registry.take_pending_unique_values(),
+                    registry.take_pending_references(),
+                    registry.take_pending_urls(),
+                )
+                records.append((yaml_file, record))
+                if state is not None:
+                    state.store(yaml_file, record)
+    finally:
+        if state is not None:
+            state.close()
+
+    references = [(yaml_file, record.references) for yaml_file, record in records]
+    urls = [(yaml_file, record.urls) for yaml_file, record in records]
+    if registry.defer_references and not check_references(references):
+        registry.clear_caches()
+        return None
+
+    if not check_urls_reachable(urls, cache_dir):
+        registry.clear_caches()
+        return None
 
     registry.clear_caches()
     return results
 
 
+def find_files(
+    path: str, suffix: str, label: str, sort: bool = True
+) -> list[Path] | None:
+    """
+    Find the files given by a schema or data argument: the file itself, or
+    every file with the suffix below a directory.
+
+    Args:
+        path (str): A file or directory.
+        suffix (str): The suffix of the files to find in a directory, e.g. '.yaml'.
+        label (str): What the files are, for error messages, e.g. 'YAML data'.
+        sort (bool): If True, files found in a directory are sorted.
+
+    Returns:
+        list[Path] | None: The files, or None if there are none.
+    """
+    log = logging.getLogger("yasl")
+    if Path(path).is_dir():
+        files = list(Path(path).rglob(f"*{suffix}"))
+        if not files:
+            log.error(f"❌ No {suffix} files found in directory '{path}'")
+            return None
+        if sort:
+            # comparing parts once per file is much cheaper than Path.__lt__
+            files.sort(key=lambda p: p.parts)
+        log.debug(f"Found {len(files)} {suffix} files in directory '{path}'")
+        return files
+    if not Path(path).exists():
+        log.error(f"❌ {label} file '{path}' not found")
+        return None
+    return [Path(path)]
+
+
+def validate_data_file(
+    path: str | Path,
+    model_name: str | None = None,
+    stream: bool = False,
+    fast: bool = False,
+) -> list[BaseModel] | None:
+    """
+    Validate a YAML data file, optionally streaming its documents.
+
+    Args:
+        path (str | Path): The file path to the YAML data file.
+        model_name (str | None): The name of the schema to validate against.
+        stream (bool): If True, documents are validated one at a time with
+            `iter_data_files` and only the model of the last one is kept.
+        fast (bool): If True, parse with the C-accelerated safe loader.
+
+    Returns:
+        list[BaseModel] | None: The validated models, or only the last one if
+        streaming, or None if validation fails.
+    """
+    if not stream:
+        return load_data_files(str(path), model_name, fast)
+    last = None
+    for result in iter_data_files(str(path), model_name, fast):
+        if result is None:
+            return None
+        last = result
+    return [last] if last is not None else None
+
+
+def check_references(references: list[tuple[Path, dict[str, set]]]) -> bool:
+    """
+    Check the ref[...] values collected from YAML data files in one pass, after
+    the unique values of all files have been registered.
+
+    Args:
+        references (list[tuple[Path, dict[str, set]]]): The referenced values of
+            each data file, keyed by ref target, in file order.
+
+    Returns:
+        bool: True if every referenced value exists, False otherwise.
+    """
+    log = logging.getLogger("yasl")
+    registry = YaslRegistry()
+    valid = True
+    for yaml_file, file_references in references:
+        try:
+            missing = registry.find_missing_references(file_references)
+        except ValueError as e:
+            log.error(f"❌ {e} in '{yaml_file}'")
+            valid = False
+            continue
+        for target, values in missing.items():
+            for value in sorted(values, key=str):
+                log.error(
+                    f"❌ Referenced value '{value}' does not exist for 'ref[{target}]' in '{yaml_file}'"
+                )
+            valid = False
+    if valid:
+        log.debug(f"Checked references of {len(references)} YAML data files")
+    return valid
+
+
+def check_urls_reachable(
+    urls: list[tuple[Path, set[str]]], cache_dir: str | None = None
+) -> bool:
+    """
+    Check the url_reachable values collected from YAML data files in one
+    concurrent batch, checking each distinct URL once.
+
+    Args:
+        urls (list[tuple[Path, set[str]]]): The URLs of each data file, in file order.
+        cache_dir (str, optional): Directory for the URL result cache. Defaults to the YASL_CACHE_DIR environment variable.
+
+    Returns:
+        bool: True if every URL is reachable, False otherwise.
+    """
+    all_urls = set().union(*(file_urls for _, file_urls in urls))
+    if not all_urls:
+        return True
+    log = logging.getLogger("yasl")
+    errors = UrlChecker(resolve_cache_dir(cache_dir)).check(all_urls)
+    valid = True
+    for yaml_file, file_urls in urls:
+        for url in sorted(file_urls):
+            if errors[url] is not None:
+                log.error(f"❌ {errors[url]} in '{yaml_file}'")
+                valid = False
+    if valid:
+        log.debug(f"Checked {len(all_urls)} URLs for reachability")
+    return valid
+
+
 def gen_enum_from_enumerations(namespace: str, enum_defs: dict[str, Enumeration]):
     """
     Dynamically generate a Python Enum class from an Enumeration instance.
@@ -203,328 +421,442 @@ def gen_enum_from_enumerations(namespace: str, enum_defs: dict[str, Enumeration]
     for enum_name, enum_def in enum_defs.items():
         if registry.get_enum(enum_name, namespace) is not None:
             raise ValueError(f"Enumeration '{namespace}.{enum_name}' already exists.")
-        enum_members = {value: value for value in enum_def.values}
-        enum_cls = Enum(enum_name, enum_members)
-        enum_cls.__module__ = namespace
+        enum_cls = yasl_enum(enum_name, enum_def.values, namespace)
         registry.register_enum(enum_name, enum_cls, namespace)
 
 
-def gen_pydantic_type_models(namespace: str, type_defs: dict[str, TypeDef]):
-    """
-    Dynamically generate Pydantic model classes from a list of TypeDef instances.
-    Each property in the TypeDef becomes a field in the generated model.
+def gen_type_fields(
+    namespace: str,
+    typedef_name: str,
+    type_def: TypeDef,
+    type_defs: dict[str, TypeDef],
+    lookup_type: Callable[..., Any] | None = None,
+    with_validators: bool = True,
+) -> tuple[dict[str, tuple], dict[str, Callable]]:
     """
-    registry = YaslRegistry()
-    for typedef_name, type_def in type_defs.items():
-        if registry.get_type(typedef_name, namespace) is not None:
-            raise ValueError(
-                f"Type definition '{namespace}.{typedef_name}' already exists."
-            )
-        fields: dict[str, tuple] = {}
-        validators: dict[str, Callable] = {}
-        for prop_name, prop in type_def.properties.items():
-            # Determine type annotation for the property
-            # For now, map basic types; extend as needed for complex types
-            type_map = PRIMITIVE_TYPE_MAP
-            type_lookup = prop.type
-            type_lookup_namespace = None
-            is_list = False
-            is_map = False
-            key = None
-            if type_lookup.endswith("[]"):
-                type_lookup = prop.type[:-2]
-                is_list = True
-
-            if (
-                "ref[" not in type_lookup
-                and "map[" not in type_lookup
-                and "." in type_lookup
-            ):
-                # likely a ref to another type or enum
-                parts = type_lookup.split(".")
-                type_lookup = parts[-1]
-                type_lookup_namespace = ".".join(parts[:-1])
+    Resolve the Pydantic field definitions and validators for a single TypeDef.
+    Referenced enums and types must already be registered in the YaslRegistry.
 
-            # Prepare to wrap type with Annotated for ReferenceMarker if it's a ref[...]
-
-            if type_lookup.startswith("ref[") and type_lookup.endswith("]"):
-                from yasl.primitives import ReferenceMarker
-
-                ref_target = type_lookup[4:-1]
+    Args:
+        lookup_type (Callable[..., Any] | None): Resolves referenced types,
+            with the arguments of `YaslRegistry.get_type`; the registry's
+            `get_type` if not given.
+        with_validators (bool): If False, only the fields are resolved and no
+            validators are built.
 
-                # Parse the target to find the underlying primitive type
-                if "." not in ref_target:
-                    raise ValueError(
-                        f"Reference '{ref_target}' for property '{prop_name}' must be in the format TypeName.PropertyName or Namespace.TypeName.PropertyName"
-                    )
-                ref_type_name, property_name = ref_target.rsplit(".", 1)
-                ref_type_namespace = None
-                if "." in ref_type_name:
-                    ref_type_namespace, ref_type_name = ref_type_name.rsplit(".", 1)
-
-                # We need to temporarily resolve the target type to get the underlying primitive type
-                # For now, we will assume it resolves to a primitive type eventually.
-                # In the original code, it was resolving and checking immediately.
-                # We should keep that logic to determine 'py_type'
-
-                target_type = registry.get_type(
-                    ref_type_name, ref_type_namespace, namespace
+    Returns:
+        tuple[dict[str, tuple], dict[str, Callable]]: The (annotation, default) field
+        definitions and the validators, keyed as expected by `create_model`.
+    """
+    registry = YaslRegistry()
+    lookup_type = lookup_type or registry.get_type
+    fields: dict[str, tuple] = {}
+    validators: dict[str, Callable] = {}
+    for prop_name, prop in type_def.properties.items():
+        # Determine type annotation for the property
+        # For now, map basic types; extend as needed for complex types
+        type_map = PRIMITIVE_TYPE_MAP
+        type_lookup = prop.type
+        type_lookup_namespace = None
+        is_list = False
+        is_map = False
+        key = None
+        if type_lookup.endswith("[]"):
+            type_lookup = prop.type[:-2]
+            is_list = True
+
+        if (
+            "ref[" not in type_lookup
+            and "map[" not in type_lookup
+            and "." in type_lookup
+        ):
+            # likely a ref to another type or enum
+            parts = type_lookup.split(".")
+            type_lookup = parts[-1]
+            type_lookup_namespace = ".".join(parts[:-1])
+
+        # Prepare to wrap type with Annotated for ReferenceMarker if it's a ref[...]
+
+        if type_lookup.startswith("ref[") and type_lookup.endswith("]"):
+            from yasl.primitives import ReferenceMarker
+
+            ref_target = type_lookup[4:-1]
+
+            # Parse the target to find the underlying primitive type
+            if "." not in ref_target:
+                raise ValueError(
+                    f"Reference '{ref_target}' for property '{prop_name}' must be in the format TypeName.PropertyName or Namespace.TypeName.PropertyName"
+                )
+            ref_type_name, property_name = ref_target.rsplit(".", 1)
+            ref_type_namespace = None
+            if "." in ref_type_name:
+                ref_type_namespace, ref_type_name = ref_type_name.rsplit(".", 1)
+
+            # We need to temporarily resolve the target type to get the underlying primitive type
+            # For now, we will assume it resolves to a primitive type eventually.
+            # In the original code, it was resolving and checking immediately.
+            # We should keep that logic to determine 'py_type'
+
+            target_type = lookup_type(ref_type_name, ref_type_namespace, namespace)
+            if not target_type:
+                raise ValueError(
+                    f"Referenced type '{ref_type_name}' for property '{prop_name}' not found in type definitions"
                 )
-                if not target_type:
+            else:
+                target_prop = next(
+                    (
+                        p
+                        for p_name, p in type_defs[ref_type_name].properties.items()
+                        if p_name == property_name
+                    ),
+                    None,
+                )
+                if not target_prop:
                     raise ValueError(
-                        f"Referenced type '{ref_type_name}' for property '{prop_name}' not found in type definitions"
+                        f"Referenced property '{property_name}' in type '{ref_type_name}' not found for property '{prop_name}'"
                     )
                 else:
-                    target_prop = next(
-                        (
-                            p
-                            for p_name, p in type_defs[
-                                target_type.__name__
-                            ].properties.items()
-                            if p_name == property_name
-                        ),
-                        None,
-                    )
-                    if not target_prop:
+                    if not target_prop.unique:
                         raise ValueError(
-                            f"Referenced property '{property_name}' in type '{ref_type_name}' not found for property '{prop_name}'"
+                            f"Referenced property '{ref_type_name}.{property_name}' must be unique to be used as a reference for property '{typedef_name}.{prop_name}'"
+                        )
+                    elif target_prop.type not in type_map:
+                        raise ValueError(
+                            f"Referenced property '{ref_type_name}.{property_name}' must be a primitive type to be used as a reference for property '{typedef_name}.{prop_name}'"
                         )
                     else:
-                        if not target_prop.unique:
-                            raise ValueError(
-                                f"Referenced property '{ref_type_name}.{property_name}' must be unique to be used as a reference for property '{typedef_name}.{prop_name}'"
-                            )
-                        elif target_prop.type not in type_map:
-                            raise ValueError(
-                                f"Referenced property '{ref_type_name}.{property_name}' must be a primitive type to be used as a reference for property '{typedef_name}.{prop_name}'"
-                            )
-                        else:
-                            py_type = type_map[target_prop.type]
-                            # We found the type, now we mark it has handled so it skips the other checks
-                            # But wait, the original logic had 'elif type_lookup.startswith("ref[")'
-                            # So we should probably restructure this loop to be cleaner or just hook into that block.
+                        py_type = type_map[target_prop.type]
+                        # We found the type, now we mark it has handled so it skips the other checks
+                        # But wait, the original logic had 'elif type_lookup.startswith("ref[")'
+                        # So we should probably restructure this loop to be cleaner or just hook into that block.
+
+        # Re-evaluating structure to avoid massive rewrite.
+        # I will modify the existing block for ref handling to wrap the result in Annotated.
+
+        if type_lookup in type_map:
+            py_type = type_map[type_lookup]
+        elif (
+            registry.get_enum(type_lookup, type_lookup_namespace, namespace) is not None
+        ):
+            py_type = registry.get_enum(type_lookup, type_lookup_namespace, namespace)
+        elif lookup_type(type_lookup, type_lookup_namespace, namespace) is not None:
+            py_type = lookup_type(type_lookup, type_lookup_namespace, namespace)
+        elif type_lookup.startswith("map[") and type_lookup.endswith("]"):
+            is_map = True
+            key, value = type_lookup[4:-1].split(",", 1)
+
+            key_type_lookup = key.strip()
+            key_type_lookup_namespace = None
+            if "." in key_type_lookup:
+                key_type_lookup_namespace, key_type_lookup = key_type_lookup.rsplit(
+                    ".", 1
+                )
+            # make sure map key is a known type
+
+            if key in ["str", "string"]:
+                key = str
+            elif key == "int":
+                key = int
+            elif (
+                registry.get_enum(key_type_lookup, key_type_lookup_namespace, namespace)
+                is not None
+            ):
+                key = registry.get_enum(
+                    key_type_lookup, key_type_lookup_namespace, namespace
+                )
+            else:
+                acceptable_keys = [
+                    "str",
+                    "string",
+                    "int",
+                ] + registry.get_enums()
+                raise ValueError(
+                    f"Map key type '{key}' for property '{prop_name}' must be one of {acceptable_keys}."
+                )
+
+            value_type_lookup = value.strip()
+            value_type_lookup_namespace = None
+            # if map value is a list, handle that
+            map_value_is_list = False
 
-            # Re-evaluating structure to avoid massive rewrite.
-            # I will modify the existing block for ref handling to wrap the result in Annotated.
+            if value_type_lookup.endswith("[]"):
+                value_type_lookup = value_type_lookup[:-2]
+                map_value_is_list = True
 
-            if type_lookup in type_map:
-                py_type = type_map[type_lookup]
+            # make sure map value is a known type
+            if "." in value_type_lookup:
+                value_type_lookup_namespace, value_type_lookup = (
+                    value_type_lookup.rsplit(".", 1)
+                )
+            if value_type_lookup in type_map:
+                py_type = type_map[value_type_lookup]
             elif (
-                registry.get_enum(type_lookup, type_lookup_namespace, namespace)
+                registry.get_enum(
+                    value_type_lookup, value_type_lookup_namespace, namespace
+                )
                 is not None
             ):
                 py_type = registry.get_enum(
-                    type_lookup, type_lookup_namespace, namespace
+                    value_type_lookup, value_type_lookup_namespace, namespace
                 )
             elif (
-                registry.get_type(type_lookup, type_lookup_namespace, namespace)
+                lookup_type(value_type_lookup, value_type_lookup_namespace, namespace)
                 is not None
             ):
-                py_type = registry.get_type(
-                    type_lookup, type_lookup_namespace, namespace
+                py_type = lookup_type(
+                    value_type_lookup, value_type_lookup_namespace, namespace
+                )
+            else:
+                raise ValueError(
+                    f"Unknown map value type '{value_type_lookup}' for property '{prop_name}'"
                 )
-            elif type_lookup.startswith("map[") and type_lookup.endswith("]"):
-                is_map = True
-                key, value = type_lookup[4:-1].split(",", 1)
-
-                key_type_lookup = key.strip()
-                key_type_lookup_namespace = None
-                if "." in key_type_lookup:
-                    key_type_lookup_namespace, key_type_lookup = key_type_lookup.rsplit(
-                        ".", 1
-                    )
-                # make sure map key is a known type
-
-                if key in ["str", "string"]:
-                    key = str
-                elif key == "int":
-                    key = int
-                elif (
-                    registry.get_enum(
-                        key_type_lookup, key_type_lookup_namespace, namespace
-                    )
-                    is not None
-                ):
-                    key = registry.get_enum(
-                        key_type_lookup, key_type_lookup_namespace, namespace
-                    )
-                else:
-                    acceptable_keys = [
-                        "str",
-                        "string",
-                        "int",
-                    ] + registry.get_enums()
-                    raise ValueError(
-                        f"Map key type '{key}' for property '{prop_name}' must be one of {acceptable_keys}."
-                    )
-
-                value_type_lookup = value.strip()
-                value_type_lookup_namespace = None
-                # if map value is a list, handle that
-                map_value_is_list = False
-
-                if value_type_lookup.endswith("[]"):
-                    value_type_lookup = value_type_lookup[:-2]
-                    map_value_is_list = True
-
-                # make sure map value is a known type
-                if "." in value_type_lookup:
-                    value_type_lookup_namespace, value_type_lookup = (
-                        value_type_lookup.rsplit(".", 1)
-                    )
-                if value_type_lookup in type_map:
-                    py_type = type_map[value_type_lookup]
-                elif (
-                    registry.get_enum(
-                        value_type_lookup, value_type_lookup_namespace, namespace
-                    )
-                    is not None
-                ):
-                    py_type = registry.get_enum(
-                        value_type_lookup, value_type_lookup_namespace, namespace
-                    )
-                elif (
-                    registry.get_type(
-                        value_type_lookup, value_type_lookup_namespace, namespace
-                    )
-                    is not None
-                ):
-                    py_type = registry.get_type(
-                        value_type_lookup, value_type_lookup_namespace, namespace
-                    )
-                else:
-                    raise ValueError(
-                        f"Unknown map value type '{value_type_lookup}' for property '{prop_name}'"
-                    )
 
-                # wrap in list if needed
-                if map_value_is_list:
-                    py_type = list[py_type]
-            elif type_lookup.startswith("ref[") and type_lookup.endswith("]"):
-                from typing import Annotated
+            # wrap in list if needed
+            if map_value_is_list:
+                py_type = quantity_batch(list[py_type])
+        elif type_lookup.startswith("ref[") and type_lookup.endswith("]"):
+            from typing import Annotated
 
-                from yasl.primitives import ReferenceMarker
+            from yasl.primitives import ReferenceMarker
 
-                ref_target = type_lookup[4:-1]
-                if "." not in ref_target:
-                    raise ValueError(
-                        f"Reference '{ref_target}' for property '{prop_name}' must be in the format TypeName.PropertyName or Namespace.TypeName.PropertyName"
-                    )
-                ref_type_name, property_name = ref_target.rsplit(".", 1)
-                ref_type_namespace = None
-                if "." in ref_type_name:
-                    ref_type_namespace, ref_type_name = ref_type_name.rsplit(".", 1)
-                target_type = registry.get_type(
-                    ref_type_name, ref_type_namespace, namespace
+            ref_target = type_lookup[4:-1]
+            if "." not in ref_target:
+                raise ValueError(
+                    f"Reference '{ref_target}' for property '{prop_name}' must be in the format TypeName.PropertyName or Namespace.TypeName.PropertyName"
+                )
+            ref_type_name, property_name = ref_target.rsplit(".", 1)
+            ref_type_namespace = None
+            if "." in ref_type_name:
+                ref_type_namespace, ref_type_name = ref_type_name.rsplit(".", 1)
+            target_type = lookup_type(ref_type_name, ref_type_namespace, namespace)
+            if not target_type:
+                raise ValueError(
+                    f"Referenced type '{ref_type_name}' for property '{prop_name}' not found in type definitions"
+                )
+            else:
+                target_prop = next(
+                    (
+                        p
+                        for p_name, p in type_defs[ref_type_name].properties.items()
+                        if p_name == property_name
+                    ),
+                    None,
                 )
-                if not target_type:
+                if not target_prop:
                     raise ValueError(
-                        f"Referenced type '{ref_type_name}' for property '{prop_name}' not found in type definitions"
+                        f"Referenced property '{property_name}' in type '{ref_type_name}' not found for property '{prop_name}'"
                     )
                 else:
-                    target_prop = next(
-                        (
-                            p
-                            for p_name, p in type_defs[
-                                target_type.__name__
-                            ].properties.items()
-                            if p_name == property_name
-                        ),
-                        None,
-                    )
-                    if not target_prop:
+                    if not target_prop.unique:
+                        raise ValueError(
+                            f"Referenced property '{ref_type_name}.{property_name}' must be unique to be used as a reference for property '{typedef_name}.{prop_name}'"
+                        )
+                    elif target_prop.type not in type_map:
                         raise ValueError(
-                            f"Referenced property '{property_name}' in type '{ref_type_name}' not found for property '{prop_name}'"
+                            f"Referenced property '{ref_type_name}.{property_name}' must be a primitive type to be used as a reference for property '{typedef_name}.{prop_name}'"
                         )
                     else:
-                        if not target_prop.unique:
-                            raise ValueError(
-                                f"Referenced property '{ref_type_name}.{property_name}' must be unique to be used as a reference for property '{typedef_name}.{prop_name}'"
-                            )
-                        elif target_prop.type not in type_map:
-                            raise ValueError(
-                                f"Referenced property '{ref_type_name}.{property_name}' must be a primitive type to be used as a reference for property '{typedef_name}.{prop_name}'"
-                            )
-                        else:
-                            base_type = type_map[target_prop.type]
-                            # Wrap the base type with Annotated and ReferenceMarker
-                            py_type = Annotated[base_type, ReferenceMarker(ref_target)]
-            else:
-                raise ValueError(
-                    f"Unknown type '{prop.type}' for property '{prop_name}'"
-                )
+                        base_type = type_map[target_prop.type]
+                        # Wrap the base type with Annotated and ReferenceMarker
+                        py_type = Annotated[base_type, ReferenceMarker(ref_target)]
+        else:
+            raise ValueError(f"Unknown type '{prop.type}' for property '{prop_name}'")
 
-            if is_list and is_map:
-                raise ValueError(
-                    f"Property '{prop_name}' cannot be both a list and a map"
-                )
+        if is_list and is_map:
+            raise ValueError(f"Property '{prop_name}' cannot be both a list and a map")
 
-            if is_list:
-                py_type = list[py_type]
+        if is_list:
+            py_type = quantity_batch(list[py_type])
 
-            if is_map:
-                py_type = dict[key, py_type]
+        if is_map:
+            py_type = quantity_batch(dict[key, py_type])
 
-            # Handle presence
+        # Handle presence
+        is_required = False
+        if prop.presence == "required":
+            is_required = True
+        elif prop.presence == "preferred":
+            is_required = False
+        elif prop.presence == "optional":
+            is_required = False
+        else:
+            # Default to optional if None (though default is "optional" in model)
             is_required = False
-            if prop.presence == "required":
-                is_required = True
-            elif prop.presence == "preferred":
-                is_required = False
-            elif prop.presence == "optional":
-                is_required = False
-            else:
-                # Default to optional if None (though default is "optional" in model)
-                is_required = False
 
-            if not is_required:
-                py_type = Optional[py_type]
+        if not is_required:
+            py_type = Optional[py_type]
 
-            default = (
-                prop.default
-                if prop.default is not None
-                else (None if not is_required else ...)
-            )
-            fields[prop_name] = (py_type, default)
+        default = (
+            prop.default
+            if prop.default is not None
+            else (None if not is_required else ...)
+        )
+        fields[prop_name] = (py_type, default)
+        if with_validators:
             validators[f"{prop_name}__validator"] = property_validator_factory(
-                typedef_name, namespace, type_def, prop_name, prop
+                typedef_name, namespace, type_def, prop_name, prop, lookup_type
             )
 
-        # Add hidden field for YAML line number
-        fields["yaml_line"] = (Optional[int], Field(default=None, exclude=True))
-
+    if with_validators:
         validators["__validate__"] = type_validator_factory(type_def)
-        model = create_model(  # type: ignore
-            typedef_name,
-            __base__=YASLBaseModel,
-            __module__=namespace,
-            __validators__=validators,
-            __config__={"extra": "forbid"},
-            **fields,  # type: ignore
+    return fields, validators
+
+
+def gen_pydantic_type_models(namespace: str, type_defs: dict[str, TypeDef]):
+    """
+    Register the types of a namespace, generating the Pydantic model of each
+    type only when it, or a type using it, is first looked up.
+    Each property in the TypeDef becomes a field in the generated model.
+
+    The fields are resolved right away, so an invalid schema still fails here.
+    """
+    registry = YaslRegistry()
+    for typedef_name, type_def in type_defs.items():
+        if registry.find_type(typedef_name, namespace) is not None:
+            raise ValueError(
+                f"Type definition '{namespace}.{typedef_name}' already exists."
+            )
+        registry.register_type_descriptor(
+            TypeDescriptor(
+                typedef_name,
+                namespace,
+                list(type_def.properties),
+                _type_uses(namespace, typedef_name, type_def, type_defs),
+                functools.partial(
+                    gen_pydantic_type_model,
+                    namespace,
+                    typedef_name,
+                    type_def,
+                    type_defs,
+                ),
+            )
+        )
+
+
+def _type_uses(
+    namespace: str, typedef_name: str, type_def: TypeDef, type_defs: dict[str, TypeDef]
+) -> set[str | None]:
+    """
+    Resolve the fields of a TypeDef without generating the models it uses or
+    building its validators, returning the namespaces of the types and enums
+    its fields and any_of constraints refer to.
+    """
+    registry = YaslRegistry()
+    uses: set[str | None] = set()
+
+    def lookup_type(
+        name: str,
+        type_namespace: str | None = None,
+        default_namespace: str | None = None,
+    ) -> Any:
+        key = registry.find_type(name, type_namespace, default_namespace)
+        if key is None:
+            return None
+        uses.add(key[1])
+        # stands in for the model, which is generated later
+        return Any
+
+    fields, _ = gen_type_fields(
+        namespace, typedef_name, type_def, type_defs, lookup_type, False
+    )
+    for annotation, _ in fields.values():
+        uses |= _annotation_namespaces(annotation)
+    for prop in type_def.properties.values():
+        for name in prop.any_of or []:
+            type_name = name.removesuffix("[]")
+            if type_name in PRIMITIVE_TYPE_MAP or type_name in ("list", "dict"):
+                continue
+            if type_name.startswith("map[") and type_name.endswith("]"):
+                continue
+            type_namespace = None
+            if "." in type_name:
+                type_namespace, type_name = type_name.rsplit(".", 1)
+            enum_type = registry.get_enum(type_name, type_namespace, namespace)
+            if enum_type is not None:
+                uses.add(enum_type.__module__)
+            elif lookup_type(type_name, type_namespace, namespace) is None:
+                raise ValueError(f"Unknown type '{name}' in any_of {prop.any_of}")
+    return uses
+
+
+def gen_pydantic_type_model(
+    namespace: str, typedef_name: str, type_def: TypeDef, type_defs: dict[str, TypeDef]
+) -> BaseModel:
+    """
+    Generate the Pydantic model class of a single TypeDef.
+    Each property in the TypeDef becomes a field in the generated model.
+    """
+    fields, validators = gen_type_fields(namespace, typedef_name, type_def, type_defs)
+    return create_model(  # type: ignore
+        typedef_name,
+        __base__=YASLBaseModel,
+        __module__=namespace,
+        __validators__=validators,
+        __config__={"extra": "forbid"},
+        **fields,  # type: ignore
+    )
+
+
+def gen_definitions(yasl: YaslRoot) -> None:
+    """
+    Generate and register the enumerations and Pydantic models defined in a YASL document.
+    Imports are not followed; they must already have been loaded.
+    """
+    log = logging.getLogger("yasl")
+    if yasl.metadata is not None:
+        log.debug(f"YASL Metadata: {yasl.metadata}")
+    if yasl.definitions is not None:
+        for namespace, yasl_item in yasl.definitions.items():
+            # generate enums first so enum map keys are known when generating types
+            if yasl_item.enums is not None:
+                gen_enum_from_enumerations(namespace, yasl_item.enums)
+        for namespace, yasl_item in yasl.definitions.items():
+            if yasl_item.types is not None:
+                gen_pydantic_type_models(namespace, yasl_item.types)
+
+
+def yaml_loader(fast: bool = True) -> YAML:
+    """
+    Return a YAML loader for YASL schema and data files.
+
+    Args:
+        fast (bool): If True, return the safe loader, which uses the C-accelerated
+            libyaml parser when it is available but keeps no line information.
+            Otherwise return the round-trip loader, which records the line and
+            column of every node.
+
+    Returns:
+        YAML: The loader.
+    """
+    return YAML(typ="safe" if fast else "rt")
+
+
+def _reload_document(path: str, index: int) -> Any:
+    """
+    Parse a file again with the round-trip loader and return its document at
+    `index`, for the line numbers of an error found with the fast loader.
+    """
+    try:
+        with open(path) as f:
+            for i, data in enumerate(yaml_loader(fast=False).load_all(f)):
+                if i == index:
+                    return data
+    except Exception as e:
+        logging.getLogger("yasl").debug(
+            f"Unable to re-parse '{path}' for line numbers - {e}"
         )
-        # Store the generated model in the global registry
-        registry.register_type(typedef_name, model, namespace)
+    return None
+
+
+def _line_table(data: Any, path: str, index: int, fast: bool) -> LineTable:
+    """Return the line table of document `index` of a file, re-parsing it if needed."""
+    return LineTable(_reload_document(path, index) if fast else data)
 
 
 # --- Helper function to find the line number ---
 def get_line_for_error(data: Any, loc: tuple[str | int, ...]) -> int | None:
-    """Traverse the ruamel.yaml data to find the line number for an error location."""
-    current_data = data
-    try:
-        for key in loc:
-            current_data = current_data[key]
-        # .lc is the line/column accessor in ruamel.yaml
-        return current_data.lc.line + 1
-    except (KeyError, IndexError, AttributeError):
-        # Fallback if we can't find the exact key (e.g., for a missing key)
-        # We can try to get the line of the parent object.
-        parent_data = data
-        for key in loc[:-1]:
-            parent_data = parent_data[key]
-        try:
-            return parent_data.lc.line + 1
-        except AttributeError:
-            return None
+    """Find the line number of an error location in ruamel.yaml round-trip data."""
+    return LineTable(data).line(loc)
 
 
 def load_schema(data: dict[str, Any]) -> YaslRoot:
@@ -558,21 +890,89 @@ def load_schema(data: dict[str, Any]) -> YaslRoot:
         raise ValueError(
             "YASL import not supported when processing from data dictionary."
         )
-    if yasl.metadata is not None:
-        log.debug(f"YASL Metadata: {yasl.metadata}")
-    if yasl.definitions is not None:
-        for namespace, yasl_item in yasl.definitions.items():
-            # generate enums first so enum map keys are known when generating types
-            if yasl_item.enums is not None:
-                gen_enum_from_enumerations(namespace, yasl_item.enums)
-        for namespace, yasl_item in yasl.definitions.items():
-            if yasl_item.types is not None:
-                gen_pydantic_type_models(namespace, yasl_item.types)
+    gen_definitions(yasl)
     return yasl
 
 
 # --- Main schema validation logic ---
-def load_schema_files(path: str) -> list[YaslRoot] | None:
+class CompiledSchema(list[YaslRoot]):
+    """
+    The YASL schema documents returned by `load_schema_files`, together with
+    the registry holding the types and enums generated from them.
+
+    The types stay registered after validation runs, so the schema can be
+    validated against many times: `validate` and `validate_data` run in a
+    fresh `ValidationContext` from `run()`, with their own unique values and
+    references, and may be called from several threads at once.
+
+    A CompiledSchema can be pickled, e.g. to send it to worker processes.
+    Unpickling it generates the types again from the validated documents
+    into a new registry, without reading or validating any YASL.
+
+    Args:
+        results (Iterable[YaslRoot]): The documents of the loaded file.
+        documents (Iterable[YaslRoot]): Every generated document, including
+            imported ones, in generation order.
+        registry (YaslRegistry): The registry the documents were generated into.
+    """
+
+    def __init__(
+        self,
+        results: Iterable[YaslRoot],
+        documents: Iterable[YaslRoot],
+        registry: YaslRegistry,
+    ):
+        super().__init__(results)
+        self.documents = list(documents)
+        self.registry = registry
+
+    def run(self) -> ValidationContext:
+        """Return a context for one validation run against this schema."""
+        return ValidationContext(self.registry.fork())
+
+    def validate(
+        self, path: str, model_name: str | None = None, fast: bool = False
+    ) -> Any:
+        """
+        Validate a YAML data file in a new run, as `load_data_files` does.
+
+        Returns:
+            Any: The validated models of the file's documents, or None if
+            validation fails.
+        """
+        with self.run():
+            return load_data_files(path, model_name, fast)
+
+    def validate_data(
+        self,
+        yaml_data: dict[str, Any],
+        schema_name: str,
+        schema_namespace: str | None = None,
+    ) -> Any:
+        """
+        Validate a dictionary of data in a new run, as `load_data` does.
+
+        Returns:
+            Any: The validated model, or None if validation fails.
+        """
+        with self.run():
+            return load_data(yaml_data, schema_name, schema_namespace)
+
+    def __reduce__(self) -> Any:
+        return (_rebuild_compiled_schema, (list(self), self.documents))
+
+
+def _rebuild_compiled_schema(
+    results: list[YaslRoot], documents: list[YaslRoot]
+) -> CompiledSchema:
+    context = ValidationContext()
+    with context:
+        for yasl in documents:
+            gen_definitions(yasl)
+    return CompiledSchema(results, documents, context.registry)
+
+
+def load_schema_files(path: str, cache_dir: str | None = None) -> CompiledSchema | None:
     """
     Load and validate YASL schema(s) from a file.
 
@@ -581,61 +981,266 @@ def load_schema_files(path: str) -> list[YaslRoot] | None:
     For each valid schema, it generates the corresponding Python Enums and Pydantic models
     and registers them in the YaslRegistry.
 
+    When a cache directory is configured, the validated schema documents of the file and
+    its import closure are stored on disk.  Later loads of an unchanged closure skip YAML
+    parsing and YaslRoot validation and only regenerate the models.
+
     Args:
         path (str): The file path to the YASL schema file.
+        cache_dir (str | None): Directory for the compiled-schema cache. If None, the
+            YASL_CACHE_DIR environment variable is used, and caching is disabled if
+            that is not set either.
 
     Returns:
-        list[YaslRoot] | None: A list of validated YaslRoot objects if successful,
-        or None if validation fails or the file cannot be read.
+        CompiledSchema | None: The validated YaslRoot objects of the file, which
+        can be validated against repeatedly, or None if validation fails or the
+        file cannot be read.
 
     Raises:
         The function catches most exceptions (FileNotFoundError, YAMLError, ValidationError)
         and logs them as errors, returning None.
     """
+    return _load_schema_files(path, cache_dir, [])
+
+
+def _load_schema_files(
+    path: str, cache_dir: str | None, documents: list[tuple[str, YaslRoot]]
+) -> CompiledSchema | None:
+    """
+    Load a YASL schema file as `load_schema_files` does, skipping the files
+    already in `documents` and appending every newly generated document to it,
+    so several root files can share their imports.
+    """
+    log = logging.getLogger("yasl")
+    resolved_cache_dir = resolve_cache_dir(cache_dir)
+    cache = SchemaCache(resolved_cache_dir) if resolved_cache_dir else None
+    registry = YaslRegistry()
+    root = Path(path).resolve().as_posix()
+    loaded = {file_path for file_path, _ in documents}
+
+    if cache is not None and root not in loaded:
+        cached = cache.load(path)
+        if cached is not None:
+            log.debug(f"--- Loading schema '{path}' from cache ---")
+            namespaces = registry.get_namespaces()
+            try:
+                for file_path, yasl in cached:
+                    if file_path not in loaded:
+                        gen_definitions(yasl)
+            except Exception as e:
+                # fall back to parsing the schema files, which reports any real error
+                log.debug(f"Ignoring schema cache entry for '{path}' - {type(e)} - {e}")
+                cache.discard(path)
+                for namespace in registry.get_namespaces() - namespaces:
+                    registry.remove_namespace(namespace)
+            else:
+                documents.extend(
+                    (file_path, yasl)
+                    for file_path, yasl in cached
+                    if file_path not in loaded
+                )
+                log.debug("✅ YASL schema validation successful!")
+                return CompiledSchema(
+                    [yasl for file_path, yasl in cached if file_path == root],
+                    [yasl for _, yasl in cached],
+                    registry,
+                )
+
+    results = _load_schema_file(path, documents)
+    if results is None:
+        return None
+    closure = _import_closure(root, documents)
+    if cache is not None and root not in loaded:
+        cache.store(path, closure)
+    return CompiledSchema(results, [yasl for _, yasl in closure], registry)
+
+
+def _import_closure(
+    root: str, documents: list[tuple[str, YaslRoot]]
+) -> list[tuple[str, YaslRoot]]:
+    """
+    Return the documents of the schema file `root` and of every file it
+    imports, directly or not, in the generation order of `documents`.
+    """
+    files: dict[str, list[YaslRoot]] = {}
+    for file_path, yasl in documents:
+        files.setdefault(file_path, []).append(yasl)
+    closure = {root}
+    pending = [root]
+    while pending:
+        file_path = pending.pop()
+        for yasl in files.get(file_path, []):
+            for imp in yasl.imports or []:
+                imp_path = _resolve_import(imp, file_path)
+                if imp_path is not None and imp_path not in closure:
+                    closure.add(imp_path)
+                    pending.append(imp_path)
+    return [(file_path, yasl) for file_path, yasl in documents if file_path in closure]
+
+
+# Schema files parsed at once while resolving the imports of a schema.
+SCHEMA_PARSE_THREADS = 8
+
+
+def _load_schema_file(
+    path: str, documents: list[tuple[str, YaslRoot]]
+) -> list[YaslRoot] | None:
+    """
+    Parse, validate and generate a single YASL schema file, following its imports.
+
+    The import graph is resolved before anything is generated: every file is
+    parsed once, however many files import it, and import cycles are reported
+    instead of followed.  Files already in `documents` are not loaded again.
+    Every generated document is appended to `documents` in generation order,
+    imports before the documents importing them.
+    """
     log = logging.getLogger("yasl")
     log.debug(f"--- Attempting to validate schema '{path}' ---")
-    data = None
+    root = Path(path).resolve().as_posix()
+    loaded = {file_path for file_path, _ in documents}
+    if root in loaded:
+        return [yasl for file_path, yasl in documents if file_path == root]
+    graph = _resolve_schema_graph(path, loaded)
+    if graph is None:
+        return None
+    order = _schema_generation_order(root, graph, loaded)
+    if order is None:
+        return None
+    try:
+        for file_path, yasl in order:
+            log.debug(f"Generating schema definitions of '{file_path}'")
+            gen_definitions(yasl)
+            documents.append((file_path, yasl))
+    except Exception as e:
+        log.error(f"❌ An schema error occurred processing '{path}' - {type(e)} - {e}")
+        return None
+    log.debug("✅ YASL schema validation successful!")
+    return graph[root][0]
+
+
+def _resolve_schema_graph(
+    path: str, loaded: set[str]
+) -> dict[str, tuple[list[YaslRoot], list[list[str]]]] | None:
+    """
+    Parse the schema file at `path` and every file it imports, each once.
+    Files are discovered one import level at a time, and the files of a level
+    are parsed concurrently.
+
+    Args:
+        path (str): The schema file.
+        loaded (set[str]): Canonical paths of files already generated, which
+            are neither parsed nor followed.
+
+    Returns:
+        dict[str, tuple[list[YaslRoot], list[list[str]]]] | None: For the
+        canonical path of each file, its documents and the canonical paths
+        each document imports, or None if a file fails to parse or an import
+        is missing.
+    """
+    log = logging.getLogger("yasl")
+    graph: dict[str, tuple[list[YaslRoot], list[list[str]]]] = {}
+    level = [Path(path).resolve().as_posix()]
+    seen = set(level)
+    with ThreadPoolExecutor(SCHEMA_PARSE_THREADS) as pool:
+        while level:
+            if len(level) == 1:
+                parsed = [_parse_schema_file(level[0])]
+            else:
+                parsed = list(pool.map(_parse_schema_file, level))
+            if any(docs is None for docs in parsed):
+                return None
+            next_level = []
+            for file_path, docs in zip(
+                level, cast(list[list[YaslRoot]], parsed), strict=False
+            ):
+                imports = []
+                for yasl in docs:
+                    resolved = []
+                    for imp in yasl.imports or []:
+                        imp_path = _resolve_import(imp, file_path)
+                        if imp_path is None:
+                            log.error(
+                                f"❌ Error - Import file '{imp}' of YASL schema '{file_path}' not found"
+                            )
+                            return None
+                        log.debug(
+                            f"Importing additional schema '{imp}' - resolved to '{imp_path}'"
+                        )
+                        resolved.append(imp_path)
+                        if imp_path not in seen and imp_path not in loaded:
+                            seen.add(imp_path)
+                            next_level.append(imp_path)
+                    imports.append(resolved)
+                graph[file_path] = (docs, imports)
+            level = next_level
+    return graph
+
+
+def _resolve_import(imp: str, path: str) -> str | None:
+    """Return the canonical path of import `imp` of the schema file at `path`."""
+    imp_path = Path(imp)
+    if not imp_path.exists():
+        # try relative to current schema file
+        imp_path = Path(path).parent / imp
+        if not imp_path.exists():
+            return None
+    return imp_path.resolve().as_posix()
+
+
+def _schema_generation_order(
+    root: str,
+    graph: dict[str, tuple[list[YaslRoot], list[list[str]]]],
+    loaded: set[str],
+) -> list[tuple[str, YaslRoot]] | None:
+    """
+    Order the documents of an import graph for generation: the files a
+    document imports come before it, and each file appears once.
+
+    Returns:
+        list[tuple[str, YaslRoot]] | None: The documents with their files, or
+        None if the imports contain a cycle.
+    """
+    log = logging.getLogger("yasl")
+    order: list[tuple[str, YaslRoot]] = []
+    done = set(loaded)
+    chain: list[str] = []
+
+    def visit(file_path: str) -> bool:
+        if file_path in done:
+            return True
+        if file_path in chain:
+            cycle = chain[chain.index(file_path) :] + [file_path]
+            log.error(f"❌ Error - YASL schema import cycle: {' -> '.join(cycle)}")
+            return False
+        chain.append(file_path)
+        docs, imports = graph[file_path]
+        for yasl, doc_imports in zip(docs, imports, strict=False):
+            if not all(visit(imp) for imp in doc_imports):
+                return False
+            order.append((file_path, yasl))
+        chain.pop()
+        done.add(file_path)
+        return True
+
+    return order if visit(root) else None
+
+
+def _parse_schema_file(path: str) -> list[YaslRoot] | None:
+    """
+    Parse and validate the YASL documents of a single schema file, without
+    following its imports or generating anything.
+    """
+    log = logging.getLogger("yasl")
+    results = []
     try:
-        results = []
-        yaml_loader = YAML(typ="rt")
         docs = []
         with open(path) as f:
-            docs.extend(yaml_loader.load_all(f))
-
+            docs.extend(yaml_loader().load_all(f))
         for data in docs:
-            yasl = YaslRoot(**data)
-            if yasl is None:
-                raise ValueError("Failed to parse YASL schema from data {data}")
-            if yasl.imports is not None:
-                for imp in yasl.imports:
-                    imp_path = imp
-                    if not Path(imp_path).exists():
-                        # try relative to current schema file
-                        imp_path = Path(path).parent / imp
-                        if not imp_path.exists():
-                            raise FileNotFoundError(f"Import file '{imp}' not found")
-                        imp_path = imp_path.as_posix()
-                    log.debug(
-                        f"Importing additional schema '{imp}' - resolved to '{imp_path}'"
-                    )
-                    imported_yasl = load_schema_files(imp_path)
-                    if not imported_yasl:
-                        raise ValueError(f"Failed to import YASL schema from '{imp}'")
-            if yasl.metadata is not None:
-                log.debug(f"YASL Metadata: {yasl.metadata}")
-            if yasl.definitions is not None:
-                for namespace, yasl_item in yasl.definitions.items():
-                    # generate enums first so enum map keys are known when generating types
-                    if yasl_item.enums is not None:
-                        gen_enum_from_enumerations(namespace, yasl_item.enums)
-                for namespace, yasl_item in yasl.definitions.items():
-                    if yasl_item.types is not None:
-                        gen_pydantic_type_models(namespace, yasl_item.types)
-            results.append(yasl)
-        if not results or len(results) == 0:
+            results.append(YaslRoot(**data))
+        if not results:
             log.error(f"❌ No YASL schema definitions found in '{path}'")
             return None
-        log.debug("✅ YASL schema validation successful!")
         return results
     except FileNotFoundError:
         log.error(f"❌ Error - YASL schema file not found at '{path}'")
@@ -650,8 +1255,11 @@ def load_schema_files(path: str) -> list[YaslRoot] | None:
         log.error(
             f"❌ YASL schema validation of {path} failed with {len(e.errors())} error(s):"
         )
+        # the fast loader keeps no line information; every document before
+        # the failing one produced a result
+        lines = _line_table(None, path, len(results), fast=True)
         for error in e.errors():
-            line = get_line_for_error(data, error["loc"])
+            line = lines.line(error["loc"])
             path_str = " -> ".join(map(str, error["loc"]))
             if line:
                 log.error(f"  - Line {line}: '{path_str}' -> {error['msg']}")
@@ -719,7 +1327,9 @@ def load_data(
 
 
 # --- Main data validation logic ---
-def load_data_files(path: str, model_name: str | None = None) -> Any:
+def load_data_files(
+    path: str, model_name: str | None = None, fast: bool = False
+) -> Any:
     """
     Load and validate YAML data from a file against YASL schemas.
 
@@ -729,11 +1339,15 @@ def load_data_files(path: str, model_name: str | None = None) -> Any:
     If `model_name` is provided, validation is attempted against that specific schema.
     If `model_name` is None, the function attempts to auto-detect the appropriate schema
     by matching the root keys of the YAML data against the fields of registered types.
+    Candidates are tried from the most specific (fewest fields) to the least specific.
 
     Args:
         path (str): The file path to the YAML data file.
         model_name (str | None): The name of the schema to validate against.
             If None, schema auto-detection is performed.
+        fast (bool): If True, parse with the C-accelerated safe loader. The file
+            is only parsed again with the round-trip loader to report the line
+            numbers of errors and warnings.
 
     Returns:
         Any: A list of validated Pydantic models (one for each document in the YAML file)
@@ -743,92 +1357,164 @@ def load_data_files(path: str, model_name: str | None = None) -> Any:
         The function catches exceptions like FileNotFoundError, SyntaxError, YAMLError,
         and ValidationError, logging them as errors and returning None.
     """
+    results = []
+    for result in iter_data_files(path, model_name, fast):
+        if result is None:
+            return None
+        results.append(result)
+    return results
+
+
+def iter_data_files(
+    path: str, model_name: str | None = None, fast: bool = False
+) -> Iterator[Any]:
+    """
+    Load and validate YAML data from a file one document at a time.
+
+    Like `load_data_files`, but documents are parsed, validated and yielded one
+    at a time, and the parsed YAML of a document is dropped once it has been
+    validated, so memory use does not grow with the number of documents.
+
+    Args:
+        path (str): The file path to the YAML data file.
+        model_name (str | None): The name of the schema to validate against.
+            If None, schema auto-detection is performed.
+        fast (bool): If True, parse with the C-accelerated safe loader, as in
+            `load_data_files`.
+
+    Yields:
+        Any: The validated Pydantic model of each document. If a document fails
+        validation or the file cannot be read, the errors are logged, None is
+        yielded and the iteration stops.
+    """
     log = logging.getLogger("yasl")
     log.debug(f"--- Attempting to validate data '{path}' ---")
-    docs = []
-    data = None
     try:
-        yaml_loader = YAML(typ="rt")
-        with open(path) as f:
-            docs.extend(yaml_loader.load_all(f))
-
+        f = open(path)
     except FileNotFoundError:
         log.error(f"❌ Error - File not found at '{path}'")
-        return None
-    except SyntaxError as e:
+        yield None
+        return
+    with f:
+        yield from _iter_documents(f, path, model_name, fast)
+
+
+def _iter_documents(
+    stream: TextIO, path: str, model_name: str | None, fast: bool
+) -> Iterator[Any]:
+    """
+    Validate the YAML documents read from `stream`, as `iter_data_files`
+    does for the file at `path`.  With `fast`, the documents must be
+    readable again from `path` to report line numbers.
+    """
+    log = logging.getLogger("yasl")
+    docs = yaml_loader(fast).load_all(stream)
+    index = 0
+    count = 0
+    while True:
+        try:
+            data = next(docs, _NO_SCHEMA)
+        except Exception as e:
+            _log_data_parse_error(path, e)
+            yield None
+            return
+        if data is _NO_SCHEMA:
+            break
+        result = _validate_document(data, path, model_name, index, fast)
+        # drop the parsed document before handing out its model
+        data = None
+        index += 1
+        if result is _NO_SCHEMA:
+            continue
+        if result is None:
+            yield None
+            return
+        count += 1
+        yield result
+
+    if count == 0:
+        log.error(f"❌ No valid schema found to validate data in '{path}'")
+        yield None
+        return
+    log.info(f"✅ YAML '{path}' data validation successful!")
+
+
+# Returned by `_validate_document` for a document without a matching schema,
+# and marks the end of the documents in `iter_data_files`.
+_NO_SCHEMA = object()
+
+
+def _log_data_parse_error(path: str, e: Exception) -> None:
+    log = logging.getLogger("yasl")
+    if isinstance(e, SyntaxError):
         log.error(f"❌ Error - Syntax error in data file '{path}'\n  - {e}")
-        return None
-    except YAMLError as e:
+    elif isinstance(e, YAMLError):
         log.error(f"❌ Error - YAML error while parsing data '{path}'\n  - {e}")
-        return None
-    except ValueError as e:
+    elif isinstance(e, ValueError):
         log.error(f"❌ Error - value error while parsing data '{path}'\n  - {e}")
-        return None
-    except Exception as e:
+    else:
         log.error(f"❌ An unexpected error occurred - {type(e)} - {e}")
         traceback.print_exc()
-        return None
-    try:
-        results = []
-        registry = YaslRegistry()
-        for data in docs:
-            candidate_model_names: list[tuple[str, str | None]] = []
-            if model_name is None:
-                root_keys: list[str] = list(data.keys())
-                log.debug(f"Auto-detecting schema for YAML root keys in '{path}'")
-                yasl_result = registry.get_types()
-                for type_id, type_def in yasl_result.items() or []:
-                    type_name, type_namespace = type_id
-                    type_def_root_keys: list[str] = list(type_def.model_fields.keys())
-                    if all(k in type_def_root_keys for k in root_keys):
-                        log.debug(
-                            f"Auto-detected root model '{type_name}' for YAML file '{path}'"
-                        )
-                        candidate_model_names.append((type_name, type_namespace))
-            else:
-                registry_item = registry.get_type(model_name)
-                if registry_item:
-                    candidate_model_names.append(
-                        (model_name, registry_item.__module__ or None)
-                    )
-                else:
-                    candidate_model_names.append((model_name, None))
 
-            log.debug(
-                f"Identified candidate model names for '{path}' - {candidate_model_names}"
-            )
 
-            for schema_name, schema_namespace in candidate_model_names:
-                if registry.get_type(schema_name, schema_namespace) is None:
-                    continue
-                model = registry.get_type(schema_name, schema_namespace)
+def _validate_document(
+    data: Any, path: str, model_name: str | None, index: int, fast: bool
+) -> Any:
+    """
+    Validate the parsed YAML document at `index` of a file, returning its model,
+    `_NO_SCHEMA` if no registered schema matches it, or None if validation fails.
+    """
+    log = logging.getLogger("yasl")
+    try:
+        registry = YaslRegistry()
+        candidate_model_names: list[tuple[str, str | None]] = []
+        if model_name is None:
+            log.debug(f"Auto-detecting schema for YAML root keys in '{path}'")
+            candidate_model_names = registry.find_types_for_keys(data.keys())
+            if candidate_model_names:
                 log.debug(
-                    f"Using schema '{schema_name}' for data validation of {path}."
+                    f"Auto-detected root model '{candidate_model_names[0][0]}' for YAML file '{path}'"
                 )
+        else:
+            registry_item = registry.get_type(model_name)
+            if registry_item:
+                candidate_model_names.append(
+                    (model_name, registry_item.__module__ or None)
+                )
+            else:
+                candidate_model_names.append((model_name, None))
 
-                # Inject line number if available
-                if hasattr(data, "lc") and hasattr(data.lc, "line"):
-                    data["yaml_line"] = data.lc.line + 1
+        log.debug(
+            f"Identified candidate model names for '{path}' - {candidate_model_names}"
+        )
 
-                if model is not None:
-                    result = cast(type[BaseModel], model)(**data)  # type: ignore
-                    if result is not None:
-                        results.append(result)
-                        break
-                    else:
-                        log.debug(
-                            f"Data in '{path}' did not validate against schema '{schema_name}'."
-                        )
+        for schema_name, schema_namespace in candidate_model_names:
+            model = registry.get_type(schema_name, schema_namespace)
+            if model is None:
+                continue
+            log.debug(f"Using schema '{schema_name}' for data validation of {path}.")
 
-        if not results or len(results) == 0:
-            log.error(f"❌ No valid schema found to validate data in '{path}'")
-            return None
-        log.info(f"✅ YAML '{path}' data validation successful!")
-        return results
+            with collect_warnings() as warnings:
+                try:
+                    result = cast(type[BaseModel], model)(**data)  # type: ignore
+                except ValidationError:
+                    log_warnings(warnings)
+                    raise
+            if warnings:
+                log_warnings(
+                    warnings, result, lambda: _line_table(data, path, index, fast)
+                )
+            if result is not None:
+                return result
+            log.debug(
+                f"Data in '{path}' did not validate against schema '{schema_name}'."
+            )
+        return _NO_SCHEMA
     except ValidationError as e:
         log.error(f"❌ Validation failed with {len(e.errors())} error(s):")
+        lines = _line_table(data, path, index, fast)
         for error in e.errors():
-            line = get_line_for_error(data, error["loc"])
+            line = lines.line(error["loc"])
             path_str = " -> ".join(map(str, error["loc"]))
             if line:
                 log.error(f"  - Line {line} - '{path_str}' -> {error['msg']}")
@@ -0,0 +1,177 @@
+"""
+Line and column lookup for errors and warnings in YAML documents.
+
+Validated models carry no location information.  When an error or warning
+has to be reported, a `LineTable` is built from the marks that the round-trip
+parser recorded on a document, and the location of the error or of the model
+that raised the warning is looked up in it by JSON pointer.
+
+Warnings raised by type validators while a document is validated are held
+back by `collect_warnings` and logged by `log_warnings` once the document is
+done, when the path of each warning's model in the document is known.
+"""
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from pydantic import BaseModel
+
+_pending_warnings: ContextVar[list[tuple[Any, str]] | None] = ContextVar(
+    "yasl_pending_warnings", default=None
+)
+
+
+def json_pointer(loc: tuple[str | int, ...]) -> str:
+    """Return the JSON pointer (RFC 6901) of a Pydantic error location."""
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in loc
+    )
+
+
+class LineTable:
+    """
+    The line and column of every node of a parsed YAML document, keyed by JSON
+    pointer.  Documents parsed without line information give an empty table.
+
+    Args:
+        document (Any): A document parsed by the round-trip loader.
+    """
+
+    def __init__(self, document: Any):
+        self.positions: dict[str, tuple[int, int]] = {}
+        self._add("", document, set())
+
+    def _add(self, pointer: str, node: Any, parents: set[int]) -> None:
+        lc = getattr(node, "lc", None)
+        if lc is None or id(node) in parents:
+            return
+        self.positions.setdefault(pointer, (lc.line + 1, lc.col + 1))
+        parents.add(id(node))
+        if isinstance(node, dict):
+            for key, value in node.items():
+                child = f"{pointer}{json_pointer((key,))}"
+                marks = lc.data.get(key)
+                if marks:
+                    self.positions[child] = (marks[2] + 1, marks[3] + 1)
+                self._add(child, value, parents)
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                child = f"{pointer}/{index}"
+                marks = lc.data.get(index)
+                if marks:
+                    self.positions[child] = (marks[0] + 1, marks[1] + 1)
+                self._add(child, value, parents)
+        parents.discard(id(node))
+
+    def position(self, loc: tuple[str | int, ...]) -> tuple[int, int] | None:
+        """
+        Return the 1-based line and column of a location, or of its nearest
+        enclosing node if the location itself is not in the document (for
+        example a missing property).
+
+        Args:
+            loc (tuple[str | int, ...]): The location, as in Pydantic errors.
+
+        Returns:
+            tuple[int, int] | None: The line and column, or None if unknown.
+        """
+        for end in range(len(loc), -1, -1):
+            position = self.positions.get(json_pointer(loc[:end]))
+            if position is not None:
+                return position
+        return None
+
+    def line(self, loc: tuple[str | int, ...]) -> int | None:
+        """Return the 1-based line of a location, as for `position`."""
+        position = self.position(loc)
+        return position[0] if position else None
+
+
+def model_locations(root: Any) -> dict[int, tuple[str | int, ...]]:
+    """
+    Return the location of every model, dict and list inside a validated
+    model, keyed by object id, so warnings can be placed without walking the
+    model once per warning.  Objects reachable by several paths keep the
+    first one.
+
+    Args:
+        root (Any): The validated model of a document.
+
+    Returns:
+        dict[int, tuple[str | int, ...]]: The location of each object, as in
+        Pydantic errors.
+    """
+    locations: dict[int, tuple[str | int, ...]] = {}
+    stack: list[tuple[Any, tuple[str | int, ...]]] = [(root, ())]
+    while stack:
+        node, loc = stack.pop()
+        if isinstance(node, BaseModel):
+            items: Any = [
+                (name, getattr(node, name, None)) for name in type(node).model_fields
+            ]
+        elif isinstance(node, dict):
+            items = list(node.items())
+        elif isinstance(node, (list, tuple)):
+            items = list(enumerate(node))
+        else:
+            continue
+        if id(node) in locations:
+            continue
+        locations[id(node)] = loc
+        stack.extend((value, (*loc, key)) for key, value in reversed(items))
+    return locations
+
+
+def warn(instance: Any, message: str) -> None:
+    """
+    Log a warning about a model instance.  While warnings are collected, the
+    warning is held back so the line of the instance can be added to it.
+    """
+    pending = _pending_warnings.get()
+    if pending is None:
+        logging.getLogger("yasl").warning(message)
+    else:
+        pending.append((instance, message))
+
+
+@contextmanager
+def collect_warnings() -> Iterator[list[tuple[Any, str]]]:
+    """Collect the warnings raised with `warn` instead of logging them."""
+    pending: list[tuple[Any, str]] = []
+    token = _pending_warnings.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_warnings.reset(token)
+
+
+def log_warnings(
+    pending: list[tuple[Any, str]],
+    root: Any = None,
+    lines: Callable[[], LineTable] | None = None,
+) -> None:
+    """
+    Log collected warnings, with the line of each warning's model instance
+    where it can be found in `root`.
+
+    Args:
+        pending (list[tuple[Any, str]]): The collected warnings.
+        root (Any): The validated model of the document, if validation succeeded.
+        lines (Callable[[], LineTable] | None): Builds the line table of the
+            document; only called if a warning needs a line.
+    """
+    log = logging.getLogger("yasl")
+    locations = model_locations(root) if pending and root is not None else {}
+    table = None
+    for instance, message in pending:
+        loc = locations.get(id(instance))
+        if loc is not None and lines is not None:
+            if table is None:
+                table = lines()
+            line = table.line(loc)
+            if line is not None:
+                message = f"{message} at line {line}"
+        log.warning(message)
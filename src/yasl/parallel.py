@@ -0,0 +1,194 @@
+"""
+Parallel validation of YAML data files across worker processes.
+
+Every worker receives the compiled schema once, when it starts, and then
+validates whole data files.  Log records, unique values, ref[...] values and URLs to
+check produced by a worker are sent back with its results, so the parent
+process can replay the logs and check unique values, references and URLs
+across files in the original file order.
+"""
+
+import logging
+import os
+import pickle
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from yasl.cache import YaslRegistry
+from yasl.state import FileRecord
+
+if TYPE_CHECKING:
+    from yasl.core import CompiledSchema
+
+
+class _RecordCollector(logging.Handler):
+    """Collects log records in a worker so they can be replayed by the parent."""
+
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # format the message now, as arguments and tracebacks may not pickle
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        self.records.append(record)
+
+
+class _FileOutcome(NamedTuple):
+    valid: bool
+    # the pickled results, only sent for the file whose results are returned
+    # and unpickled by the caller: the executor's own thread does not see the
+    # caller's ValidationContext, whose types they need
+    results: bytes | None
+    records: list[logging.LogRecord]
+    unique_values: dict[tuple[str, str | None], dict[str, set]]
+    references: dict[str, set]
+    urls: set[str]
+
+
+_collector: _RecordCollector | None = None
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Return the number of worker processes to use, where 0 means one per CPU."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _init_worker(schema: "CompiledSchema", log_level: int) -> None:
+    global _collector
+
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.setLevel(log_level)
+    _collector = _RecordCollector()
+    root.addHandler(_collector)
+
+    # a forked worker inherits the schema's registry, a spawned one receives
+    # a pickled schema whose types are generated again without parsing YASL;
+    # the run context stays active for the life of the worker
+    schema.run().__enter__()
+    registry = YaslRegistry()
+    # references may point into files validated by other workers
+    registry.defer_references = True
+    registry.defer_url_checks = True
+    registry.record_unique_values = False
+
+
+def _validate_file(
+    yaml_file: str,
+    model_name: str | None,
+    stream: bool,
+    fast: bool,
+    keep_results: bool,
+) -> _FileOutcome:
+    from yasl.core import validate_data_file
+
+    assert _collector is not None
+    registry = YaslRegistry()
+    registry.clear_unique_values()
+    registry.pending_references.clear()
+    registry.pending_urls.clear()
+    _collector.records = []
+    results = validate_data_file(yaml_file, model_name, stream, fast)
+    return _FileOutcome(
+        bool(results),
+        pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+        if keep_results and results
+        else None,
+        _collector.records,
+        dict(registry.unique_values_store),
+        registry.take_pending_references(),
+        registry.take_pending_urls(),
+    )
+
+
+def validate_files_parallel(
+    schema: "CompiledSchema",
+    yaml_files: Sequence[Path],
+    model_name: str | None,
+    jobs: int,
+    stream: bool = False,
+    fast: bool = False,
+) -> tuple[Any, list[tuple[Path, FileRecord]]] | None:
+    """
+    Validate YAML data files in worker processes.
+
+    The schema's types must be registered in the YaslRegistry of this process.
+    Log records and unique values are merged back in file order, and
+    validation stops at the first file that fails, as in serial validation.
+    Workers only report whether each file passed; the validated models are
+    sent back for the last file alone.
+    References and URLs are not checked here; they are returned with the
+    unique values of each file for `check_references` and `check_urls_reachable`.
+
+    Args:
+        schema (CompiledSchema): The loaded schemas, sent to each worker.
+        yaml_files (Sequence[Path]): The YAML data files to validate.
+        model_name (str | None): Specific model name to use for validation.
+        jobs (int): Number of worker processes, 0 for one per CPU.
+        stream (bool): If True, workers stream the documents of each file and
+            send back only the model of its last document.
+        fast (bool): If True, workers parse with the C-accelerated safe loader.
+
+    Returns:
+        tuple[Any, list[tuple[Path, FileRecord]]] | None: The validated models
+        of the last data file and the unique values, referenced values and URLs
+        of each file, or None if any file failed.
+    """
+    log = logging.getLogger("yasl")
+    registry = YaslRegistry()
+    jobs = min(resolve_jobs(jobs), len(yaml_files))
+    log.debug(f"Validating {len(yaml_files)} YAML files with {jobs} worker processes")
+
+    executor = ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(schema, logging.getLogger().getEffectiveLevel()),
+    )
+    chunksize = max(1, len(yaml_files) // (jobs * 4))
+    results = None
+    records: list[tuple[Path, FileRecord]] = []
+    try:
+        outcomes = executor.map(
+            _validate_file,
+            [p.as_posix() for p in yaml_files],
+            [model_name] * len(yaml_files),
+            [stream] * len(yaml_files),
+            [fast] * len(yaml_files),
+            [index == len(yaml_files) - 1 for index in range(len(yaml_files))],
+            chunksize=chunksize,
+        )
+        for yaml_file, outcome in zip(yaml_files, outcomes, strict=True):
+            for record in outcome.records:
+                logging.getLogger(record.name).handle(record)
+            if not outcome.valid:
+                log.error(
+                    f"❌ Validation failed. Unable to validate data in YAML file {yaml_file}."
+                )
+                return None
+            try:
+                registry.register_unique_values(outcome.unique_values)
+            except ValueError as e:
+                log.error(f"❌ {e} in '{yaml_file}'")
+                return None
+            records.append(
+                (
+                    yaml_file,
+                    FileRecord(outcome.unique_values, outcome.references, outcome.urls),
+                )
+            )
+            if outcome.results is not None:
+                results = pickle.loads(outcome.results)
+    except Exception as e:
+        log.error(f"❌ Parallel validation failed - {type(e).__name__} - {e}")
+        return None
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results, records
@@ -1,8 +1,9 @@
 import datetime
-from typing import Any, Final
+import re
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import Annotated, Any, Final, get_args, get_origin
 
-import astropy.units as u
-from astropy.units import astrophys, cgs, core, misc, si
 from pydantic import (
     UUID1,
     UUID3,
@@ -57,9 +58,63 @@ from pydantic_core import core_schema
 
 # --- Astropy Physical Types Logic ---
 
+# A plain real number followed by a unit string, e.g. "5 m/s" or "-1.5e3 kg".
+# The unit may not start like a number, so "1.5.3 m" is not read as 1.5 in
+# units of ".3 m".  Anything else (complex values, "inf", malformed numbers,
+# unit expressions astropy cannot parse on their own) falls back to a full
+# `Quantity` parse.
+_QUANTITY_PATTERN: Final = re.compile(
+    r"\s*(?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"\s*(?P<unit>(?![\d.+-]).*?)\s*"
+)
+
+# The same, for many values joined by newlines and scanned at once.  Units
+# may keep trailing blanks here; they are stripped once per distinct unit.
+# A line whose unit starts like a number does not match, which sends the
+# whole batch to per-value validation.
+_QUANTITY_LINES: Final = re.compile(
+    r"^[ \t]*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)[ \t]*((?![\d.+-]).*)$",
+    re.MULTILINE,
+)
+
+# Number of distinct unit strings whose physical type is remembered.
+UNIT_CACHE_SIZE: Final = 1024
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _unit_physical_type(unit: str) -> Any:
+    import astropy.units as u
+
+    return u.Unit(unit).physical_type
+
+
+def _quantity_physical_type(value: str) -> Any:
+    match = _QUANTITY_PATTERN.fullmatch(value)
+    if match is not None:
+        try:
+            return _unit_physical_type(match["unit"])
+        except Exception:
+            pass
+    import astropy.units as u
+
+    q = u.Quantity(value)
+    assert q.unit is not None, "Quantity unit cannot be None"
+    return q.unit.physical_type
+
 
 def create_quantity_type(name: str, target_physical_type: str):
     class QuantityType(str):
+        # resolved on first use, so astropy is not imported when the class is built
+        _target_physical_type: Any = None
+
+        @classmethod
+        def target_physical_type(cls) -> Any:
+            if cls._target_physical_type is None:
+                import astropy.units as u
+
+                cls._target_physical_type = u.get_physical_type(target_physical_type)
+            return cls._target_physical_type
+
         @classmethod
         def __get_pydantic_core_schema__(
             cls, source_type: Any, handler: GetCoreSchemaHandler
@@ -72,11 +127,9 @@ def create_quantity_type(name: str, target_physical_type: str):
         @classmethod
         def validate(cls, v: str) -> str:
             try:
-                q = u.Quantity(v)
                 # Ensure we are comparing PhysicalType objects to handle synonyms
-                assert q.unit is not None, "Quantity unit cannot be None"
-                pt = q.unit.physical_type
-                target_pt = u.get_physical_type(target_physical_type)
+                pt = _quantity_physical_type(v)
+                target_pt = cls.target_physical_type()
 
                 if pt != target_pt:
                     raise ValueError(
@@ -91,138 +144,310 @@ def create_quantity_type(name: str, target_physical_type: str):
     return QuantityType
 
 
-# List provided by user
-_units_and_physical_types: Final[list[tuple[core.UnitBase, str | set[str]]]] = [
-    (core.dimensionless_unscaled, "dimensionless"),
-    (si.m, "length"),
-    (si.m**2, "area"),
-    (si.m**3, "volume"),
-    (si.s, "time"),
-    (si.rad, "angle"),
-    (si.sr, "solid angle"),
-    (si.m / si.s, {"speed", "velocity"}),
-    (si.m / si.s**2, "acceleration"),
-    (si.Hz, "frequency"),
-    (si.g, "mass"),
-    (si.mol, "amount of substance"),
-    (si.K, "temperature"),
-    (si.W * si.m**-1 * si.K**-1, "thermal conductivity"),
-    (si.J * si.K**-1, {"heat capacity", "entropy"}),
-    (si.J * si.K**-1 * si.kg**-1, {"specific heat capacity", "specific entropy"}),
-    (si.N, "force"),
-    (si.J, {"energy", "work", "torque"}),
-    (si.J * si.m**-2 * si.s**-1, {"energy flux", "irradiance"}),
-    (si.Pa, {"pressure", "energy density", "stress"}),
-    (si.W, {"power", "radiant flux"}),
-    (si.kg * si.m**-3, "mass density"),
-    (si.m**3 / si.kg, "specific volume"),
-    (si.mol / si.m**3, "molar concentration"),
-    (si.m**3 / si.mol, "molar volume"),
-    (si.kg * si.m / si.s, {"momentum", "impulse"}),
-    (si.kg * si.m**2 / si.s, {"angular momentum", "action"}),
-    (si.rad / si.s, {"angular speed", "angular velocity", "angular frequency"}),
-    (si.rad / si.s**2, "angular acceleration"),
-    (si.rad / si.m, "plate scale"),
-    (si.g / (si.m * si.s), "dynamic viscosity"),
-    (si.m**2 / si.s, {"diffusivity", "kinematic viscosity"}),
-    (si.m**-1, "wavenumber"),
-    (si.m**-2, "column density"),
-    (si.A, "electrical current"),
-    (si.C, "electrical charge"),
-    (si.V, "electrical potential"),
-    (si.Ohm, {"electrical resistance", "electrical impedance", "electrical reactance"}),
-    (si.Ohm * si.m, "electrical resistivity"),
-    (si.S, "electrical conductance"),
-    (si.S / si.m, "electrical conductivity"),
-    (si.F, "electrical capacitance"),
-    (si.C * si.m, "electrical dipole moment"),
-    (si.A / si.m**2, "electrical current density"),
-    (si.V / si.m, "electrical field strength"),
+def is_quantity_type(t: Any) -> bool:
+    """Return True if `t` is a type created by `create_quantity_type`."""
+    return (
+        isinstance(t, type)
+        and issubclass(t, str)
+        and hasattr(t, "target_physical_type")
+    )
+
+
+def _parse_quantities(
+    values: Sequence[Any], item_type: Any
+) -> tuple[Any, list[str]] | None:
+    """
+    Parse quantity strings in one pass: the numbers into a NumPy array, and the
+    physical type of each distinct unit string checked once against `item_type`.
+    Returns None if any value needs the full, per-value validation.
+    """
+    import numpy as np
+
+    # one regex scan over all values, one value per line
+    try:
+        joined = "\n".join(values)
+    except TypeError:
+        return None
+    if joined.count("\n") != len(values) - 1:
+        return None
+    pairs = _QUANTITY_LINES.findall(joined)
+    if len(pairs) != len(values):
+        return None
+    if not pairs:
+        return np.array([], dtype=float), []
+    numbers, units = zip(*pairs, strict=True)
+    target_pt = item_type.target_physical_type()
+    for unit in set(units):
+        try:
+            if _unit_physical_type(unit.strip()) != target_pt:
+                return None
+        except Exception:
+            return None
+    return np.array(numbers, dtype=float), list(units)
+
+
+def _quantity_array(values: Sequence[str], parsed: tuple[Any, list[str]] | None) -> Any:
+    import astropy.units as u
+    import numpy as np
+
+    if not values:
+        return u.Quantity([])
+    if parsed is not None:
+        numbers, units = parsed
+        unit = u.Unit(units[0].strip())
+        distinct, index = np.unique(np.array(units), return_inverse=True)
+        try:
+            scale = np.array(
+                [u.Unit(str(other).strip()).to(unit) for other in distinct]
+            )
+            return numbers * scale[index] * unit
+        except u.UnitConversionError:
+            # temperatures need an equivalency to convert
+            pass
+    with u.set_enabled_equivalencies(u.temperature()):
+        quantities = [u.Quantity(value) for value in values]
+        return u.Quantity(quantities, quantities[0].unit)
+
+
+class QuantityList(list):
+    """A validated list of quantity strings, also available as a Quantity array."""
+
+    _parsed: tuple[Any, list[str]] | None = None
+
+    @property
+    def quantity(self) -> Any:
+        """The values as one `astropy.units.Quantity` array, in the unit of the first value."""
+        return _quantity_array(self, self._parsed)
+
+
+class QuantityMap(dict):
+    """A validated map of quantity strings, also available as a Quantity array."""
+
+    _parsed: tuple[Any, list[str]] | None = None
+
+    @property
+    def quantity(self) -> Any:
+        """The values as one `astropy.units.Quantity` array in key order, in the unit of the first value."""
+        return _quantity_array(list(self.values()), self._parsed)
+
+
+class QuantityBatch:
+    """
+    Annotation for `list[Q]` and `dict[str, Q]` of a quantity type `Q` that
+    validates the whole collection in one batch.  If any value cannot be
+    handled by the batch, the collection is validated value by value instead,
+    so errors keep the index or key of the value.
+    """
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        is_map = get_origin(source_type) is dict
+        key_type, item_type = (
+            get_args(source_type) if is_map else (str, get_args(source_type)[0])
+        )
+        container = QuantityMap if is_map else QuantityList
+
+        def validate(
+            value: Any, validate_each: core_schema.ValidatorFunctionWrapHandler
+        ) -> Any:
+            parsed = None
+            if is_map and isinstance(value, dict) and key_type is str:
+                if all(isinstance(key, str) for key in value):
+                    parsed = _parse_quantities(list(value.values()), item_type)
+                    if parsed is not None:
+                        value = dict(zip(value, map(str, value.values()), strict=True))
+            elif not is_map and isinstance(value, list):
+                parsed = _parse_quantities(value, item_type)
+                if parsed is not None:
+                    value = list(map(str, value))
+            if parsed is None:
+                value = validate_each(value)
+            result = container(value)
+            result._parsed = parsed
+            return result
+
+        return core_schema.no_info_wrap_validator_function(
+            validate, handler(source_type)
+        )
+
+    def __repr__(self):
+        return "QuantityBatch()"
+
+
+def quantity_batch(container: Any) -> Any:
+    """
+    Wrap `list[Q]` or `dict[K, Q]` for a quantity type `Q` with `QuantityBatch`.
+    Other types are returned unchanged.
+    """
+    args = get_args(container)
+    if get_origin(container) in (list, dict) and args and is_quantity_type(args[-1]):
+        return Annotated[container, QuantityBatch()]
+    return container
+
+
+# List provided by user.  Units are kept as astropy unit strings so the table
+# can be built without importing astropy.
+_units_and_physical_types: Final[list[tuple[str, str | set[str]]]] = [
+    ("", "dimensionless"),
+    ("m", "length"),
+    ("m2", "area"),
+    ("m3", "volume"),
+    ("s", "time"),
+    ("rad", "angle"),
+    ("sr", "solid angle"),
+    ("m / s", {"speed", "velocity"}),
+    ("m / s2", "acceleration"),
+    ("Hz", "frequency"),
+    ("g", "mass"),
+    ("mol", "amount of substance"),
+    ("K", "temperature"),
+    ("W / (K m)", "thermal conductivity"),
+    ("J / K", {"heat capacity", "entropy"}),
+    ("J / (K kg)", {"specific heat capacity", "specific entropy"}),
+    ("N", "force"),
+    ("J", {"energy", "work", "torque"}),
+    ("J / (s m2)", {"energy flux", "irradiance"}),
+    ("Pa", {"pressure", "energy density", "stress"}),
+    ("W", {"power", "radiant flux"}),
+    ("kg / m3", "mass density"),
+    ("m3 / kg", "specific volume"),
+    ("mol / m3", "molar concentration"),
+    ("m3 / mol", "molar volume"),
+    ("kg m / s", {"momentum", "impulse"}),
+    ("m2 kg / s", {"angular momentum", "action"}),
+    ("rad / s", {"angular speed", "angular velocity", "angular frequency"}),
+    ("rad / s2", "angular acceleration"),
+    ("rad / m", "plate scale"),
+    ("g / (m s)", "dynamic viscosity"),
+    ("m2 / s", {"diffusivity", "kinematic viscosity"}),
+    ("1 / m", "wavenumber"),
+    ("1 / m2", "column density"),
+    ("A", "electrical current"),
+    ("C", "electrical charge"),
+    ("V", "electrical potential"),
+    ("Ohm", {"electrical resistance", "electrical impedance", "electrical reactance"}),
+    ("Ohm m", "electrical resistivity"),
+    ("S", "electrical conductance"),
+    ("S / m", "electrical conductivity"),
+    ("F", "electrical capacitance"),
+    ("C m", "electrical dipole moment"),
+    ("A / m2", "electrical current density"),
+    ("V / m", "electrical field strength"),
     (
-        si.C / si.m**2,
+        "C / m2",
         {"electrical flux density", "surface charge density", "polarization density"},
     ),
-    (si.C / si.m**3, "electrical charge density"),
-    (si.F / si.m, "permittivity"),
-    (si.Wb, "magnetic flux"),
-    (si.Wb**2, "magnetic helicity"),
-    (si.T, "magnetic flux density"),
-    (si.A / si.m, "magnetic field strength"),
-    (si.m**2 * si.A, "magnetic moment"),
-    (si.H / si.m, {"electromagnetic field strength", "permeability"}),
-    (si.H, "inductance"),
-    (si.cd, "luminous intensity"),
-    (si.lm, "luminous flux"),
-    (si.lx, {"luminous emittance", "illuminance"}),
-    (si.W / si.sr, "radiant intensity"),
-    (si.cd / si.m**2, "luminance"),
-    (si.m**-3 * si.s**-1, "volumetric rate"),
-    (astrophys.Jy, "spectral flux density"),
-    (astrophys.Jy / si.sr, "surface brightness"),
-    (si.W * si.m**2 * si.Hz**-1, "surface tension"),
-    (si.J * si.m**-3 * si.s**-1, {"spectral flux density wav", "power density"}),
-    (si.J * si.m**-3 * si.s**-1 * si.sr**-1, "surface brightness wav"),
-    (astrophys.photon / si.Hz / si.cm**2 / si.s, "photon flux density"),
-    (astrophys.photon / si.AA / si.cm**2 / si.s, "photon flux density wav"),
-    (astrophys.photon / si.Hz / si.cm**2 / si.s / si.sr, "photon surface brightness"),
-    (
-        astrophys.photon / si.AA / si.cm**2 / si.s / si.sr,
-        "photon surface brightness wav",
-    ),
-    (astrophys.R, "photon flux"),
-    (misc.bit, "data quantity"),
-    (misc.bit / si.s, "bandwidth"),
-    (cgs.Franklin, "electrical charge (ESU)"),
-    (cgs.statampere, "electrical current (ESU)"),
-    (cgs.Biot, "electrical current (EMU)"),
-    (cgs.abcoulomb, "electrical charge (EMU)"),
-    (si.m * si.s**-3, {"jerk", "jolt"}),
-    (si.m * si.s**-4, {"snap", "jounce"}),
-    (si.m * si.s**-5, "crackle"),
-    (si.m * si.s**-6, {"pop", "pounce"}),
-    (si.K / si.m, "temperature gradient"),
-    (si.J / si.kg, {"specific energy", "dose of ionizing radiation"}),
-    (si.mol * si.m**-3 * si.s**-1, "reaction rate"),
-    (si.kg * si.m**2, "moment of inertia"),
-    (si.mol / si.s, "catalytic activity"),
-    (si.J * si.K**-1 * si.mol**-1, "molar heat capacity"),
-    (si.mol / si.kg, "molality"),
-    (si.m * si.s, "absement"),
-    (si.m * si.s**2, "absity"),
-    (si.m**3 / si.s, "volumetric flow rate"),
-    (si.s**-2, "frequency drift"),
-    (si.Pa**-1, "compressibility"),
-    (astrophys.electron * si.m**-3, "electron density"),
-    (astrophys.electron * si.m**-2 * si.s**-1, "electron flux"),
-    (si.kg / si.m**2, "surface mass density"),
-    (si.W / si.m**2 / si.sr, "radiance"),
-    (si.J / si.mol, "chemical potential"),
-    (si.kg / si.m, "linear density"),
-    (si.H**-1, "magnetic reluctance"),
-    (si.W / si.K, "thermal conductance"),
-    (si.K / si.W, "thermal resistance"),
-    (si.K * si.m / si.W, "thermal resistivity"),
-    (si.N / si.s, "yank"),
-    (si.S * si.m**2 / si.mol, "molar conductivity"),
-    (si.m**2 / si.V / si.s, "electrical mobility"),
-    (si.lumen / si.W, "luminous efficacy"),
-    (si.m**2 / si.kg, {"opacity", "mass attenuation coefficient"}),
-    (si.kg * si.m**-2 * si.s**-1, {"mass flux", "momentum density"}),
-    (si.m**-3, "number density"),
-    (si.m**-2 * si.s**-1, "particle flux"),
+    ("C / m3", "electrical charge density"),
+    ("F / m", "permittivity"),
+    ("Wb", "magnetic flux"),
+    ("Wb2", "magnetic helicity"),
+    ("T", "magnetic flux density"),
+    ("A / m", "magnetic field strength"),
+    ("m2 A", "magnetic moment"),
+    ("H / m", {"electromagnetic field strength", "permeability"}),
+    ("H", "inductance"),
+    ("cd", "luminous intensity"),
+    ("lm", "luminous flux"),
+    ("lx", {"luminous emittance", "illuminance"}),
+    ("W / sr", "radiant intensity"),
+    ("cd / m2", "luminance"),
+    ("1 / (s m3)", "volumetric rate"),
+    ("Jy", "spectral flux density"),
+    ("Jy / sr", "surface brightness"),
+    ("m2 W / Hz", "surface tension"),
+    ("J / (s m3)", {"spectral flux density wav", "power density"}),
+    ("J / (s sr m3)", "surface brightness wav"),
+    ("ph / (Hz s cm2)", "photon flux density"),
+    ("ph / (Angstrom s cm2)", "photon flux density wav"),
+    ("ph / (Hz s sr cm2)", "photon surface brightness"),
+    ("ph / (Angstrom s sr cm2)", "photon surface brightness wav"),
+    ("R", "photon flux"),
+    ("bit", "data quantity"),
+    ("bit / s", "bandwidth"),
+    ("Fr", "electrical charge (ESU)"),
+    ("statA", "electrical current (ESU)"),
+    ("Bi", "electrical current (EMU)"),
+    ("abC", "electrical charge (EMU)"),
+    ("m / s3", {"jerk", "jolt"}),
+    ("m / s4", {"snap", "jounce"}),
+    ("m / s5", "crackle"),
+    ("m / s6", {"pop", "pounce"}),
+    ("K / m", "temperature gradient"),
+    ("J / kg", {"specific energy", "dose of ionizing radiation"}),
+    ("mol / (s m3)", "reaction rate"),
+    ("m2 kg", "moment of inertia"),
+    ("mol / s", "catalytic activity"),
+    ("J / (K mol)", "molar heat capacity"),
+    ("mol / kg", "molality"),
+    ("m s", "absement"),
+    ("s2 m", "absity"),
+    ("m3 / s", "volumetric flow rate"),
+    ("1 / s2", "frequency drift"),
+    ("1 / Pa", "compressibility"),
+    ("electron / m3", "electron density"),
+    ("electron / (s m2)", "electron flux"),
+    ("kg / m2", "surface mass density"),
+    ("W / (sr m2)", "radiance"),
+    ("J / mol", "chemical potential"),
+    ("kg / m", "linear density"),
+    ("1 / H", "magnetic reluctance"),
+    ("W / K", "thermal conductance"),
+    ("K / W", "thermal resistance"),
+    ("K m / W", "thermal resistivity"),
+    ("N / s", "yank"),
+    ("m2 S / mol", "molar conductivity"),
+    ("m2 / (V s)", "electrical mobility"),
+    ("lm / W", "luminous efficacy"),
+    ("m2 / kg", {"opacity", "mass attenuation coefficient"}),
+    ("kg / (s m2)", {"mass flux", "momentum density"}),
+    ("1 / m3", "number density"),
+    ("1 / (s m2)", "particle flux"),
 ]
 
 
+class _QuantityTypeMap(Mapping[str, type]):
+    """
+    Read-only mapping of physical type names to quantity types.
+    Each quantity type is created on first lookup, keeping astropy out of the import path.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._names: dict[str, None] = dict.fromkeys(names)
+        self._types: dict[str, type] = {}
+
+    def __getitem__(self, name: str) -> type:
+        quantity_type = self._types.get(name)
+        if quantity_type is None:
+            if name not in self._names:
+                raise KeyError(name)
+            # setdefault keeps a single class per name if two threads race here
+            quantity_type = self._types.setdefault(
+                name, create_quantity_type(name, name)
+            )
+        return quantity_type
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
 # Generate map of astropy types
-ASTROPY_TYPES = {}
+_physical_type_names: list[str] = []
 for _unit, names in _units_and_physical_types:
     if isinstance(names, str):
         names_set = {names}
     else:
         names_set = names
 
-    for name in names_set:
-        ASTROPY_TYPES[name] = create_quantity_type(name, name)
+    _physical_type_names.extend(names_set)
+
+ASTROPY_TYPES = _QuantityTypeMap(_physical_type_names)
 
 # --- Standard Pydantic Types ---
 
@@ -289,7 +514,32 @@ STANDARD_TYPES = {
 }
 
 # --- Unified Map ---
-PRIMITIVE_TYPE_MAP = {**STANDARD_TYPES, **ASTROPY_TYPES}
+
+
+class _PrimitiveTypeMap(Mapping[str, Any]):
+    """Read-only union of the standard and physical type maps that keeps physical types lazy."""
+
+    def __init__(self, standard: Mapping[str, Any], physical: Mapping[str, type]):
+        self._standard = standard
+        self._physical = physical
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._standard:
+            return self._standard[name]
+        return self._physical[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._standard or name in self._physical
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._standard
+        yield from self._physical
+
+    def __len__(self) -> int:
+        return len(self._standard) + len(self._physical)
+
+
+PRIMITIVE_TYPE_MAP = _PrimitiveTypeMap(STANDARD_TYPES, ASTROPY_TYPES)
 
 
 class ReferenceMarker:
@@ -1,7 +1,13 @@
 import datetime
+import pickle
+import re
+from collections.abc import Iterable
+from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+from yasl.cache import YaslRegistry
 
 
 class YASLBaseModel(BaseModel):
@@ -9,6 +15,53 @@ class YASLBaseModel(BaseModel):
         fields = self.model_dump()  # For Pydantic v2; use self.dict() for v1
         return f"{self.__class__.__name__}({fields})"
 
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Generated models cannot be imported by module path, so they are pickled
+        # by name and namespace and rebuilt from the registry of the receiving process.
+        cls = self.__class__
+        if YaslRegistry().yasl_type_defs.get((cls.__name__, cls.__module__)) is cls:
+            return (
+                _rebuild_model,
+                (cls.__name__, cls.__module__, self.__getstate__()),
+            )
+        return super().__reduce_ex__(protocol)
+
+
+def _rebuild_model(name: str, namespace: str, state: dict[Any, Any]) -> BaseModel:
+    model = YaslRegistry().get_type(name, namespace)
+    if model is None:
+        raise pickle.UnpicklingError(
+            f"Type '{namespace}.{name}' is not registered in this process"
+        )
+    instance = model.__new__(model)  # type: ignore
+    instance.__setstate__(state)
+    return instance
+
+
+def _reduce_enum_member(self: Enum, protocol: Any) -> Any:
+    cls = self.__class__
+    return (_rebuild_enum_member, (cls.__name__, cls.__module__, self.value))
+
+
+def _rebuild_enum_member(name: str, namespace: str, value: Any) -> Enum:
+    enum_cls = YaslRegistry().get_enum(name, namespace)
+    if enum_cls is None:
+        raise pickle.UnpicklingError(
+            f"Enum '{namespace}.{name}' is not registered in this process"
+        )
+    return enum_cls(value)  # type: ignore
+
+
+def yasl_enum(name: str, values: Iterable[str], namespace: str) -> Enum:
+    """
+    Create the Python Enum for a YASL enumeration.
+    Members are pickled by name and namespace, like generated models.
+    """
+    enum_cls = Enum(name, {value: value for value in values})
+    enum_cls.__module__ = namespace
+    enum_cls.__reduce_ex__ = _reduce_enum_member  # type: ignore
+    return enum_cls
+
 
 # --- YASL Pydantic Models ---
 class Enumeration(YASLBaseModel):
@@ -63,11 +116,24 @@ class Property(YASLBaseModel):
     # any constraints
     any_of: list[str] | None = None
 
+    # markdown constraints
+    markdown_strict: bool | None = None
+
     # ref constraints
     no_ref_check: bool | None = None
 
     model_config = {"extra": "forbid"}
 
+    @field_validator("str_regex")
+    @classmethod
+    def check_str_regex(cls, value: str | None) -> str | None:
+        if value is not None:
+            try:
+                re.compile(value)
+            except re.error as e:
+                raise ValueError(f"Invalid str_regex pattern '{value}' - {e}") from e
+        return value
+
 
 class IfThen(YASLBaseModel):
     eval: str
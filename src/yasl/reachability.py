@@ -0,0 +1,174 @@
+"""
+Concurrent, cached URL reachability checks for `url_reachable` properties.
+
+`UrlChecker` sends HEAD requests for a batch of URLs from a thread pool that
+shares one pooled `requests.Session`.  Each host is limited to a few requests
+in flight at a time, each URL is checked at most once per batch, and URLs
+found reachable can be kept in an on-disk cache for a limited time.  Failures
+are never cached, so a URL that was down is checked again on the next run.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Seconds a cached reachable result stays valid.
+URL_CACHE_TTL = 60 * 60
+
+# Defaults for a batch of checks.
+URL_CHECK_TIMEOUT = 3.0
+URL_CHECK_WORKERS = 16
+URL_CHECK_PER_HOST = 4
+
+
+class UrlChecker:
+    """
+    Checks whether URLs are reachable.
+
+    Args:
+        cache_dir (str | Path | None): Directory for the cache of reachable
+            URLs. No results are cached if None.
+        ttl (float): Seconds a cached reachable result stays valid.
+        timeout (float): Timeout of each request, in seconds.
+        max_workers (int): Maximum number of requests in flight.
+        per_host (int): Maximum number of requests in flight to one host.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl: float = URL_CACHE_TTL,
+        timeout: float = URL_CHECK_TIMEOUT,
+        max_workers: int = URL_CHECK_WORKERS,
+        per_host: int = URL_CHECK_PER_HOST,
+    ):
+        self.cache_path = Path(cache_dir) / "urls.json" if cache_dir else None
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self._host_limits: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def check(self, urls: Iterable[str]) -> dict[str, str | None]:
+        """
+        Check a batch of URLs.
+
+        Args:
+            urls (Iterable[str]): The URLs to check; duplicates are checked once.
+
+        Returns:
+            dict[str, str | None]: For each URL, None if it is reachable, or a
+            message describing why it is not.
+        """
+        log = logging.getLogger("yasl")
+        pending = set(urls)
+        now = time.time()
+        cache = self._load_cache()
+        results: dict[str, str | None] = {}
+        for url in pending:
+            entry = cache.get(url)
+            # failures cached by older versions are checked again
+            if (
+                entry is not None
+                and entry["error"] is None
+                and now - entry["checked"] < self.ttl
+            ):
+                results[url] = None
+        pending -= results.keys()
+        log.debug(
+            f"Checking {len(pending)} URLs ({len(results)} cached) for reachability"
+        )
+        if pending:
+            with requests.Session() as session:
+                adapter = HTTPAdapter(
+                    pool_connections=self.max_workers, pool_maxsize=self.per_host
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(pending))
+                ) as executor:
+                    checked = dict(
+                        zip(
+                            pending,
+                            executor.map(
+                                lambda url: self._check_one(session, url), pending
+                            ),
+                            strict=True,
+                        )
+                    )
+            results.update(checked)
+            now = time.time()
+            cache.update(
+                {
+                    url: {"checked": now, "error": None}
+                    for url, error in checked.items()
+                    if error is None
+                }
+            )
+            self._store_cache(cache)
+        return results
+
+    def _host_limit(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.Semaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _check_one(self, session: requests.Session, url: str) -> str | None:
+        with self._host_limit(url):
+            try:
+                response = session.head(url, allow_redirects=True, timeout=self.timeout)
+            except requests.RequestException as e:
+                return f"URL '{url}' is not reachable: {e}"
+        if response.status_code >= 400:
+            return f"URL '{url}' is not reachable (status {response.status_code})"
+        return None
+
+    def _load_cache(self) -> dict[str, dict]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except Exception as e:
+            logging.getLogger("yasl").debug(
+                f"Ignoring unreadable URL cache '{self.cache_path}' - {e}"
+            )
+            return {}
+
+    def _store_cache(self, cache: dict[str, dict]) -> None:
+        if self.cache_path is None:
+            return
+        now = time.time()
+        cache = {
+            url: entry
+            for url, entry in cache.items()
+            if entry["error"] is None and now - entry["checked"] < self.ttl
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, self.cache_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        except Exception as e:
+            logging.getLogger("yasl").debug(
+                f"Unable to write URL cache '{self.cache_path}' - {e}"
+            )
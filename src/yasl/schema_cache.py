@@ -0,0 +1,135 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from common.utils import advanced_yaml_version
+from yasl.pydantic_types import YaslRoot
+
+# Bump whenever the layout of a cache entry or the YASL models change.
+SCHEMA_CACHE_VERSION = 2
+
+# Environment variable used when no cache directory is passed explicitly.
+CACHE_DIR_ENV = "YASL_CACHE_DIR"
+
+
+def resolve_cache_dir(cache_dir: str | Path | None = None) -> Path | None:
+    """
+    Resolve the schema cache directory.
+
+    Args:
+        cache_dir (str | Path | None): Explicit cache directory. If None, the
+            YASL_CACHE_DIR environment variable is used.
+
+    Returns:
+        Path | None: The cache directory, or None if caching is disabled.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or None
+    if cache_dir is None:
+        return None
+    return Path(cache_dir)
+
+
+def file_digest(path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class SchemaCache:
+    """
+    On-disk cache of parsed YASL schema files.
+
+    Each entry belongs to a root schema file and holds the validated YaslRoot
+    documents of that file and of its whole import closure, in the order their
+    definitions were generated, together with a content hash of every file in
+    the closure.  An entry is only used when every one of those hashes still
+    matches, so editing any imported file invalidates it automatically, and
+    only by the YASL version that wrote it.
+
+    Entries are stored with pickle, so the cache directory must be as trusted
+    as the schemas themselves.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, path: str | Path) -> Path:
+        key = hashlib.sha256(str(Path(path).resolve()).encode()).hexdigest()
+        return self.cache_dir / "schemas" / f"{key}.pickle"
+
+    def load(self, path: str | Path) -> list[tuple[str, YaslRoot]] | None:
+        """
+        Look up the cached documents for a root schema file.
+
+        Args:
+            path (str | Path): The root schema file.
+
+        Returns:
+            list[tuple[str, YaslRoot]] | None: The (file, document) pairs in
+            generation order, or None on a cache miss.
+        """
+        log = logging.getLogger("yasl")
+        entry_path = self._entry_path(path)
+        if not entry_path.exists():
+            return None
+        try:
+            with open(entry_path, "rb") as f:
+                entry: dict[str, Any] = pickle.load(f)
+            if entry.get("version") != SCHEMA_CACHE_VERSION:
+                return None
+            if entry.get("yasl_version") != advanced_yaml_version():
+                log.debug(f"Schema cache for '{path}' was written by another version")
+                return None
+            for file_path, digest in entry["files"].items():
+                if not Path(file_path).exists() or file_digest(file_path) != digest:
+                    log.debug(f"Schema cache for '{path}' is stale ('{file_path}')")
+                    return None
+            return entry["documents"]
+        except Exception as e:
+            log.debug(f"Ignoring unreadable schema cache entry for '{path}' - {e}")
+            return None
+
+    def store(self, path: str | Path, documents: list[tuple[str, YaslRoot]]) -> None:
+        """
+        Store the documents of a root schema file and its import closure.
+
+        Args:
+            path (str | Path): The root schema file.
+            documents (list[tuple[str, YaslRoot]]): The (file, document) pairs
+                in generation order.
+        """
+        log = logging.getLogger("yasl")
+        entry_path = self._entry_path(path)
+        try:
+            files = {
+                str(Path(file_path).resolve()): file_digest(file_path)
+                for file_path in {path, *(file_path for file_path, _ in documents)}
+            }
+            entry = {
+                "version": SCHEMA_CACHE_VERSION,
+                "yasl_version": advanced_yaml_version(),
+                "files": files,
+                "documents": documents,
+            }
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, entry_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            log.debug(f"Stored schema cache entry for '{path}'")
+        except Exception as e:
+            log.debug(f"Unable to write schema cache entry for '{path}' - {e}")
+
+    def discard(self, path: str | Path) -> None:
+        """Remove the entry of a root schema file, if there is one."""
+        self._entry_path(path).unlink(missing_ok=True)
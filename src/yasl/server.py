@@ -0,0 +1,265 @@
+"""
+The `yasl serve` validation daemon.
+
+The daemon listens on a Unix domain socket and keeps the models of the last
+schema it loaded in memory, so a validation request only pays for reading
+and validating its data.  Changed schema files are picked up on the next
+request, generating only the affected namespaces again (see
+`yasl.watch.SchemaSet`).
+
+Requests and responses are JSON objects, one per line.  A validation request
+looks like::
+
+    {"cwd": "/work", "schema": "schemas", "data": ["data/a.yaml"],
+     "documents": [{"name": "inline.yaml", "text": "name: x"}],
+     "model_name": null, "fast": false, "stream": false,
+     "defer_refs": false, "verbose": false, "cache_dir": null}
+
+Relative paths are resolved against `cwd`.  Only `schema` is required.  The
+response reports the overall result, the result of each file and inline
+document, and the log messages a `yasl` run would print::
+
+    {"valid": false,
+     "files": [{"path": "data/a.yaml", "valid": false}, ...],
+     "log": [{"level": "ERROR", "message": "❌ ..."}, ...],
+     "elapsed": 0.004}
+
+`{"command": "ping"}` returns the daemon's version, and
+`{"command": "shutdown"}` stops it.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import time
+from pathlib import Path
+from typing import Any, cast
+
+from yasl.cache import YaslRegistry
+from yasl.client import is_private_socket, socket_path
+from yasl.core import (
+    _iter_documents,
+    check_references,
+    check_urls_reachable,
+    find_files,
+    validate_data_file,
+    yasl_version,
+)
+from yasl.watch import SchemaSet
+
+
+class _LogCollector(logging.Handler):
+    """Collects the log records of one request as response entries."""
+
+    def __init__(self, level: int):
+        super().__init__(level)
+        self.entries: list[dict[str, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entries.append({"level": record.levelname, "message": record.getMessage()})
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server = cast(ValidationServer, self.server)
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("a request must be a JSON object")
+                response = server.handle_command(request)
+            except Exception as e:
+                response = {"valid": False, "error": f"{type(e).__name__} - {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if server.stopping:
+                return
+
+
+class ValidationServer(socketserver.UnixStreamServer):
+    """
+    Validates YAML data for clients connecting to a Unix domain socket.
+    Requests are handled one at a time, since they share the YaslRegistry.
+
+    Args:
+        path (str): The socket to listen on.
+    """
+
+    def __init__(self, path: str):
+        self.schemas: SchemaSet | None = None
+        self.stopping = False
+        # create the socket private to this user, so no other user can
+        # connect to it before its mode is set
+        umask = os.umask(0o077)
+        try:
+            super().__init__(path, _RequestHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(path, 0o600)
+
+    def handle_command(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Handle a request object and return the response object.
+
+        Args:
+            request (dict[str, Any]): The request, see the module documentation.
+
+        Returns:
+            dict[str, Any]: The response.
+        """
+        command = request.get("command", "validate")
+        if command == "ping":
+            return {"ok": True, "version": yasl_version(), "pid": os.getpid()}
+        if command == "shutdown":
+            self.stopping = True
+            return {"ok": True}
+        if command != "validate":
+            raise ValueError(f"unknown command '{command}'")
+        if not request.get("schema"):
+            raise ValueError("a validation request needs a 'schema'")
+        log = logging.getLogger("yasl")
+        collector = _LogCollector(
+            logging.DEBUG if request.get("verbose") else logging.INFO
+        )
+        level, propagate = log.level, log.propagate
+        log.setLevel(collector.level)
+        log.propagate = False
+        log.addHandler(collector)
+        cwd = os.getcwd()
+        start = time.perf_counter()
+        try:
+            os.chdir(request.get("cwd") or cwd)
+            valid, files = self.validate(request)
+        finally:
+            os.chdir(cwd)
+            log.removeHandler(collector)
+            log.setLevel(level)
+            log.propagate = propagate
+        elapsed = time.perf_counter() - start
+        log.info(
+            f"{'✅' if valid else '❌'} Validated {len(files)} YAML files in {elapsed * 1000:.1f} ms"
+        )
+        return {
+            "valid": valid,
+            "files": files,
+            "log": collector.entries,
+            "elapsed": elapsed,
+        }
+
+    def validate(self, request: dict[str, Any]) -> tuple[bool, list[dict[str, Any]]]:
+        """
+        Validate the data files and inline documents of a request against its
+        schema, loading the schema only if it is new or changed.
+
+        Returns:
+            tuple[bool, list[dict[str, Any]]]: Whether all data is valid, and
+            the result of each file and inline document.
+        """
+        registry = YaslRegistry()
+        schema = os.path.abspath(request["schema"])
+        if self.schemas is None or self.schemas.yasl_schema != schema:
+            self.schemas = SchemaSet(schema)
+            self.schemas.load()
+        else:
+            self.schemas.refresh()
+        if not self.schemas.valid:
+            return False, []
+
+        model_name = request.get("model_name")
+        fast = bool(request.get("fast"))
+        stream = bool(request.get("stream"))
+        valid = True
+        paths: list[Path] = []
+        for data in request.get("data") or []:
+            found = find_files(data, ".yaml", "YAML data")
+            if found is None:
+                valid = False
+            else:
+                paths.extend(found)
+
+        registry.clear_unique_values()
+        registry.pending_unique_values.clear()
+        registry.pending_references.clear()
+        registry.pending_urls.clear()
+        registry.record_unique_values = False
+        registry.defer_references = bool(request.get("defer_refs"))
+        registry.defer_url_checks = True
+        results: list[dict[str, Any]] = []
+        references: list[tuple[Path, dict[str, set]]] = []
+        urls: list[tuple[Path, set[str]]] = []
+        try:
+            for path in paths:
+                file_valid = bool(validate_data_file(path, model_name, stream, fast))
+                if not file_valid:
+                    logging.getLogger("yasl").error(
+                        f"❌ Validation failed. Unable to validate data in YAML file {path}."
+                    )
+                results.append({"path": str(path), "valid": file_valid})
+                references.append((path, registry.take_pending_references()))
+                urls.append((path, registry.take_pending_urls()))
+            for document in request.get("documents") or []:
+                name = document.get("name") or "<inline>"
+                document_valid = all(
+                    result is not None
+                    for result in _iter_documents(
+                        io.StringIO(document.get("text", "")), name, model_name, False
+                    )
+                )
+                results.append({"path": name, "valid": document_valid})
+                references.append((Path(name), registry.take_pending_references()))
+                urls.append((Path(name), registry.take_pending_urls()))
+            valid = valid and all(result["valid"] for result in results)
+            if registry.defer_references:
+                valid = check_references(references) and valid
+            valid = check_urls_reachable(urls, request.get("cache_dir")) and valid
+        finally:
+            registry.clear_unique_values()
+            registry.defer_references = False
+            registry.defer_url_checks = False
+        return valid, results
+
+
+def serve(path: str | None = None) -> bool:
+    """
+    Run the validation daemon until it is told to shut down or interrupted.
+
+    Args:
+        path (str | None): The socket to listen on, see `yasl.client.socket_path`.
+
+    Returns:
+        bool: False if another daemon is already listening on the socket.
+    """
+    log = logging.getLogger("yasl")
+    path = socket_path(path)
+    if os.path.exists(path) and not is_private_socket(path):
+        log.error(
+            f"❌ '{path}' exists and is not a socket owned by and private to this user"
+        )
+        return False
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+            except OSError:
+                # left behind by a daemon that did not shut down cleanly
+                os.unlink(path)
+            else:
+                log.error(f"❌ A YASL daemon is already listening on '{path}'")
+                return False
+    server = ValidationServer(path)
+    log.info(f"👂 YASL {yasl_version()} listening on '{path}'")
+    try:
+        while not server.stopping:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+        YaslRegistry().clear_caches()
+    log.info("Stopped serving")
+    return True
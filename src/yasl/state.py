@@ -0,0 +1,201 @@
+"""
+Validation state for incremental runs.
+
+`ValidationState` keeps a SQLite database in the cache directory with a row
+for every YAML data file that passed validation: its size, modification time
+and content hash, the schema it was validated against, and what it
+contributed to cross-file checks (unique values, ref[...] values and URLs).
+
+An incremental run only re-validates files whose content changed.  The
+contributions of unchanged files are loaded from the database, so unique
+values, references and URLs are still checked across all files.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from yasl.schema_cache import file_digest
+
+# Bump whenever the layout of the database or of a FileRecord changes.
+STATE_VERSION = 1
+
+STATE_FILE = "state.sqlite"
+
+
+class FileRecord(NamedTuple):
+    """What a validated YAML data file contributed to cross-file checks."""
+
+    unique_values: dict[tuple[str, str | None], dict[str, set]]
+    references: dict[str, set]
+    urls: set[str]
+
+
+def _pack(record: FileRecord) -> bytes:
+    # flat tuples load several times faster than nested dicts of sets
+    return pickle.dumps(
+        (
+            tuple(
+                (type_name, type_namespace, property_name, value)
+                for (
+                    type_name,
+                    type_namespace,
+                ), properties in record.unique_values.items()
+                for property_name, values in properties.items()
+                for value in values
+            ),
+            tuple(
+                (target, value)
+                for target, values in record.references.items()
+                for value in values
+            ),
+            tuple(record.urls),
+        ),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def _unpack(data: bytes) -> FileRecord:
+    unique_entries, reference_entries, urls = pickle.loads(data)
+    unique_values: dict[tuple[str, str | None], dict[str, set]] = {}
+    for type_name, type_namespace, property_name, value in unique_entries:
+        unique_values.setdefault((type_name, type_namespace), {}).setdefault(
+            property_name, set()
+        ).add(value)
+    references: dict[str, set] = {}
+    for target, value in reference_entries:
+        references.setdefault(target, set()).add(value)
+    return FileRecord(unique_values, references, set(urls))
+
+
+def schema_key(documents: Iterable[Any], model_name: str | None, version: str) -> str:
+    """
+    Return a key for the schema a run validates against.
+
+    Args:
+        documents (Iterable[Any]): The loaded YaslRoot documents.
+        model_name (str | None): The model name given for validation.
+        version (str): The YASL version.
+
+    Returns:
+        str: A hex digest that changes whenever the schema, the model name or
+        the YASL version does.
+    """
+    digest = hashlib.sha256(f"{STATE_VERSION}\0{version}\0{model_name}".encode())
+    for document in documents:
+        digest.update(b"\0")
+        digest.update(document.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+class ValidationState:
+    """
+    Incremental validation state of the YAML data files checked against one schema.
+
+    Args:
+        cache_dir (str | Path): Directory holding the state database.
+        key (str): The `schema_key` of the run; rows stored under another key
+            are ignored.
+    """
+
+    def __init__(self, cache_dir: str | Path, key: str):
+        self.path = Path(cache_dir) / STATE_FILE
+        self.key = key
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT, "
+            "schema_key TEXT, record BLOB)"
+        )
+
+    def __enter__(self) -> "ValidationState":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commit the stored records and close the database."""
+        self._connection.commit()
+        self._connection.close()
+
+    def partition(
+        self, paths: Sequence[Path]
+    ) -> tuple[list[Path], list[tuple[Path, FileRecord]]]:
+        """
+        Split YAML data files into those that must be validated and those
+        whose stored record is still current.
+
+        A file is current if its size and modification time are unchanged, or
+        if its content hash is.
+
+        Args:
+            paths (Sequence[Path]): The YAML data files of the run.
+
+        Returns:
+            tuple[list[Path], list[tuple[Path, FileRecord]]]: The files to
+            validate, and the current files with their records, in input order.
+        """
+        log = logging.getLogger("yasl")
+        rows = {
+            row[0]: row[1:]
+            for row in self._connection.execute(
+                "SELECT path, size, mtime_ns, digest, record FROM files "
+                "WHERE schema_key = ?",
+                (self.key,),
+            )
+        }
+        changed: list[Path] = []
+        current: list[tuple[Path, FileRecord]] = []
+        touched = []
+        cwd = os.getcwd()
+        for path in paths:
+            name = os.path.normpath(os.path.join(cwd, path))
+            row = rows.get(name)
+            if row is None:
+                changed.append(path)
+                continue
+            size, mtime_ns, digest, record = row
+            stat = os.stat(path)
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                if stat.st_size != size or file_digest(path) != digest:
+                    changed.append(path)
+                    continue
+                touched.append((stat.st_size, stat.st_mtime_ns, name))
+            try:
+                current.append((path, _unpack(record)))
+            except Exception as e:
+                log.debug(f"Ignoring unreadable validation state of '{path}' - {e}")
+                changed.append(path)
+        if touched:
+            self._connection.executemany(
+                "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", touched
+            )
+        return changed, current
+
+    def store(self, path: Path, record: FileRecord) -> None:
+        """
+        Record a YAML data file that passed validation.
+
+        Args:
+            path (Path): The YAML data file.
+            record (FileRecord): What the file contributed to cross-file checks.
+        """
+        stat = os.stat(path)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                os.path.abspath(path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                file_digest(path),
+                self.key,
+                _pack(record),
+            ),
+        )
@@ -1,18 +1,31 @@
 import datetime
-import logging
 import re
+import threading
 from collections.abc import Callable
+from enum import Enum
 from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
-import markdown_it
-import requests
-from pydantic import field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 from yasl.cache import YaslRegistry
+from yasl.locations import warn
+from yasl.primitives import PRIMITIVE_TYPE_MAP
 from yasl.pydantic_types import IfThen, Property, TypeDef
+from yasl.reachability import UrlChecker
+from yasl.schema_cache import resolve_cache_dir
+
+if TYPE_CHECKING:
+    import markdown_it
 
 
 def unique_value_validator(
@@ -90,9 +103,9 @@ def str_max_validator(cls, value: str, max_length: int):
     return value
 
 
-def str_regex_validator(cls, value: str, regex: str):
-    if not re.fullmatch(regex, value):
-        raise ValueError(f"Value '{value}' does not match pattern '{regex}'")
+def str_regex_validator(cls, value: str, pattern: re.Pattern[str]):
+    if not pattern.fullmatch(value):
+        raise ValueError(f"Value '{value}' does not match pattern '{pattern.pattern}'")
     return value
 
 
@@ -142,14 +155,13 @@ def url_protocol_validator(cls, value: str, protocols: list[str]):
 
 def url_reachable_valiator(cls, value: str, reachable: bool):
     if reachable:
-        try:
-            response = requests.head(value, allow_redirects=True, timeout=3)
-            if response.status_code >= 400:
-                raise ValueError(
-                    f"URL '{value}' is not reachable (status {response.status_code})"
-                )
-        except requests.RequestException as e:
-            raise ValueError(f"URL '{value}' is not reachable: {e}") from e
+        registry = YaslRegistry()
+        if registry.defer_url_checks:
+            registry.register_url(value)
+            return value
+        error = UrlChecker(resolve_cache_dir()).check([value])[value]
+        if error is not None:
+            raise ValueError(error)
     return value
 
 
@@ -193,12 +205,16 @@ def path_exists_validator(cls, value: str, exists: bool):
 
 # ref validators
 def ref_exists_validator(cls, value: Any, target: str):
+    registry = YaslRegistry()
+    if registry.defer_references:
+        registry.register_reference(target, value)
+        return value
+
     type_name, property_name = target.rsplit(".", 1)
     type_namespace = None
     if type_name and "." in type_name:
         type_namespace, type_name = type_name.rsplit(".", 1)
 
-    registry = YaslRegistry()
     if not registry.unique_value_exists(
         type_name, property_name, value, type_namespace
     ):
@@ -210,25 +226,181 @@ def ref_exists_validator(cls, value: Any, target: str):
 
 
 # any validator
-def any_of_validator(cls, value: Any, any_of: list[str]):
-    for t in any_of:
-        if t.endswith("[]"):
-            elem_type = t[:-2]
-            if isinstance(value, list) and all(
-                isinstance(v, eval(elem_type)) for v in value
-            ):
-                return value
+# container types allowed in any_of besides the YASL primitives
+_ANY_OF_BUILTINS: dict[str, type] = {"list": list, "dict": dict}
+
+
+class AnyOf:
+    """
+    The types allowed by an any_of constraint, resolved once when the schema
+    is compiled.  A value matches if it is an instance of one of the types, is
+    a value of one of the enums, passes one of the primitive type adapters, is
+    a mapping that validates against one of the YASL types, or is a list whose
+    items all match one of the `name[]` entries.
+
+    Args:
+        names (list[str]): The type names, for messages.
+        types (tuple[type, ...]): The types of the plain names.
+        values (frozenset[str]): The member values of the enums among them.
+        adapters (tuple[TypeAdapter, ...]): Validators of the primitive types
+            whose values are not instances of a class, such as quantities,
+            constrained numbers and EmailStr.
+        items (tuple[AnyOf, ...]): The item type of each `name[]` entry.
+    """
+
+    __slots__ = ("names", "types", "values", "adapters", "items")
+
+    def __init__(
+        self,
+        names: list[str],
+        types: tuple[type, ...],
+        values: frozenset[str],
+        adapters: tuple[TypeAdapter, ...] = (),
+        items: tuple["AnyOf", ...] = (),
+    ):
+        self.names = names
+        self.types = types
+        self.values = values
+        self.adapters = adapters
+        self.items = items
+
+    def matches(self, value: Any) -> bool:
+        if self._matches_type(value):
+            return True
+        return isinstance(value, list) and any(
+            all(item.matches(v) for v in value) for item in self.items
+        )
+
+    def _matches_type(self, value: Any) -> bool:
+        if isinstance(value, self.types):
+            return True
+        # enum member values are strings; other values may not even be hashable
+        if isinstance(value, str) and value in self.values:
+            return True
+        for adapter in self.adapters:
+            try:
+                adapter.validate_python(value)
+                return True
+            except ValidationError:
+                pass
+        if isinstance(value, dict):
+            for py_type in self.types:
+                if isinstance(py_type, type) and issubclass(py_type, BaseModel):
+                    try:
+                        py_type.model_validate(value)
+                        return True
+                    except ValidationError:
+                        pass
+        return False
+
+
+def resolve_any_of(
+    any_of: list[str],
+    namespace: str | None,
+    lookup_type: Callable[..., Any] | None = None,
+) -> AnyOf:
+    """
+    Resolve the type names of an any_of constraint to Python types.
+
+    Args:
+        any_of (list[str]): Primitive, map, enum or type names; `name[]`
+            allows a list whose items are all of that type.
+        namespace (str | None): The namespace to resolve enum and type names in.
+        lookup_type (Callable[..., Any] | None): Resolves type names, with the
+            arguments of `YaslRegistry.get_type`; the registry's `get_type`
+            if not given.
+
+    Returns:
+        AnyOf: The resolved types.
+
+    Raises:
+        ValueError: If a name is not a known type, or is a primitive type that
+            values cannot be checked against.
+    """
+    registry = YaslRegistry()
+    lookup_type = lookup_type or registry.get_type
+    entries: list[AnyOf] = []
+    items: list[AnyOf] = []
+    for name in any_of:
+        is_list = name.endswith("[]")
+        type_name = name[:-2] if is_list else name
+        if type_name in _ANY_OF_BUILTINS:
+            entry = AnyOf([type_name], (_ANY_OF_BUILTINS[type_name],), frozenset())
+        elif type_name.startswith("map[") and type_name.endswith("]"):
+            entry = AnyOf([type_name], (dict,), frozenset())
+        elif type_name in PRIMITIVE_TYPE_MAP:
+            entry = _primitive_any_of(type_name, PRIMITIVE_TYPE_MAP[type_name])
         else:
-            if isinstance(value, eval(t)):
-                return value
-    raise ValueError(f"Value '{value}' must be one of {any_of}")
+            type_namespace, short_name = None, type_name
+            if "." in type_name:
+                type_namespace, short_name = type_name.rsplit(".", 1)
+            # the registry returns enum classes, typed as members
+            enum_type: Any = registry.get_enum(short_name, type_namespace, namespace)
+            if enum_type is not None:
+                entry = AnyOf([type_name], (enum_type,), enum_values(enum_type))
+            else:
+                py_type = lookup_type(short_name, type_namespace, namespace)
+                if py_type is None:
+                    raise ValueError(f"Unknown type '{name}' in any_of {any_of}")
+                entry = AnyOf([type_name], (py_type,), frozenset())
+        (items if is_list else entries).append(entry)
+    return AnyOf(
+        any_of,
+        tuple(t for entry in entries for t in entry.types),
+        frozenset().union(*(entry.values for entry in entries)),
+        tuple(a for entry in entries for a in entry.adapters),
+        tuple(items),
+    )
+
+
+def _primitive_any_of(name: str, annotation: Any) -> AnyOf:
+    """
+    Resolve a primitive type for any_of.  Plain classes are checked with
+    isinstance; types whose values are plain strings or numbers, such as
+    quantities, constrained numbers and EmailStr, are validated with a
+    TypeAdapter.
+    """
+    if annotation is Any:
+        return AnyOf([name], (object,), frozenset())
+    if isinstance(annotation, type) and not hasattr(
+        annotation, "__get_pydantic_core_schema__"
+    ):
+        return AnyOf([name], (annotation,), frozenset())
+    try:
+        adapter = TypeAdapter(annotation)
+    except Exception as e:
+        raise ValueError(f"Type '{name}' cannot be used in any_of - {e}") from e
+    return AnyOf([name], (), frozenset(), (adapter,))
+
+
+def any_of_validator(cls, value: Any, any_of: AnyOf):
+    if not any_of.matches(value):
+        raise ValueError(f"Value '{value}' must be one of {any_of.names}")
+    return value
 
 
 # enum validator
-def enum_validator(cls, value: Any, values: list[str]):
-    str_value = str(value)
-    if str_value.split(".")[-1] not in values:
-        raise ValueError(f"Value '{value}' must be one of {values}")
+# the member values of each enum type, built once per type
+_enum_values: WeakKeyDictionary[type[Enum], frozenset[str]] = WeakKeyDictionary()
+
+
+def enum_values(enum_type: type[Enum]) -> frozenset[str]:
+    """Return the member values of an enum type as a set."""
+    values = _enum_values.get(enum_type)
+    if values is None:
+        values = frozenset(member.value for member in enum_type)
+        _enum_values[enum_type] = values
+    return values
+
+
+def enum_validator(cls, value: Any, enum_type: type[Enum], values: frozenset[str]):
+    # pydantic has already converted valid values to members
+    if isinstance(value, enum_type):
+        return value
+    if str(value).split(".")[-1] not in values:
+        raise ValueError(
+            f"Value '{value}' must be one of {[member.value for member in enum_type]}"
+        )
     return value
 
 
@@ -238,7 +410,7 @@ def map_validator(
     value: dict[Any, Any],
     key_type: str,
     value_type: str,
-    any_of: list[str] | None = None,
+    any_of: AnyOf | None = None,
 ):
     # validate key type is str, int, or an enumation
     registry = YaslRegistry()
@@ -253,16 +425,39 @@ def map_validator(
         raise ValueError(f"Map key type '{key_type}' is not supported")
     # validate value type of any is allowed by constraints
     if value_type == "any" and any_of is not None:
-        if not any(isinstance(v, eval(t)) for t in any_of for v in value.values()):
-            raise ValueError(f"Map values must be one of {any_of}")
+        if not all(any_of.matches(v) for v in value.values()):
+            raise ValueError(f"Map values must be one of {any_of.names}")
     return value
 
 
 # markdown validator
-def markdown_validator(cls, value: str):
+# one parser per thread, created on first use; a MarkdownIt instance keeps
+# per-parse state, and building one costs far more than a parse
+_markdown = threading.local()
+
+
+def markdown_parser() -> "markdown_it.MarkdownIt":
+    """Return this thread's `markdown_it.MarkdownIt` parser."""
+    parser = getattr(_markdown, "parser", None)
+    if parser is None:
+        import markdown_it
+
+        parser = _markdown.parser = markdown_it.MarkdownIt()
+    return parser
+
+
+def markdown_validator(cls, value: str, strict: bool = False):
+    if not strict:
+        # any text is markdown; only require text that can be written as UTF-8
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Markdown content is empty or invalid.")
+        try:
+            value.encode("utf-8")
+        except UnicodeEncodeError as e:
+            raise ValueError("Markdown content is not valid UTF-8 text.") from e
+        return value
     try:
-        md = markdown_it.MarkdownIt()
-        tokens = md.parse(value)
+        tokens = markdown_parser().parse(value)
         if not tokens:
             raise ValueError("Markdown content is empty or invalid.")
         return value
@@ -276,8 +471,13 @@ def property_validator_factory(
     type_def: TypeDef,
     property_name: str,
     property: Property,
+    lookup_type: Callable[..., Any] | None = None,
 ) -> Callable:
     validators = []
+    # any_of names are resolved once here rather than for every value
+    any_of = None
+    if property.any_of is not None:
+        any_of = resolve_any_of(property.any_of, type_namespace, lookup_type)
     # list validators
     if property.list_min is not None:
         validators.append(partial(list_min_validator, bound=property.list_min))
@@ -319,7 +519,10 @@ def property_validator_factory(
     if property.str_max is not None:
         validators.append(partial(str_max_validator, max_length=property.str_max))
     if property.str_regex is not None:
-        validators.append(partial(str_regex_validator, regex=property.str_regex))
+        # compiled once per property; the pattern was checked when the schema loaded
+        validators.append(
+            partial(str_regex_validator, pattern=re.compile(property.str_regex))
+        )
 
     # date validators
     if property.before is not None:
@@ -350,8 +553,8 @@ def property_validator_factory(
         )
 
     # any validator
-    if property.any_of is not None and not property.type.startswith("map[]"):
-        validators.append(partial(any_of_validator, any_of=property.any_of))
+    if any_of is not None and not property.type.startswith("map["):
+        validators.append(partial(any_of_validator, any_of=any_of))
 
     # ref validators (always validate references)
     if property.type.startswith("ref[") and (
@@ -361,15 +564,19 @@ def property_validator_factory(
 
     # enum validators
     registry = YaslRegistry()
-    enum_names: list[tuple[str, str | None]] = registry.get_enums()
-
-    if property.type in dict(enum_names).keys():
+    if registry.has_enum_name(property.type):
         enum_type = registry.get_enum(property.type, type_def.namespace)
         if enum_type is None:
             raise ValueError(
                 f"Enum type '{property.type}' not found for property '{property_name}' in type '{typedef_name}'"
             )
-        validators.append(partial(enum_validator, values=[e.value for e in enum_type]))  # type: ignore
+        validators.append(
+            partial(
+                enum_validator,
+                enum_type=enum_type,  # type: ignore
+                values=enum_values(enum_type),  # type: ignore
+            )
+        )
 
     # map validators
     if property.type.startswith("map["):
@@ -383,13 +590,15 @@ def property_validator_factory(
                 map_validator,
                 key_type=key_type,
                 value_type=value_type,
-                any_of=property.any_of,
+                any_of=any_of,
             )
         )
 
     # markdown validator
     if property.type == "markdown":
-        validators.append(markdown_validator)
+        validators.append(
+            partial(markdown_validator, strict=bool(property.markdown_strict))
+        )
 
     def multi_validator(cls, value):
         for validator in validators:
@@ -400,37 +609,37 @@ def property_validator_factory(
 
 
 # type validators
-def only_one_validator(cls, values: dict[str, Any], fields: list[str]):
-    data_keys = [key for key, val in values.model_dump().items() if val is not None]  # type: ignore
-    if sum(1 for field in fields if field in data_keys) != 1:
+# These run after the instance is built, so presence is read from its attributes
+# directly; serializing the instance would walk the whole nested subtree.
+def only_one_validator(cls, values: BaseModel, fields: list[str]):
+    if sum(1 for field in fields if getattr(values, field, None) is not None) != 1:
         raise ValueError(f"Exactly one of {fields} must be present")
     return values
 
 
-def at_least_one_validator(cls, values: dict[str, Any], fields: list[str]):
-    data_keys = [key for key, val in values.model_dump().items() if val is not None]  # type: ignore
-    if sum(1 for field in fields if field in data_keys) < 1:
+def at_least_one_validator(cls, values: BaseModel, fields: list[str]):
+    if sum(1 for field in fields if getattr(values, field, None) is not None) < 1:
         raise ValueError(f"At least one of {fields} must be present")
     return values
 
 
-def if_then_validator(cls, values: dict[str, Any], if_then: IfThen):
+def if_then_validator(cls, values: BaseModel, if_then: IfThen):
     eval_field = if_then.eval
     eval_value = if_then.value
     present_fields = if_then.present or []
     absent_fields = if_then.absent or []
-    values_dict = values.model_dump()  # type: ignore
-    if eval_field in values_dict:
-        eval_value_type = type(values_dict[eval_field])
+    if eval_field in type(values).model_fields:
+        current_value = getattr(values, eval_field)
+        eval_value_type = type(current_value)
         typed_eval_value = [eval_value_type(v) for v in eval_value]
-        if values_dict[eval_field] in typed_eval_value:
+        if current_value in typed_eval_value:
             for field in present_fields:
-                if field not in values_dict or values_dict[field] is None:
+                if getattr(values, field, None) is None:
                     raise ValueError(
                         f"Field '{field}' must be present when '{eval_field}' is in {eval_value}"
                     )
             for field in absent_fields:
-                if field in values_dict and values_dict[field] is not None:
+                if getattr(values, field, None) is not None:
                     raise ValueError(
                         f"Field '{field}' must be absent when '{eval_field}' is in {eval_value}"
                     )
@@ -438,20 +647,11 @@ def if_then_validator(cls, values: dict[str, Any], if_then: IfThen):
 
 
 def preferred_presence_validator(cls, values: Any, properties: dict[str, Property]):
-    log = logging.getLogger("yasl")
-    values_dict = values.model_dump()
-
-    # Access the hidden yaml_line field if it exists
-    line_info = ""
-    if hasattr(values, "yaml_line") and values.yaml_line is not None:
-        line_info = f" at line {values.yaml_line}"
-
     for prop_name, prop in properties.items():
         if prop.presence == "preferred":
-            if prop_name not in values_dict or values_dict[prop_name] is None:
-                log.warning(
-                    f"⚠️  Warning: Preferred property '{prop_name}' is missing{line_info}"
-                )
+            if getattr(values, prop_name, None) is None:
+                # the line is added once the whole document is validated
+                warn(values, f"⚠️  Warning: Preferred property '{prop_name}' is missing")
     return values
 
 
@@ -0,0 +1,356 @@
+"""
+Watch mode: keep schemas loaded and re-validate data as files change.
+
+`Watcher` loads the YASL schemas once and keeps the generated models in the
+YaslRegistry.  It polls the schema and data files for changes:
+
+* When data files change, only those files (and files that failed before)
+  are validated again.  Unique values of the other files are restored from
+  what they contributed last time, and references are checked across all
+  files.
+* When a schema file changes, only the namespaces it defines, and the
+  namespaces with models that use them, are generated again.  All data
+  files are then validated against the new models.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from yasl.cache import YaslRegistry
+from yasl.core import (
+    _load_schema_file,
+    check_references,
+    check_urls_reachable,
+    find_files,
+    gen_enum_from_enumerations,
+    gen_pydantic_type_models,
+    validate_data_file,
+    yaml_loader,
+)
+from yasl.pydantic_types import YaslRoot
+from yasl.state import FileRecord
+
+# Seconds between two polls of the watched files.
+WATCH_INTERVAL = 0.5
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _changed_files(
+    stats: dict[Path, tuple[int, int] | None], files: Iterable[Path]
+) -> set[Path]:
+    """Update `stats` for `files`, returning the files added, changed or removed."""
+    current = {path: _stat(path) for path in files}
+    changed = {
+        path
+        for path in current.keys() | stats.keys()
+        if current.get(path) != stats.get(path)
+    }
+    stats.clear()
+    stats.update(current)
+    return changed
+
+
+class SchemaSet:
+    """
+    The models generated from YASL schemas, kept up to date with the schema files.
+
+    Args:
+        yasl_schema (str): Path to the YASL schema file or directory.
+    """
+
+    def __init__(self, yasl_schema: str):
+        self.yasl_schema = yasl_schema
+        # every schema document in generation order, with the file it is in
+        self.documents: list[tuple[str, YaslRoot]] = []
+        # the schema files loaded, still watched while a schema fails to load
+        self.loaded: set[Path] = set()
+        self.stats: dict[Path, tuple[int, int] | None] = {}
+        self.valid = False
+
+    def files(self) -> set[Path]:
+        """The schema files given, and every file they import, as absolute paths."""
+        roots = find_files(self.yasl_schema, ".yasl", "YASL schema", sort=False) or []
+        return {path.resolve() for path in roots} | self.loaded
+
+    def load(self) -> bool:
+        """
+        Load all schemas from scratch.
+
+        Returns:
+            bool: True if all schemas loaded.
+        """
+        log = logging.getLogger("yasl")
+        registry = YaslRegistry()
+        registry.clear_caches()
+        self.documents = []
+        yasl_files = find_files(self.yasl_schema, ".yasl", "YASL schema", sort=False)
+        valid = yasl_files is not None
+        for yasl_file in yasl_files or []:
+            if _load_schema_file(str(yasl_file), self.documents) is None:
+                log.error("❌ YASL schema validation failed.")
+                valid = False
+                break
+        loaded = {Path(file_path) for file_path, _ in self.documents}
+        self.loaded = loaded if valid else self.loaded | loaded
+        _changed_files(self.stats, self.files())
+        self.valid = valid
+        return valid
+
+    def refresh(self) -> bool | None:
+        """
+        Generate the models of changed schema files again.
+
+        Returns:
+            bool | None: None if no schema file changed, otherwise True if
+            the schemas loaded after the change.
+        """
+        log = logging.getLogger("yasl")
+        changed = _changed_files(self.stats, self.files())
+        if not changed:
+            return None
+        log.info(
+            f"--- Schema changed: {', '.join(str(p) for p in sorted(changed))} ---"
+        )
+        self.valid = self._reload(changed)
+        return self.valid
+
+    def _reload(self, changed: set[Path]) -> bool:
+        """
+        Generate the namespaces defined in changed schema files again, with
+        the namespaces that depend on them.  Anything else, such as added or
+        removed files or changed imports, reloads all schemas.
+        """
+        log = logging.getLogger("yasl")
+        registry = YaslRegistry()
+        if not self.valid:
+            return self.load()
+        by_file: dict[str, list[YaslRoot]] = {}
+        for file_path, yasl in self.documents:
+            by_file.setdefault(file_path, []).append(yasl)
+        try:
+            replaced: dict[str, list[YaslRoot]] = {}
+            for path in changed:
+                file_path = path.as_posix()
+                if file_path not in by_file or not path.exists():
+                    raise LookupError(f"'{path}' was added or removed")
+                with open(path) as f:
+                    new_docs = [YaslRoot(**data) for data in yaml_loader().load_all(f)]
+                old_docs = by_file[file_path]
+                if [d.imports for d in new_docs] != [d.imports for d in old_docs]:
+                    raise LookupError(f"imports of '{path}' changed")
+                if len(new_docs) != len(old_docs):
+                    raise LookupError(f"documents of '{path}' changed")
+                replaced[file_path] = new_docs
+        except Exception as e:
+            log.debug(f"Reloading all schemas - {e}")
+            return self.load()
+
+        affected: set[str] = set()
+        for file_path, new_docs in replaced.items():
+            for yasl in [*by_file[file_path], *new_docs]:
+                affected.update(yasl.definitions or {})
+        # namespaces with models that use the affected ones are generated again too
+        uses = registry.get_type_uses()
+        while True:
+            dependents = {
+                namespace
+                for (_, namespace), used in uses.items()
+                if namespace is not None
+                and namespace not in affected
+                and not used.isdisjoint(affected)
+            }
+            if not dependents:
+                break
+            affected |= dependents
+        log.debug(f"Generating namespaces {sorted(map(str, affected))} again")
+
+        positions: dict[str, int] = {}
+        documents = []
+        for file_path, yasl in self.documents:
+            if file_path in replaced:
+                index = positions.get(file_path, 0)
+                positions[file_path] = index + 1
+                yasl = replaced[file_path][index]
+            documents.append((file_path, yasl))
+        try:
+            for namespace in affected:
+                registry.remove_namespace(namespace)
+            for _, yasl in documents:
+                definitions = {
+                    namespace: item
+                    for namespace, item in (yasl.definitions or {}).items()
+                    if namespace in affected
+                }
+                for namespace, item in definitions.items():
+                    if item.enums is not None:
+                        gen_enum_from_enumerations(namespace, item.enums)
+                for namespace, item in definitions.items():
+                    if item.types is not None:
+                        gen_pydantic_type_models(namespace, item.types)
+        except Exception as e:
+            log.error(f"❌ An schema error occurred - {type(e)} - {e}")
+            log.debug("Reloading all schemas")
+            return self.load()
+        self.documents = documents
+        self.loaded = {Path(file_path) for file_path, _ in documents}
+        return True
+
+
+class Watcher:
+    """
+    Validates YAML data against YASL schemas, and again whenever files change.
+
+    Args:
+        yasl_schema (str): Path to the YASL schema file or directory.
+        yaml_data (str): Path to the YAML data file or directory.
+        model_name (str | None): Specific model name to use for validation.
+        cache_dir (str | None): Directory for the URL result cache.
+        fast (bool): If True, parse data files with the C-accelerated safe loader.
+    """
+
+    def __init__(
+        self,
+        yasl_schema: str,
+        yaml_data: str,
+        model_name: str | None = None,
+        cache_dir: str | None = None,
+        fast: bool = False,
+    ):
+        self.schemas = SchemaSet(yasl_schema)
+        self.yaml_data = yaml_data
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self.fast = fast
+        self.data_stats: dict[Path, tuple[int, int] | None] = {}
+        # what each data file that passed contributed to cross-file checks
+        self.records: dict[Path, FileRecord] = {}
+        self.failed: set[Path] = set()
+
+    def start(self) -> bool:
+        """
+        Load the schemas and validate all data files.
+
+        Returns:
+            bool: True if the schemas loaded and all data is valid.
+        """
+        data_files = self._data_files()
+        _changed_files(self.data_stats, data_files)
+        if not self.schemas.load():
+            return False
+        return self._validate(data_files, all_files=True)
+
+    def poll_once(self) -> bool | None:
+        """
+        Check the watched files once and validate what changed.
+
+        Returns:
+            bool | None: None if nothing changed, otherwise True if the
+            schemas loaded and all data is valid after the change.
+        """
+        log = logging.getLogger("yasl")
+        schemas = self.schemas.refresh()
+        data_files = self._data_files()
+        data_changed = _changed_files(self.data_stats, data_files)
+        if schemas is None and not data_changed:
+            return None
+        if not self.schemas.valid:
+            return False
+        if schemas is not None:
+            return self._validate(data_files, all_files=True)
+        log.info(
+            f"--- Data changed: {', '.join(str(p) for p in sorted(data_changed))} ---"
+        )
+        return self._validate(data_files, changed=data_changed)
+
+    def run(self, interval: float = WATCH_INTERVAL) -> None:
+        """Validate, then poll for changes until interrupted."""
+        log = logging.getLogger("yasl")
+        self.start()
+        log.info(
+            f"👀 Watching '{self.schemas.yasl_schema}' and '{self.yaml_data}' for changes"
+        )
+        try:
+            while True:
+                time.sleep(interval)
+                self.poll_once()
+        except KeyboardInterrupt:
+            log.info("Stopped watching")
+        finally:
+            YaslRegistry().clear_caches()
+
+    def _data_files(self) -> list[Path]:
+        return find_files(self.yaml_data, ".yaml", "YAML data") or []
+
+    def _validate(
+        self,
+        data_files: list[Path],
+        changed: set[Path] | None = None,
+        all_files: bool = False,
+    ) -> bool:
+        """
+        Validate the changed data files, and those that failed before,
+        keeping what the other files contributed.
+        """
+        log = logging.getLogger("yasl")
+        registry = YaslRegistry()
+        if all_files:
+            self.records.clear()
+            self.failed = set(data_files)
+        for path in changed or ():
+            self.records.pop(path, None)
+        present = set(data_files)
+        self.failed &= present
+        todo = [p for p in data_files if p in self.failed or p in (changed or ())]
+
+        for path in [p for p in self.records if p not in present]:
+            del self.records[path]
+        registry.clear_unique_values()
+        registry.record_unique_values = False
+        for record in self.records.values():
+            registry.register_unique_values(record.unique_values)
+        registry.pending_unique_values.clear()
+        registry.pending_references.clear()
+        registry.pending_urls.clear()
+        registry.defer_references = True
+        registry.defer_url_checks = True
+        registry.record_unique_values = True
+
+        valid = True
+        for path in todo:
+            results = validate_data_file(path, self.model_name, fast=self.fast)
+            record = FileRecord(
+                registry.take_pending_unique_values(),
+                registry.take_pending_references(),
+                registry.take_pending_urls(),
+            )
+            if not results:
+                log.error(
+                    f"❌ Validation failed. Unable to validate data in YAML file {path}."
+                )
+                # the documents that passed must not count as duplicates later
+                registry.discard_unique_values(record.unique_values)
+                self.failed.add(path)
+                valid = False
+                continue
+            self.failed.discard(path)
+            self.records[path] = record
+
+        references = [
+            (p, self.records[p].references) for p in data_files if p in self.records
+        ]
+        urls = [(p, self.records[p].urls) for p in todo if p in self.records]
+        valid = check_references(references) and valid
+        valid = check_urls_reachable(urls, self.cache_dir) and valid
+        if valid:
+            log.info(f"✅ All {len(data_files)} YAML data files are valid")
+        return valid
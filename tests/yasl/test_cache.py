@@ -82,6 +82,81 @@ def test_register_and_get_enum(registry):
     assert registry.get_enum("NonExistent") is None
 
 
+def test_ambiguous_lookup_with_default_namespace(registry):
+    class AnotherUser(BaseModel):
+        id: int
+
+    registry.register_type("User", User, "ns1")
+    registry.register_type("User", AnotherUser, "ns2")
+    registry.register_enum("Color", Color, "ns1")
+    registry.register_enum("Color", Color, "ns2")
+
+    assert registry.get_type("User", default_namespace="ns2") is AnotherUser
+    assert registry.get_enum("Color", default_namespace="ns1") is Color
+    with pytest.raises(ValueError, match="Ambiguous enum name 'Color'"):
+        registry.get_enum("Color", default_namespace="ns3")
+    assert registry.has_enum_name("Color")
+    assert not registry.has_enum_name("User")
+
+
+def test_name_index_is_cleared(registry):
+    registry.register_type("User", User, "ns1")
+    registry.register_enum("Color", Color, "ns1")
+    registry.register_unique_value("User", "name", "bob", "ns1")
+    registry.clear_caches()
+
+    registry.register_type("User", User, "ns2")
+    assert registry.get_type("User") is User
+    assert registry.get_enum("Color") is None
+    assert not registry.unique_value_exists("User", "name", "bob")
+
+
+def test_find_types_for_keys(registry):
+    class Named(BaseModel):
+        name: str
+
+    class Tagged(BaseModel):
+        name: str
+        tags: list[str]
+
+    registry.register_type("User", User, "ns1")
+    registry.register_type("Tagged", Tagged, "ns1")
+    registry.register_type("Named", Named, "ns2")
+
+    # most specific (fewest fields) first
+    assert registry.find_types_for_keys(["name"]) == [
+        ("Named", "ns2"),
+        ("Tagged", "ns1"),
+        ("User", "ns1"),
+    ]
+    assert registry.find_types_for_keys(["tags", "name"]) == [
+        ("Tagged", "ns1"),
+        ("User", "ns1"),
+    ]
+    assert registry.find_types_for_keys(["name", "unknown"]) == []
+    assert registry.find_types_for_keys([]) == [
+        ("Named", "ns2"),
+        ("Tagged", "ns1"),
+        ("User", "ns1"),
+    ]
+
+    registry.clear_caches()
+    assert registry.find_types_for_keys(["name"]) == []
+
+
+def test_unique_value_lookup_by_name(registry):
+    registry.register_unique_value("User", "name", "bob", "ns1")
+    assert registry.unique_value_exists("User", "name", "bob")
+    assert not registry.unique_value_exists("User", "name", "alice")
+
+    registry.register_unique_value("User", "name", "alice", "ns2")
+    with pytest.raises(ValueError, match="Ambiguous type name 'User'"):
+        registry.unique_value_exists("User", "name", "bob")
+
+    registry.clear_unique_values()
+    assert not registry.unique_value_exists("User", "name", "bob")
+
+
 def test_export_schema(registry):
     registry.register_enum("Color", Color, "app")
     registry.register_type("User", User, "app")
@@ -0,0 +1,176 @@
+import importlib.util
+import sys
+import uuid
+
+import pytest
+from schema_data import CUSTOMER_LIST_YASL
+
+from yasl import load_data, load_data_files, load_schema_files
+from yasl.cache import YaslRegistry
+from yasl.cli import main as yasl_cli_main
+from yasl.codegen import compile_schema
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+def import_module(path):
+    name = f"compiled_{uuid.uuid4().hex}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compile_registers_types(registry, tmp_path):
+    schema = tmp_path / "customer.yasl"
+    schema.write_text(CUSTOMER_LIST_YASL)
+    output = tmp_path / "customer_models.py"
+
+    # a schema loaded by the caller is neither seen nor cleared by compiling
+    todo = load_schema_files("features/yasl/data/todo.yasl")
+    assert todo is not None
+    types = registry.get_types()
+    assert compile_schema(str(schema), str(output))
+    assert registry.get_types() == types
+    assert registry.get_type("customer", "acme") is None
+
+    source = output.read_text()
+    assert "ruamel" not in source
+    compile(source, str(output), "exec")
+
+    module = import_module(output)
+    customer = registry.get_type("customer", "acme")
+    assert customer is not None
+    assert customer.__name__ == "customer"
+    assert customer.__module__ == "acme"
+    assert registry.get_enum("customer_status", "acme") is not None
+    assert ("business", "acme", registry.get_type("business", "acme")) in module.TYPES
+
+    result = load_data(
+        {
+            "business_name": "Acme",
+            "customers": [
+                {"name": "Bob", "email": "bob@example.com", "status": "active"},
+            ],
+            "accounts": [{"id": "A1", "account_rep": "Jane", "customer_name": "Bob"}],
+        },
+        "business",
+        "acme",
+    )
+    assert result is not None
+    assert result.accounts[0].customer_name == "Bob"
+
+    # validators from the schema are compiled in as well
+    registry.clear_unique_values()
+    bad = load_data(
+        {
+            "business_name": "Acme",
+            "customers": [
+                {"name": "Bob", "email": "bob@example.com", "status": "active"},
+            ],
+            "accounts": [{"id": "A1", "account_rep": "Jane", "customer_name": "Al"}],
+        },
+        "business",
+        "acme",
+    )
+    assert bad is None
+
+
+def test_compiled_module_can_register_again(registry, tmp_path):
+    output = tmp_path / "todo_models.py"
+    assert compile_schema("features/yasl/data/todo.yasl", str(output))
+
+    module = import_module(output)
+    registry.clear_caches()
+    module.register()
+    module.register()
+
+    results = load_data_files("features/yasl/data/todo.yaml", "list_of_tasks")
+    assert results is not None
+    task = next(iter(results[0].task_list.values()))
+    assert task.complete in (True, False)
+
+
+def test_compile_gh_actions_schema(registry, tmp_path):
+    output = tmp_path / "gh_models.py"
+    assert compile_schema("schemas/gh_actions/github_actions.yasl", str(output))
+
+    import_module(output)
+    results = load_data_files("features/yasl/data/gh_actions_01.yml")
+    assert results is not None
+
+
+def test_compile_missing_schema(registry, tmp_path):
+    assert not compile_schema(str(tmp_path / "missing.yasl"), str(tmp_path / "x.py"))
+    assert not (tmp_path / "x.py").exists()
+
+
+def test_cli_compile(registry, tmp_path, monkeypatch):
+    output = tmp_path / "todo_models.py"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["yasl", "compile", "features/yasl/data/todo.yasl", str(output)],
+    )
+    with pytest.raises(SystemExit) as e:
+        yasl_cli_main()
+    assert e.value.code == 0
+    assert output.exists()
+
+
+def test_compile_quantity_list(registry, tmp_path):
+    schema = tmp_path / "route.yasl"
+    schema.write_text(
+        "definitions:\n"
+        "  maps:\n"
+        "    types:\n"
+        "      route:\n"
+        "        properties:\n"
+        "          legs:\n"
+        "            type: length[]\n"
+    )
+    output = tmp_path / "route_models.py"
+    assert compile_schema(str(schema), str(output))
+    assert "QuantityBatch()" in output.read_text()
+
+    import_module(output)
+    result = load_data({"legs": ["1 km", "500 m"]}, "route", "maps")
+    assert result is not None
+    assert list(result.legs.quantity.value) == [1, 0.5]
+
+
+def test_compile_any_of_types_and_enums(registry, tmp_path):
+    schema = tmp_path / "box.yasl"
+    schema.write_text(
+        "definitions:\n"
+        "  store:\n"
+        "    enums:\n"
+        "      color:\n"
+        "        values: [red, blue]\n"
+        "    types:\n"
+        "      item:\n"
+        "        properties:\n"
+        "          name:\n"
+        "            type: str\n"
+        "      box:\n"
+        "        properties:\n"
+        "          content:\n"
+        "            type: any\n"
+        "            any_of: [item, color, int]\n"
+    )
+    output = tmp_path / "box_models.py"
+    assert compile_schema(str(schema), str(output))
+
+    import_module(output)
+    for content in ({"name": "ball"}, "red", 3):
+        assert load_data({"content": content}, "box", "store") is not None
+    assert load_data({"content": "green"}, "box", "store") is None
+    assert load_data({"content": {"size": 1}}, "box", "store") is None
@@ -0,0 +1,94 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from test_deferred_references import CUSTOMERS_YAML, ORDERS_YAML, STORE_YASL
+
+from yasl import CompiledSchema, ValidationContext, load_schema_files
+from yasl.cache import YaslRegistry
+
+IMPORTING_YASL = """
+imports:
+  - store.yasl
+definitions:
+  shipping:
+    types:
+      parcel:
+        properties:
+          label:
+            type: str
+            presence: required
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "store.yasl").write_text(STORE_YASL)
+    (tmp_path / "shipping.yasl").write_text(IMPORTING_YASL)
+    (tmp_path / "orders.yaml").write_text(ORDERS_YAML)
+    (tmp_path / "customers.yaml").write_text(CUSTOMERS_YAML)
+    return tmp_path
+
+
+def test_load_returns_compiled_schema(registry, store):
+    with ValidationContext() as context:
+        schema = load_schema_files(str(store / "shipping.yasl"))
+    assert isinstance(schema, CompiledSchema)
+    assert schema.registry is context.registry
+    # the documents of the file itself, and every generated document
+    assert len(schema) == 1
+    assert list(schema.documents[0].definitions or {}) == ["acme"]
+    assert schema.documents[1] is schema[0]
+    assert registry.get_type("parcel") is None
+
+
+def test_validate_repeatedly(registry, store):
+    with ValidationContext():
+        schema = load_schema_files(str(store / "store.yasl"))
+    assert schema is not None
+    customers = str(store / "customers.yaml")
+    for _ in range(3):
+        # each run has its own unique values
+        result = schema.validate(customers)
+        assert result is not None
+        assert [c.name for c in result[0].customers] == ["Alice", "Bob"]
+    assert schema.validate_data({"name": "Carol"}, "customer", "acme") is not None
+    assert schema.validate_data({"name": 1.5}, "customer") is None
+    assert schema.registry.get_type("customer") is not None
+
+
+def test_pickle_generates_types_again(registry, store):
+    with ValidationContext():
+        schema = load_schema_files(str(store / "store.yasl"))
+    assert schema is not None
+    copy = pickle.loads(pickle.dumps(schema))
+    assert copy == schema
+    assert copy.registry is not schema.registry
+    customer = copy.registry.get_type("customer")
+    assert customer is not None
+    assert customer is not schema.registry.get_type("customer")
+    assert copy.validate(str(store / "customers.yaml")) is not None
+
+
+def _validate_in_worker(schema, path):
+    result = schema.validate(path)
+    return result is not None and result[0].customers[0].name == "Alice"
+
+
+def test_send_to_spawned_worker(registry, store):
+    with ValidationContext():
+        schema = load_schema_files(str(store / "store.yasl"))
+    with ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        future = pool.submit(_validate_in_worker, schema, str(store / "customers.yaml"))
+        assert future.result(timeout=120)
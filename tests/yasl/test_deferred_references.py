@@ -0,0 +1,124 @@
+from io import StringIO
+
+import pytest
+
+from yasl import yasl_eval
+from yasl.cache import YaslRegistry
+
+STORE_YASL = """
+definitions:
+  acme:
+    types:
+      customer:
+        properties:
+          name:
+            type: str
+            presence: required
+            unique: true
+      customer_list:
+        properties:
+          customers:
+            type: customer[]
+            presence: required
+      order:
+        properties:
+          id:
+            type: int
+            presence: required
+          customer_name:
+            type: ref[customer.name]
+            presence: required
+      order_list:
+        properties:
+          orders:
+            type: order[]
+            presence: required
+"""
+
+# orders sort before the customers they reference
+ORDERS_YAML = """
+orders:
+  - id: 1
+    customer_name: Alice
+  - id: 2
+    customer_name: Bob
+"""
+
+CUSTOMERS_YAML = """
+customers:
+  - name: Alice
+  - name: Bob
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    (tmp_path / "store.yasl").write_text(STORE_YASL)
+    (tmp_path / "a_orders.yaml").write_text(ORDERS_YAML)
+    (tmp_path / "b_customers.yaml").write_text(CUSTOMERS_YAML)
+    return tmp_path
+
+
+def run_eval(path, **kwargs):
+    stream = StringIO()
+    result = yasl_eval(str(path), str(path), log_stream=stream, **kwargs)
+    return result, stream.getvalue()
+
+
+def test_immediate_check_depends_on_file_order(registry, store_dir):
+    result, log = run_eval(store_dir)
+    assert result is None
+    assert "Referenced value 'Alice' does not exist" in log
+
+
+def test_deferred_check_is_order_independent(registry, store_dir):
+    result, log = run_eval(store_dir, defer_refs=True)
+    assert result is not None, log
+    assert not registry.pending_references
+    assert not registry.defer_references
+
+
+def test_deferred_check_reports_missing_references(registry, store_dir):
+    (store_dir / "c_orders.yaml").write_text(
+        "orders:\n  - id: 3\n    customer_name: Carol\n  - id: 4\n    customer_name: Alice\n"
+    )
+    result, log = run_eval(store_dir, defer_refs=True)
+    assert result is None
+    assert (
+        f"❌ Referenced value 'Carol' does not exist for 'ref[customer.name]' in "
+        f"'{store_dir / 'c_orders.yaml'}'"
+    ) in log
+    assert "'Alice' does not exist" not in log
+
+
+def test_parallel_resolves_cross_file_references(registry, store_dir):
+    result, log = run_eval(store_dir, jobs=2)
+    assert result is not None, log
+
+    (store_dir / "c_orders.yaml").write_text(
+        "orders:\n  - id: 3\n    customer_name: Carol\n"
+    )
+    result, log = run_eval(store_dir, jobs=2)
+    assert result is None
+    assert "'Carol' does not exist" in log
+
+
+def test_find_missing_references(registry):
+    registry.register_unique_value("customer", "name", "Alice", "acme")
+    registry.register_unique_value("customer", "name", "Bob", "acme")
+    missing = registry.find_missing_references(
+        {
+            "customer.name": {"Alice", "Eve"},
+            "acme.customer.name": {"Bob"},
+            "vendor.name": {"Acme"},
+        }
+    )
+    assert missing == {"customer.name": {"Eve"}, "vendor.name": {"Acme"}}
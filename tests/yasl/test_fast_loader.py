@@ -0,0 +1,86 @@
+from io import StringIO
+
+import pytest
+
+from yasl import load_data_files, load_schema_files, yasl_eval
+from yasl.cache import YaslRegistry
+
+ORDER_YASL = """
+definitions:
+  shop:
+    types:
+      item:
+        properties:
+          sku:
+            type: str
+            presence: required
+          count:
+            type: int
+      order:
+        properties:
+          id:
+            type: int
+            presence: required
+          items:
+            type: item[]
+"""
+
+ORDER_YAML = """id: 1
+items:
+  - sku: a
+    count: 2
+---
+id: 2
+items:
+  - sku: b
+    count: 1
+  - sku: c
+    count: many
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def files(tmp_path):
+    schema = tmp_path / "order.yasl"
+    schema.write_text(ORDER_YASL)
+    data = tmp_path / "order.yaml"
+    data.write_text(ORDER_YAML.split("---")[0])
+    return schema, data
+
+
+def test_fast_loader_results_match(registry, files):
+    schema, data = files
+    assert load_schema_files(str(schema)) is not None
+    fast = load_data_files(str(data), "order", fast=True)
+    slow = load_data_files(str(data), "order")
+    assert fast is not None and slow is not None
+    assert [m.model_dump() for m in fast] == [m.model_dump() for m in slow]
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_error_lines_with_fast_loader(registry, files, fast):
+    schema, data = files
+    data.write_text(ORDER_YAML)
+    log = StringIO()
+    assert yasl_eval(str(schema), str(data), "order", log_stream=log, fast=fast) is None
+    assert "Line 11 - 'items -> 1 -> count'" in log.getvalue()
+
+
+def test_schema_error_lines(registry, tmp_path):
+    schema = tmp_path / "bad.yasl"
+    schema.write_text(
+        ORDER_YASL.replace("type: int\n      order", "typ: int\n      order")
+    )
+    log = StringIO()
+    assert yasl_eval(str(schema), str(schema), log_stream=log) is None
+    assert "Line 11: 'definitions -> shop -> types -> item -> properties -> count" in (
+        log.getvalue()
+    )
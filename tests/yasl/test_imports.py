@@ -0,0 +1,127 @@
+from io import StringIO
+
+import pytest
+
+import yasl.core
+from yasl import load_schema_files, yasl_eval
+from yasl.cache import YaslRegistry
+
+BASE_YASL = """
+definitions:
+  acme:
+    types:
+      thing:
+        properties:
+          name:
+            type: str
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    files = []
+    parse = yasl.core._parse_schema_file
+
+    def counting_parse(path):
+        files.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(yasl.core, "_parse_schema_file", counting_parse)
+    return files
+
+
+def imports(*files):
+    return "imports:\n" + "".join(f"  - {f}\n" for f in files)
+
+
+def test_diamond_imports_load_once(registry, parsed, tmp_path):
+    (tmp_path / "base.yasl").write_text(BASE_YASL)
+    (tmp_path / "b.yasl").write_text(imports("base.yasl"))
+    (tmp_path / "c.yasl").write_text(imports("./base.yasl"))
+    (tmp_path / "main.yasl").write_text(imports("b.yasl", "c.yasl"))
+
+    schema = load_schema_files(str(tmp_path / "main.yasl"))
+    assert schema is not None
+    assert registry.get_type("thing", "acme") is not None
+    assert sorted(parsed) == sorted(
+        (tmp_path / name).as_posix()
+        for name in ["main.yasl", "b.yasl", "c.yasl", "base.yasl"]
+    )
+    # imports are generated before the documents importing them
+    assert schema.documents[0].definitions is not None
+    assert [yasl.imports for yasl in schema.documents[1:]] == [
+        ["base.yasl"],
+        ["./base.yasl"],
+        ["b.yasl", "c.yasl"],
+    ]
+
+
+def test_import_cycle(registry, caplog, tmp_path):
+    (tmp_path / "x.yasl").write_text(imports("y.yasl") + BASE_YASL)
+    (tmp_path / "y.yasl").write_text(imports("x.yasl"))
+
+    assert load_schema_files(str(tmp_path / "x.yasl")) is None
+    assert "import cycle" in caplog.text
+    assert "x.yasl -> " in caplog.text
+    # nothing was generated
+    assert registry.get_type("thing", "acme") is None
+
+
+def test_missing_import(registry, parsed, caplog, tmp_path):
+    (tmp_path / "main.yasl").write_text(imports("missing.yasl") + BASE_YASL)
+
+    assert load_schema_files(str(tmp_path / "main.yasl")) is None
+    assert "Import file 'missing.yasl'" in caplog.text
+    assert registry.get_type("thing", "acme") is None
+    assert parsed == [(tmp_path / "main.yasl").as_posix()]
+
+
+def test_invalid_import_is_reported(registry, caplog, tmp_path):
+    (tmp_path / "a.yasl").write_text(BASE_YASL)
+    (tmp_path / "b.yasl").write_text("definitions: [")
+    (tmp_path / "main.yasl").write_text(imports("a.yasl", "b.yasl"))
+
+    assert load_schema_files(str(tmp_path / "main.yasl")) is None
+    assert "YAML error while parsing YASL schema" in caplog.text
+    assert registry.get_type("thing", "acme") is None
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_schema_directory_shares_imports(registry, tmp_path, cached):
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    (schemas / "base.yasl").write_text(BASE_YASL)
+    (schemas / "b.yasl").write_text(imports("base.yasl"))
+    (schemas / "c.yasl").write_text(imports("base.yasl"))
+    (schemas / "main.yasl").write_text(imports("b.yasl", "c.yasl"))
+    data = tmp_path / "thing.yaml"
+    data.write_text("name: widget\n")
+    cache_dir = str(tmp_path / "cache") if cached else None
+
+    # the second run loads the schema files from the cache, if enabled
+    for _ in range(2):
+        log = StringIO()
+        result = yasl_eval(
+            str(schemas), str(data), "thing", log_stream=log, cache_dir=cache_dir
+        )
+        assert result is not None, log.getvalue()
+        assert "already exists" not in log.getvalue()
+
+    documents = []
+    schema = yasl.core._load_schema_files(str(schemas / "b.yasl"), cache_dir, documents)
+    assert schema is not None and len(schema.documents) == 2
+    schema = yasl.core._load_schema_files(
+        str(schemas / "main.yasl"), cache_dir, documents
+    )
+    assert schema is not None
+    # the imports loaded for b.yasl are part of main.yasl's schema as well
+    assert len(schema.documents) == 4
+    assert len(documents) == 4
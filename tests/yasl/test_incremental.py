@@ -0,0 +1,126 @@
+import os
+import sqlite3
+from io import StringIO
+
+import pytest
+from test_deferred_references import CUSTOMERS_YAML, ORDERS_YAML, STORE_YASL
+
+from yasl import yasl_eval
+from yasl.cache import YaslRegistry
+from yasl.state import STATE_FILE
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def store(tmp_path):
+    schema = tmp_path / "store.yasl"
+    schema.write_text(STORE_YASL)
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "a_orders.yaml").write_text(ORDERS_YAML)
+    (data / "b_customers.yaml").write_text(CUSTOMERS_YAML)
+    for i in range(4):
+        (data / f"c_orders_{i}.yaml").write_text(
+            f"orders:\n  - id: {10 + i}\n    customer_name: Bob\n"
+        )
+    return schema, data, tmp_path / "cache"
+
+
+def run_eval(schema, data, cache, **kwargs):
+    stream = StringIO()
+    result = yasl_eval(
+        str(schema),
+        str(data),
+        log_stream=stream,
+        cache_dir=str(cache),
+        incremental=True,
+        **kwargs,
+    )
+    return result, stream.getvalue()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_only_changed_files_are_validated(registry, store, jobs):
+    schema, data, cache = store
+    result, log = run_eval(schema, data, cache, jobs=jobs)
+    assert result is not None, log
+    assert "0 unchanged YAML files passed before, validating 6 YAML files" in log
+
+    result, log = run_eval(schema, data, cache, jobs=jobs)
+    assert result == [], log
+    assert "6 unchanged YAML files passed before, validating 0 YAML files" in log
+
+    (data / "c_orders_2.yaml").write_text(
+        "orders:\n  - id: 99\n    customer_name: Alice\n"
+    )
+    result, log = run_eval(schema, data, cache, jobs=jobs)
+    assert result is not None and result[0].orders[0].id == 99, log
+    assert "5 unchanged YAML files passed before, validating 1 YAML files" in log
+
+
+def test_touched_file_is_not_validated(registry, store):
+    schema, data, cache = store
+    assert run_eval(schema, data, cache)[0] is not None
+    path = data / "a_orders.yaml"
+    os.utime(path, ns=(0, 0))
+    assert run_eval(schema, data, cache)[0] == []
+    with sqlite3.connect(cache / STATE_FILE) as connection:
+        ((mtime_ns,),) = connection.execute(
+            "SELECT mtime_ns FROM files WHERE path = ?", (str(path),)
+        )
+    assert mtime_ns == 0
+
+
+def test_references_into_changed_files(registry, store):
+    schema, data, cache = store
+    assert run_eval(schema, data, cache)[0] is not None
+
+    # the unchanged order files still reference Bob
+    (data / "b_customers.yaml").write_text("customers:\n  - name: Alice\n")
+    result, log = run_eval(schema, data, cache)
+    assert result is None
+    assert (
+        f"❌ Referenced value 'Bob' does not exist for 'ref[customer.name]' in "
+        f"'{data / 'c_orders_3.yaml'}'"
+    ) in log
+
+    (data / "b_customers.yaml").write_text(CUSTOMERS_YAML)
+    assert run_eval(schema, data, cache)[0] is not None
+
+
+def test_unique_values_of_unchanged_files(registry, store):
+    schema, data, cache = store
+    assert run_eval(schema, data, cache)[0] is not None
+
+    (data / "d_customers.yaml").write_text("customers:\n  - name: Bob\n")
+    result, log = run_eval(schema, data, cache)
+    assert result is None
+    assert "Duplicate unique value 'Bob'" in log
+
+
+def test_schema_change_validates_everything(registry, store):
+    schema, data, cache = store
+    assert run_eval(schema, data, cache)[0] is not None
+    schema.write_text(
+        STORE_YASL.replace("type: int", "type: int\n            unique: true")
+    )
+    result, log = run_eval(schema, data, cache)
+    assert result is not None, log
+    assert "0 unchanged YAML files passed before, validating 6 YAML files" in log
+
+
+def test_incremental_requires_cache_dir(registry, store, monkeypatch):
+    schema, data, _ = store
+    monkeypatch.delenv("YASL_CACHE_DIR", raising=False)
+    stream = StringIO()
+    assert (
+        yasl_eval(str(schema), str(data), log_stream=stream, incremental=True) is None
+    )
+    assert "❌ Incremental validation requires a cache directory" in stream.getvalue()
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import yasl.core
+from yasl import ValidationContext, load_data, load_schema_files
+from yasl.cache import YaslRegistry
+
+SHOP_YASL = """
+definitions:
+  shop:
+    enums:
+      size:
+        values: [small, large]
+    types:
+      item:
+        properties:
+          name:
+            type: str
+          size:
+            type: size
+      basket:
+        properties:
+          items:
+            type: item[]
+      customer:
+        properties:
+          name:
+            type: str
+            unique: true
+  other:
+    types:
+      note:
+        properties:
+          text:
+            type: str
+          item:
+            type: shop.item
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def shop(tmp_path):
+    path = tmp_path / "shop.yasl"
+    path.write_text(SHOP_YASL)
+    return path
+
+
+def test_models_are_generated_on_first_use(registry, shop):
+    assert load_schema_files(str(shop)) is not None
+    assert registry.yasl_type_defs == {}
+    assert registry.find_types_for_keys(["items"]) == [("basket", "shop")]
+
+    basket = load_data({"items": [{"name": "a", "size": "small"}]}, "basket", "shop")
+    assert basket is not None
+    # the basket and the item it uses were generated, nothing else
+    assert set(registry.yasl_type_defs) == {("basket", "shop"), ("item", "shop")}
+    assert type(basket.items[0]) is registry.get_type("item", "shop")
+
+    assert registry.get_type_uses()[("note", "other")] == {"shop"}
+    assert len(registry.get_types()) == 4
+
+
+def test_validators_are_built_on_first_use(registry, shop, monkeypatch):
+    built = []
+    factory = yasl.core.property_validator_factory
+
+    def counting_factory(typedef_name, *args):
+        built.append(typedef_name)
+        return factory(typedef_name, *args)
+
+    monkeypatch.setattr(yasl.core, "property_validator_factory", counting_factory)
+    shop.write_text(
+        SHOP_YASL.replace(
+            "            unique: true\n",
+            "            unique: true\n          tag:\n"
+            "            type: any\n            any_of: [size, item]\n",
+        )
+    )
+    assert load_schema_files(str(shop)) is not None
+    assert built == []
+    # any_of names count as uses, like field types
+    assert registry.get_type_uses()[("customer", "shop")] == {"shop"}
+    assert registry.get_type("item", "shop") is not None
+    assert built == ["item", "item"]
+
+
+def test_schema_errors_are_reported_at_load(registry, shop):
+    shop.write_text(SHOP_YASL.replace("type: size", "type: colour"))
+    assert load_schema_files(str(shop)) is None
+    registry.clear_caches()
+    shop.write_text(SHOP_YASL.replace("unique: true", "any_of: [colour]"))
+    assert load_schema_files(str(shop)) is None
+
+
+def test_concurrent_runs_generate_once(registry, shop):
+    schema = ValidationContext()
+    with schema:
+        load_schema_files(str(shop))
+    barrier = threading.Barrier(4)
+
+    def validate(_):
+        with schema.run():
+            barrier.wait()
+            return YaslRegistry().get_type("basket", "shop")
+
+    with ThreadPoolExecutor(4) as pool:
+        models = list(pool.map(validate, range(4)))
+    assert models[0] is not None
+    assert all(model is models[0] for model in models)
+    assert registry.get_type("basket", "shop") is None
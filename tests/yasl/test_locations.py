@@ -0,0 +1,102 @@
+from io import StringIO
+
+import pytest
+from ruamel.yaml import YAML
+
+from yasl import yasl_eval
+from yasl.cache import YaslRegistry
+from yasl.locations import LineTable, json_pointer, model_locations
+
+TEAM_YASL = """
+definitions:
+  org:
+    types:
+      member:
+        properties:
+          name:
+            type: str
+            presence: required
+          email:
+            type: str
+            presence: preferred
+      team:
+        properties:
+          name:
+            type: str
+            presence: preferred
+          lead:
+            type: member
+          members:
+            type: member[]
+"""
+
+TEAM_YAML = """lead:
+  name: Ann
+members:
+  - name: Bob
+    email: bob@example.com
+  - name: Cid
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+def test_json_pointer():
+    assert json_pointer(()) == ""
+    assert json_pointer(("a/b", 0, "c~d")) == "/a~1b/0/c~0d"
+
+
+def test_line_table():
+    table = LineTable(YAML(typ="rt").load(TEAM_YAML))
+    assert table.position(()) == (1, 1)
+    assert table.position(("lead",)) == (2, 3)
+    assert table.position(("lead", "name")) == (2, 9)
+    assert table.position(("members", 1)) == (6, 5)
+    assert table.line(("members", 1, "email")) == 6
+    assert table.line(("members", 5)) == 4
+    assert LineTable({"plain": "dict"}).line(("plain",)) is None
+
+
+def test_model_locations():
+    from pydantic import BaseModel
+
+    class Member(BaseModel):
+        name: str
+
+    class Team(BaseModel):
+        lead: Member
+        members: list[Member]
+        roles: dict[str, Member]
+
+    lead = Member(name="a")
+    team = Team(lead=lead, members=[Member(name="b"), lead], roles={"x": lead})
+    locations = model_locations(team)
+    assert locations[id(team)] == ()
+    # the first path to a shared model wins
+    assert locations[id(team.lead)] == ("lead",)
+    assert locations[id(team.members[0])] == ("members", 0)
+    assert locations[id(team.roles)] == ("roles",)
+    assert id(team.members[0].name) not in locations
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_nested_warning_lines(registry, tmp_path, fast):
+    schema = tmp_path / "team.yasl"
+    schema.write_text(TEAM_YASL)
+    data = tmp_path / "team.yaml"
+    data.write_text(TEAM_YAML)
+
+    log = StringIO()
+    result = yasl_eval(str(schema), str(data), "team", log_stream=log, fast=fast)
+    assert result is not None, log.getvalue()
+    assert "yaml_line" not in type(result[0]).model_fields
+    output = log.getvalue()
+    assert "Preferred property 'name' is missing at line 1" in output
+    assert "Preferred property 'email' is missing at line 2" in output
+    assert "Preferred property 'email' is missing at line 6" in output
@@ -0,0 +1,132 @@
+import pickle
+import subprocess
+from io import StringIO
+
+import pytest
+
+from yasl import load_schema_files, yasl_eval
+from yasl.cache import YaslRegistry
+from yasl.core import load_data_files
+
+UNIQUE_YASL = """
+definitions:
+  acme:
+    types:
+      user:
+        properties:
+          id:
+            type: str
+            presence: required
+            unique: true
+          role:
+            type: role
+    enums:
+      role:
+        values:
+          - admin
+          - member
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def unique_dir(tmp_path):
+    (tmp_path / "user.yasl").write_text(UNIQUE_YASL)
+    for i in range(6):
+        (tmp_path / f"user_{i}.yaml").write_text(f"id: u{i}\nrole: member\n")
+    return tmp_path
+
+
+def run_eval(schema, data, jobs):
+    stream = StringIO()
+    result = yasl_eval(str(schema), str(data), log_stream=stream, jobs=jobs)
+    return result, stream.getvalue()
+
+
+def test_parallel_matches_serial(registry, unique_dir):
+    serial, serial_log = run_eval(unique_dir, unique_dir, jobs=1)
+    parallel, parallel_log = run_eval(unique_dir, unique_dir, jobs=3)
+
+    assert serial is not None and parallel is not None
+    assert [r.id for r in parallel] == [r.id for r in serial] == ["u5"]
+    assert parallel[0].role.value == serial[0].role.value == "member"
+    assert parallel_log == serial_log
+    # logs are replayed in file order
+    positions = [parallel_log.index(f"user_{i}.yaml") for i in range(6)]
+    assert positions == sorted(positions)
+
+
+def test_workers_send_models_of_last_file_only(registry, unique_dir):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from yasl.parallel import _init_worker, _validate_file
+
+    schema = load_schema_files(str(unique_dir / "user.yasl"))
+    assert schema is not None
+    with ProcessPoolExecutor(1, initializer=_init_worker, initargs=(schema, 0)) as pool:
+        path = (unique_dir / "user_0.yaml").as_posix()
+        outcome = pool.submit(_validate_file, path, None, False, False, False).result()
+        assert outcome.valid and outcome.results is None
+        outcome = pool.submit(_validate_file, path, None, False, False, True).result()
+        assert outcome.valid and outcome.results is not None
+        assert pickle.loads(outcome.results)[0].id == "u0"
+
+
+def test_parallel_duplicate_unique_value_across_files(registry, unique_dir):
+    (unique_dir / "user_9.yaml").write_text("id: u2\nrole: admin\n")
+
+    serial, _ = run_eval(unique_dir, unique_dir, jobs=1)
+    parallel, log = run_eval(unique_dir, unique_dir, jobs=2)
+
+    assert serial is None
+    assert parallel is None
+    assert "Duplicate unique value 'u2'" in log
+    assert "user_9.yaml" in log
+
+
+def test_parallel_stops_at_invalid_file(registry):
+    result, log = run_eval(
+        "features/yasl/data/dir_test", "features/yasl/data/bad_dir_test", jobs=2
+    )
+    assert result is None
+    assert "❌ Validation failed. Unable to validate data in YAML file" in log
+
+
+def test_generated_models_pickle(registry):
+    assert load_schema_files("features/yasl/data/dir_test/thing.yasl") is not None
+    results = load_data_files("features/yasl/data/dir_test/thing.yaml")
+    assert results is not None
+
+    restored = pickle.loads(pickle.dumps(results))
+    assert type(restored[0]) is type(results[0])
+    assert restored[0] == results[0]
+
+
+def test_generated_enum_pickle(registry, unique_dir):
+    assert load_schema_files(str(unique_dir / "user.yasl")) is not None
+    role = registry.get_enum("role", "acme")
+    assert role is not None
+    assert pickle.loads(pickle.dumps(role["admin"])) is role["admin"]
+
+    data = pickle.dumps(role["admin"])
+    registry.clear_caches()
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(data)
+
+
+def test_cli_jobs():
+    data_dir = "./features/yasl/data/dir_test"
+    result = subprocess.run(
+        ["yasl", "--jobs", "2", data_dir, data_dir],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "thing.yaml' data validation successful" in result.stdout
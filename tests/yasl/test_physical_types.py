@@ -1,11 +1,13 @@
 import os
+import subprocess
+import sys
 import tempfile
 from io import StringIO
 
 import pytest
 
 from yasl import yasl_eval
-from yasl.primitives import PRIMITIVE_TYPE_MAP
+from yasl.primitives import ASTROPY_TYPES, PRIMITIVE_TYPE_MAP
 
 
 def run_eval_command(yaml_data, yasl_schema, model_name, expect_valid):
@@ -39,6 +41,65 @@ def run_eval_command(yaml_data, yasl_schema, model_name, expect_valid):
             assert "data validation successful" in test_log.getvalue()
 
 
+def test_astropy_not_imported_with_yasl():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, yasl; from yasl.primitives import PRIMITIVE_TYPE_MAP; "
+            "assert 'length' in PRIMITIVE_TYPE_MAP; "
+            "assert 'astropy' not in sys.modules",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": "src"},
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_quantity_types_created_once():
+    assert "pressure" in ASTROPY_TYPES
+    assert "not a physical type" not in PRIMITIVE_TYPE_MAP
+    assert PRIMITIVE_TYPE_MAP["pressure"] is PRIMITIVE_TYPE_MAP["pressure"]
+    assert PRIMITIVE_TYPE_MAP["stress"] is not PRIMITIVE_TYPE_MAP["pressure"]
+    with pytest.raises(KeyError):
+        ASTROPY_TYPES["not a physical type"]
+
+
+def test_unit_physical_types_are_cached():
+    from yasl.primitives import _unit_physical_type
+
+    speed_type = PRIMITIVE_TYPE_MAP["speed"]
+    speed_type.validate("1 km / h")
+    hits = _unit_physical_type.cache_info().hits
+    for value in ("2 km / h", "-3.5e2 km / h", "  .5km / h "):
+        assert speed_type.validate(value) == value
+    assert _unit_physical_type.cache_info().hits == hits + 3
+    assert speed_type.target_physical_type() is speed_type.target_physical_type()
+
+
+def test_quantity_fallback_parse():
+    length_type = PRIMITIVE_TYPE_MAP["length"]
+    dimensionless_type = PRIMITIVE_TYPE_MAP["dimensionless"]
+    # not a plain real number, handled by a full Quantity parse
+    assert length_type.validate("inf m") == "inf m"
+    assert dimensionless_type.validate("1e3") == "1e3"
+    with pytest.raises(ValueError, match="Invalid quantity for type 'length'"):
+        length_type.validate("5 parsecs per fortnight")
+    with pytest.raises(ValueError, match="Invalid quantity"):
+        length_type.validate("m")
+
+
+def test_quantity_malformed_number():
+    length_type = PRIMITIVE_TYPE_MAP["length"]
+    for value in ("1.5.3 m", "1..5 m", "1e5.3 m", "-1.5.3e2 km"):
+        with pytest.raises(ValueError, match="Invalid quantity"):
+            length_type.validate(value)
+    dimensionless_type = PRIMITIVE_TYPE_MAP["dimensionless"]
+    with pytest.raises(ValueError, match="Invalid quantity"):
+        dimensionless_type.validate("1.5.3")
+
+
 def test_duration_validation():
     time_type = PRIMITIVE_TYPE_MAP["time"]
     # Valid time
@@ -244,3 +305,103 @@ conductivity: 200 J
 specific_heat: 900 W
 """
     run_eval_command(yaml_data_bad, yasl_schema, "material_properties", False)
+
+
+# --- Batch validation of quantity lists and maps ---
+
+
+def _batch_model(field_type):
+    from pydantic import create_model
+
+    from yasl.primitives import quantity_batch
+
+    return create_model("Batch", values=(quantity_batch(field_type), ...))
+
+
+def test_quantity_list_batch():
+    import pickle
+
+    import astropy.units as u
+    import numpy as np
+
+    item_type = PRIMITIVE_TYPE_MAP["length"]
+    model = _batch_model(list[item_type])
+    data = model(values=["1 m", "2.5 km", " 3e2 cm ", "4 m"])
+    assert data.values == ["1 m", "2.5 km", " 3e2 cm ", "4 m"]
+    assert data.values.quantity.unit == u.m
+    np.testing.assert_allclose(data.values.quantity.value, [1, 2500, 3, 4])
+    assert data.model_dump() == {"values": ["1 m", "2.5 km", " 3e2 cm ", "4 m"]}
+    assert pickle.loads(pickle.dumps(data.values)) == data.values
+
+    assert len(model(values=[]).values.quantity) == 0
+
+
+def test_quantity_map_batch():
+    import astropy.units as u
+    import numpy as np
+
+    item_type = PRIMITIVE_TYPE_MAP["pressure"]
+    model = _batch_model(dict[str, item_type])
+    data = model(values={"low": "1 kPa", "high": "2 bar"})
+    assert data.values == {"low": "1 kPa", "high": "2 bar"}
+    assert data.values.quantity.unit == u.kPa
+    np.testing.assert_allclose(data.values.quantity.value, [1, 200])
+
+
+def test_quantity_batch_fallback():
+    import astropy.units as u
+    import numpy as np
+    from pydantic import ValidationError
+
+    item_type = PRIMITIVE_TYPE_MAP["length"]
+    model = _batch_model(list[item_type])
+    # values the batch cannot parse are validated one by one
+    assert model(values=["inf m", "1 m"]).values.quantity.unit == u.m
+    with pytest.raises(ValidationError) as exc_info:
+        model(values=["1 m", "2 s", "3 m"])
+    assert exc_info.value.errors()[0]["loc"] == ("values", 1)
+    assert "Physical type mismatch" in str(exc_info.value)
+
+    # malformed numbers are not read as a number and a unit
+    with pytest.raises(ValidationError) as exc_info:
+        model(values=["1 m", "1.5.3 m"])
+    assert exc_info.value.errors()[0]["loc"] == ("values", 1)
+    assert "Invalid quantity" in str(exc_info.value)
+    map_model = _batch_model(dict[str, item_type])
+    with pytest.raises(ValidationError) as exc_info:
+        map_model(values={"a": "1 m", "b": "2..5 km"})
+    assert exc_info.value.errors()[0]["loc"] == ("values", "b")
+
+    # temperatures need an equivalency to convert
+    item_type = PRIMITIVE_TYPE_MAP["temperature"]
+    model = _batch_model(list[item_type])
+    temperatures = model(values=["300 K", "10 deg_C"]).values.quantity
+    assert temperatures.unit == u.K
+    np.testing.assert_allclose(temperatures.value, [300, 283.15])
+
+
+def test_yasl_quantity_list_integration():
+    yasl_schema = """
+definitions:
+  main:
+    types:
+      route:
+        properties:
+          legs:
+            type: length[]
+          limits:
+            type: map[str, velocity]
+"""
+    yaml_data_good = """
+legs: [1 km, 500 m]
+limits:
+  town: 50 km/h
+"""
+    run_eval_command(yaml_data_good, yasl_schema, "route", True)
+
+    yaml_data_bad = """
+legs: [1 km, 500 s]
+limits:
+  town: 50 km/h
+"""
+    run_eval_command(yaml_data_bad, yasl_schema, "route", False)
@@ -0,0 +1,160 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+import pytest
+
+from yasl import yasl_eval
+from yasl.cache import YaslRegistry
+from yasl.reachability import UrlChecker
+
+LINK_YASL = """
+definitions:
+  acme:
+    types:
+      link:
+        properties:
+          name:
+            type: str
+            presence: required
+          target:
+            type: url
+            presence: required
+            url_reachable: true
+"""
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+
+    def do_HEAD(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(404 if self.path.startswith("/missing") else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    stub = StubServer()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+def test_check_deduplicates_urls(server):
+    ok, missing = server.url("/ok"), server.url("/missing")
+    results = UrlChecker().check([ok, missing, ok, ok])
+
+    assert results[ok] is None
+    assert results[missing] == f"URL '{missing}' is not reachable (status 404)"
+    assert sorted(server.requests) == ["/missing", "/ok"]
+
+
+def test_check_unreachable_host():
+    url = "http://127.0.0.1:9/nothing-listens-here"
+    error = UrlChecker(timeout=1).check([url])[url]
+    assert error is not None
+    assert error.startswith(f"URL '{url}' is not reachable: ")
+
+
+def test_per_host_limit(server):
+    server.delay = 0.05
+    urls = [server.url(f"/ok/{i}") for i in range(12)]
+    results = UrlChecker(max_workers=12, per_host=3).check(urls)
+
+    assert all(error is None for error in results.values())
+    assert len(server.requests) == 12
+    assert server.max_in_flight <= 3
+
+
+def test_results_cached_until_ttl(server, tmp_path):
+    ok, missing = server.url("/ok"), server.url("/missing")
+    UrlChecker(tmp_path).check([ok, missing])
+    assert len(server.requests) == 2
+
+    # only reachable URLs are cached; failures are checked again
+    results = UrlChecker(tmp_path).check([ok, missing])
+    assert results[ok] is None and results[missing] is not None
+    assert server.requests[2:] == ["/missing"]
+
+    UrlChecker(tmp_path, ttl=0).check([ok])
+    assert len(server.requests) == 4
+
+
+def test_failures_not_cached(server, tmp_path):
+    missing = server.url("/missing")
+    (tmp_path / "urls.json").write_text(
+        f'{{"{missing}": {{"checked": {time.time()}, "error": "down"}}}}'
+    )
+    results = UrlChecker(tmp_path).check([missing])
+    assert results[missing] == f"URL '{missing}' is not reachable (status 404)"
+    assert server.requests == ["/missing"]
+    assert (tmp_path / "urls.json").read_text() == "{}"
+
+
+def test_corrupt_cache_is_ignored(server, tmp_path):
+    (tmp_path / "urls.json").write_text("not json")
+    ok = server.url("/ok")
+    assert UrlChecker(tmp_path).check([ok]) == {ok: None}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_eval_checks_urls_in_one_batch(server, registry, tmp_path, jobs):
+    (tmp_path / "link.yasl").write_text(LINK_YASL)
+    for i in range(4):
+        (tmp_path / f"link_{i}.yaml").write_text(
+            f"name: link {i}\ntarget: {server.url('/ok')}\n"
+        )
+
+    log = StringIO()
+    result = yasl_eval(str(tmp_path), str(tmp_path), log_stream=log, jobs=jobs)
+    assert result is not None, log.getvalue()
+    assert server.requests == ["/ok"]
+
+    (tmp_path / "link_9.yaml").write_text(
+        f"name: broken\ntarget: {server.url('/missing')}\n"
+    )
+    log = StringIO()
+    result = yasl_eval(str(tmp_path), str(tmp_path), log_stream=log, jobs=jobs)
+    assert result is None
+    assert (
+        f"❌ URL '{server.url('/missing')}' is not reachable (status 404) in "
+        f"'{tmp_path / 'link_9.yaml'}'"
+    ) in log.getvalue()
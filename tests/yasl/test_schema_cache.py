@@ -0,0 +1,171 @@
+import os
+import pickle
+
+import pytest
+
+import yasl.core
+import yasl.schema_cache
+from yasl import load_schema_files
+from yasl.cache import YaslRegistry
+from yasl.schema_cache import SchemaCache, resolve_cache_dir
+
+MAIN_YASL = """
+imports:
+  - types.yasl
+metadata:
+  version: 1.0.0
+definitions:
+  acme:
+    types:
+      order:
+        properties:
+          id:
+            type: int
+            presence: required
+          item:
+            type: item
+"""
+
+TYPES_YASL = """
+definitions:
+  acme:
+    enums:
+      color:
+        values:
+          - red
+          - blue
+    types:
+      item:
+        properties:
+          name:
+            type: str
+          color:
+            type: color
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "main.yasl").write_text(MAIN_YASL)
+    (tmp_path / "types.yasl").write_text(TYPES_YASL)
+    return tmp_path
+
+
+def test_resolve_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("YASL_CACHE_DIR", raising=False)
+    assert resolve_cache_dir() is None
+    assert resolve_cache_dir(str(tmp_path)) == tmp_path
+    monkeypatch.setenv("YASL_CACHE_DIR", str(tmp_path / "env"))
+    assert resolve_cache_dir() == tmp_path / "env"
+
+
+def test_cache_hit_skips_parsing(registry, schema_dir, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    main = str(schema_dir / "main.yasl")
+
+    first = load_schema_files(main, cache_dir=cache_dir)
+    assert first is not None
+    assert SchemaCache(cache_dir).load(main) is not None
+
+    registry.clear_caches()
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("schema files should not be parsed on a cache hit")
+
+    monkeypatch.setattr(yasl.core, "YAML", fail_parse)
+    second = load_schema_files(main, cache_dir=cache_dir)
+
+    assert second is not None
+    assert len(second) == 1
+    assert second[0].metadata == {"version": "1.0.0"}
+    assert registry.get_type("order", "acme") is not None
+    assert registry.get_type("item", "acme") is not None
+    assert registry.get_enum("color", "acme") is not None
+
+
+def test_cache_invalidated_by_import_change(registry, schema_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    main = str(schema_dir / "main.yasl")
+
+    assert load_schema_files(main, cache_dir=cache_dir) is not None
+    item = registry.get_type("item", "acme")
+    assert item is not None
+    assert "size" not in item.model_fields
+
+    (schema_dir / "types.yasl").write_text(
+        TYPES_YASL + "          size:\n            type: int\n"
+    )
+    assert SchemaCache(cache_dir).load(main) is None
+
+    registry.clear_caches()
+    assert load_schema_files(main, cache_dir=cache_dir) is not None
+    item = registry.get_type("item", "acme")
+    assert item is not None
+    assert "size" in item.model_fields
+
+
+def test_corrupt_cache_entry_is_ignored(registry, schema_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    main = str(schema_dir / "main.yasl")
+
+    assert load_schema_files(main, cache_dir=str(cache_dir)) is not None
+    for entry in (cache_dir / "schemas").iterdir():
+        entry.write_bytes(b"not a pickle")
+
+    registry.clear_caches()
+    assert load_schema_files(main, cache_dir=str(cache_dir)) is not None
+    assert registry.get_type("order", "acme") is not None
+
+
+def test_no_cache_without_cache_dir(registry, schema_dir, monkeypatch):
+    monkeypatch.delenv("YASL_CACHE_DIR", raising=False)
+    monkeypatch.chdir(schema_dir)
+    assert load_schema_files(str(schema_dir / "main.yasl")) is not None
+    assert sorted(os.listdir(schema_dir)) == ["main.yasl", "types.yasl"]
+
+
+def test_cache_entry_of_other_version_is_ignored(
+    registry, schema_dir, tmp_path, monkeypatch
+):
+    cache_dir = str(tmp_path / "cache")
+    main = str(schema_dir / "main.yasl")
+
+    assert load_schema_files(main, cache_dir=cache_dir) is not None
+    assert SchemaCache(cache_dir).load(main) is not None
+    monkeypatch.setattr(yasl.schema_cache, "advanced_yaml_version", lambda: "0.0.0")
+    assert SchemaCache(cache_dir).load(main) is None
+
+
+def test_failed_cache_replay_falls_back_to_parsing(registry, schema_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    main = str(schema_dir / "main.yasl")
+
+    assert load_schema_files(main, cache_dir=str(cache_dir)) is not None
+    # an entry that passes the checks but no longer generates, e.g. one
+    # written before a model change
+    (entry,) = (cache_dir / "schemas").iterdir()
+    data = pickle.loads(entry.read_bytes())
+    order = data["documents"][-1][1].definitions["acme"].types["order"]
+    order.properties["item"].type = "missing"
+    entry.write_bytes(pickle.dumps(data))
+
+    registry.clear_caches()
+    assert load_schema_files(main, cache_dir=str(cache_dir)) is not None
+    assert registry.get_type("order", "acme") is not None
+    assert registry.get_enum("color", "acme") is not None
+    # the entry was replaced by the parsed documents
+    cached = SchemaCache(cache_dir).load(main)
+    assert cached is not None
+    definitions = cached[-1][1].definitions
+    assert definitions is not None
+    types = definitions["acme"].types
+    assert types is not None
+    assert types["order"].properties["item"].type == "item"
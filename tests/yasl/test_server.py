@@ -0,0 +1,177 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+from test_deferred_references import CUSTOMERS_YAML, ORDERS_YAML, STORE_YASL
+
+import yasl.client
+from yasl.cache import YaslRegistry
+from yasl.cli import main as yasl_cli_main
+from yasl.client import send_request, socket_path, validate
+from yasl.server import serve
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def daemon(registry):
+    # socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmpdir:
+        path = os.path.join(tmpdir, "yasl.sock")
+        thread = threading.Thread(target=serve, args=(path,), daemon=True)
+        thread.start()
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+        yield path
+        send_request({"command": "shutdown"}, path)
+        thread.join(5)
+        assert not os.path.exists(path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "store.yasl").write_text(STORE_YASL)
+    (tmp_path / "a_orders.yaml").write_text(ORDERS_YAML)
+    (tmp_path / "b_customers.yaml").write_text(CUSTOMERS_YAML)
+    return tmp_path
+
+
+def messages(response):
+    return "\n".join(entry["message"] for entry in response["log"])
+
+
+def test_ping_and_errors(daemon):
+    assert send_request({"command": "ping"}, daemon)["ok"]
+    assert "unknown command" in send_request({"command": "nope"}, daemon)["error"]
+    assert "needs a 'schema'" in send_request({}, daemon)["error"]
+    assert send_request({"command": "ping"}, daemon + ".missing") is None
+
+
+def test_socket_path(monkeypatch):
+    monkeypatch.delenv("YASL_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert socket_path() == "/run/user/1000/yasl.sock"
+    monkeypatch.setenv("YASL_SOCKET", "/x/y.sock")
+    assert socket_path() == "/x/y.sock"
+    assert socket_path("/a.sock") == "/a.sock"
+
+
+def test_untrusted_daemon_is_ignored(daemon, monkeypatch, caplog):
+    assert oct(os.stat(daemon).st_mode & 0o777) == oct(0o600)
+    # a socket other users can reach may not belong to this user's daemon
+    os.chmod(daemon, 0o666)
+    try:
+        assert send_request({"command": "ping"}, daemon) is None
+        assert "not a socket owned by and private to this user" in caplog.text
+    finally:
+        os.chmod(daemon, 0o600)
+    # neither is a regular file in its place
+    assert send_request({"command": "ping"}, __file__) is None
+
+    # a daemon running another version is not used
+    monkeypatch.setattr(yasl.client, "advanced_yaml_version", lambda: "0.0.0")
+    assert send_request({"command": "ping"}, daemon) is None
+    assert "not 0.0.0" in caplog.text
+    monkeypatch.undo()
+    assert send_request({"command": "ping"}, daemon)["ok"]
+
+
+def test_validate_files_and_documents(daemon, store, registry):
+    response = validate(str(store / "store.yasl"), [str(store)], path=daemon)
+    assert response is not None
+    assert response["valid"] is False
+    assert "Referenced value 'Alice' does not exist" in messages(response)
+
+    response = validate(
+        str(store / "store.yasl"), [str(store)], path=daemon, defer_refs=True
+    )
+    assert response is not None
+    assert response["valid"] is True, messages(response)
+    assert [f["valid"] for f in response["files"]] == [True, True]
+    # the models are kept between requests
+    order = registry.get_type("order", "acme")
+    assert order is not None
+
+    response = validate(
+        str(store / "store.yasl"),
+        documents=[
+            {"name": "good.yaml", "text": CUSTOMERS_YAML},
+            {"name": "bad.yaml", "text": "customers:\n  - name: 1.5\n"},
+        ],
+        path=daemon,
+    )
+    assert response is not None
+    assert response["files"] == [
+        {"path": "good.yaml", "valid": True},
+        {"path": "bad.yaml", "valid": False},
+    ]
+    assert "Line 2" in messages(response)
+    assert registry.get_type("order", "acme") is order
+
+
+def test_schema_changes_are_picked_up(daemon, store, registry):
+    schema = store / "store.yasl"
+    assert validate(str(schema), [str(store / "b_customers.yaml")], path=daemon)[
+        "valid"
+    ]
+    schema.write_text(STORE_YASL.replace("type: str", "type: int"))
+    os.utime(schema, ns=(time.time_ns() + 10**9,) * 2)
+    response = validate(str(schema), [str(store / "b_customers.yaml")], path=daemon)
+    assert response["valid"] is False
+    assert "Schema changed" in messages(response)
+
+    schema.write_text("definitions: [")
+    os.utime(schema, ns=(time.time_ns() + 2 * 10**9,) * 2)
+    response = validate(str(schema), [str(store / "b_customers.yaml")], path=daemon)
+    assert response["valid"] is False
+    assert response["files"] == []
+
+
+def test_cli_uses_daemon(daemon, store, monkeypatch, capsys):
+    monkeypatch.chdir(store)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["yasl", "store.yasl", ".", "--defer-refs", "--socket", daemon],
+    )
+    with pytest.raises(SystemExit) as e:
+        yasl_cli_main()
+    assert e.value.code == 0
+    assert "YAML 'a_orders.yaml' data validation successful" in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["yasl", "store.yasl", ".", "--socket", daemon])
+    with pytest.raises(SystemExit) as e:
+        yasl_cli_main()
+    assert e.value.code == 1
+
+
+def test_second_daemon_refuses_socket(daemon):
+    assert serve(daemon) is False
+
+
+def test_cli_client_does_not_import_pydantic():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, yasl, yasl.cli, yasl.client; "
+            "assert 'pydantic' not in sys.modules; "
+            "assert callable(yasl.yasl_eval)",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": "src"},
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,108 @@
+import subprocess
+from io import StringIO
+
+import pytest
+
+from yasl import iter_data_files, load_schema_files, yasl_eval
+from yasl.cache import YaslRegistry
+
+EVENT_YASL = """
+definitions:
+  audit:
+    types:
+      event:
+        properties:
+          id:
+            type: int
+            presence: required
+            unique: true
+          action:
+            type: str
+            presence: required
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def schema(tmp_path):
+    path = tmp_path / "audit.yasl"
+    path.write_text(EVENT_YASL)
+    return path
+
+
+def write_events(path, count, tail=""):
+    path.write_text(
+        "".join(f"---\nid: {i}\naction: login\n" for i in range(count)) + tail
+    )
+    return path
+
+
+def test_iter_data_files_yields_each_document(registry, schema, tmp_path):
+    assert load_schema_files(str(schema)) is not None
+    data = write_events(tmp_path / "events.yaml", 5)
+
+    results = list(iter_data_files(str(data), "event"))
+    assert [r.id for r in results] == [0, 1, 2, 3, 4]
+
+
+def test_iter_data_files_parses_lazily(registry, schema, tmp_path):
+    assert load_schema_files(str(schema)) is not None
+    # the last document is not valid YAML
+    data = write_events(tmp_path / "events.yaml", 3, "---\nid: [\n")
+
+    documents = iter_data_files(str(data), "event")
+    assert next(documents).id == 0
+    assert next(documents).id == 1
+    assert next(documents).id == 2
+    assert next(documents) is None
+    assert list(documents) == []
+
+
+def test_iter_data_files_stops_at_invalid_document(registry, schema, tmp_path):
+    assert load_schema_files(str(schema)) is not None
+    data = write_events(tmp_path / "events.yaml", 2, "---\nid: 1\naction: logout\n")
+
+    assert [r if r is None else r.id for r in iter_data_files(str(data))] == [
+        0,
+        1,
+        None,
+    ]
+    assert list(iter_data_files(str(tmp_path / "missing.yaml"))) == [None]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_eval_stream(registry, schema, tmp_path, jobs):
+    write_events(tmp_path / "a.yaml", 3)
+    (tmp_path / "b.yaml").write_text("id: 10\naction: logout\n")
+
+    log = StringIO()
+    result = yasl_eval(
+        str(schema), str(tmp_path), log_stream=log, jobs=jobs, stream=True
+    )
+    assert result is not None, log.getvalue()
+    assert [r.id for r in result] == [10]
+
+    write_events(tmp_path / "c.yaml", 1)
+    log = StringIO()
+    assert (
+        yasl_eval(str(schema), str(tmp_path), log_stream=log, jobs=jobs, stream=True)
+        is None
+    )
+    assert "❌" in log.getvalue()
+
+
+def test_cli_stream(schema, tmp_path):
+    data = write_events(tmp_path / "events.yaml", 3)
+    result = subprocess.run(
+        ["yasl", "--stream", str(schema), str(data), "event"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,132 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+import pytest
+from test_deferred_references import CUSTOMERS_YAML, ORDERS_YAML, STORE_YASL
+
+from yasl import ValidationContext, load_data_files, load_schema_files, yasl_eval
+from yasl.cache import YaslRegistry, get_yasl_registry
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "store.yasl").write_text(STORE_YASL)
+    (tmp_path / "orders.yaml").write_text(ORDERS_YAML)
+    (tmp_path / "customers.yaml").write_text(CUSTOMERS_YAML)
+    return tmp_path
+
+
+def test_contexts_are_isolated(registry, store):
+    context = ValidationContext()
+    with context:
+        assert YaslRegistry() is context.registry
+        assert get_yasl_registry() is context.registry
+        assert YaslRegistry() is YaslRegistry()
+        assert load_schema_files(str(store / "store.yasl")) is not None
+        # nested contexts shadow the outer one until they exit
+        with ValidationContext() as inner:
+            assert YaslRegistry() is inner.registry
+            assert YaslRegistry().get_type("customer") is None
+        assert YaslRegistry().get_type("customer") is not None
+    assert YaslRegistry() is registry
+    assert registry.get_type("customer") is None
+
+    # a new thread starts outside of any context
+    seen = []
+    with context:
+        thread = threading.Thread(target=lambda: seen.append(YaslRegistry()))
+        thread.start()
+        thread.join()
+    assert seen == [registry]
+
+
+def test_run_contexts_share_schema_not_state(registry, store):
+    schema = ValidationContext()
+    with schema:
+        load_schema_files(str(store / "store.yasl"))
+    customer = schema.registry.get_type("customer")
+
+    with schema.run() as run:
+        assert run.registry.get_type("customer") is customer
+        assert load_data_files(str(store / "customers.yaml")) is not None
+        # unique values are checked within a run
+        assert load_data_files(str(store / "customers.yaml")) is None
+        with pytest.raises(RuntimeError, match="shared"):
+            run.registry.remove_namespace("acme")
+        assert load_schema_files(str(store / "store.yasl")) is None
+        run.registry.clear_caches()
+        assert run.registry.get_type("customer") is customer
+    assert schema.registry.unique_values_store == {}
+
+    with schema.run():
+        assert load_data_files(str(store / "customers.yaml")) is not None
+        assert load_data_files(str(store / "orders.yaml")) is not None
+
+
+def test_concurrent_runs(registry, store):
+    schema = ValidationContext()
+    with schema:
+        load_schema_files(str(store / "store.yasl"))
+    barrier = threading.Barrier(4)
+
+    def validate(_):
+        with schema.run():
+            barrier.wait()
+            customers = load_data_files(str(store / "customers.yaml"))
+            barrier.wait()
+            orders = load_data_files(str(store / "orders.yaml"))
+            return customers is not None and orders is not None
+
+    with ThreadPoolExecutor(4) as pool:
+        assert all(pool.map(validate, range(4)))
+
+
+def test_threads_share_one_context(registry, store):
+    context = ValidationContext()
+    with context:
+        load_schema_files(str(store / "store.yasl"))
+    entered = threading.Barrier(2, timeout=10)
+    first_left = threading.Event()
+
+    def use(first):
+        try:
+            with context:
+                entered.wait()
+                if not first:
+                    # the other thread leaving must not pop this thread's entry
+                    assert first_left.wait(timeout=10)
+                    assert YaslRegistry() is context.registry
+                    customers = load_data_files(str(store / "customers.yaml"))
+                    assert customers is not None
+        finally:
+            if first:
+                first_left.set()
+        return YaslRegistry()
+
+    with ThreadPoolExecutor(2) as pool:
+        assert list(pool.map(use, (True, False))) == [registry, registry]
+
+
+def test_yasl_eval_leaves_registry_alone(registry, store):
+    assert load_schema_files(str(store / "store.yasl")) is not None
+    customer = registry.get_type("customer")
+
+    def evaluate(_):
+        return yasl_eval(
+            str(store / "store.yasl"),
+            str(store / "customers.yaml"),
+            log_stream=StringIO(),
+        )
+
+    with ThreadPoolExecutor(4) as pool:
+        assert all(result is not None for result in pool.map(evaluate, range(8)))
+    assert registry.get_type("customer") is customer
@@ -0,0 +1,182 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from yasl import load_data, load_schema, load_schema_files
+from yasl.cache import YaslRegistry
+from yasl.pydantic_types import yasl_enum
+from yasl.validators import (
+    any_of_validator,
+    enum_validator,
+    enum_values,
+    map_validator,
+    markdown_parser,
+    markdown_validator,
+    resolve_any_of,
+)
+
+
+def test_enum_validator():
+    size = yasl_enum("size", ["small", "large"], "shop")
+    values = enum_values(size)  # type: ignore
+    assert values == frozenset({"small", "large"})
+    assert enum_values(size) is values  # type: ignore
+
+    assert enum_validator(None, size.small, size, values) is size.small  # type: ignore
+    assert enum_validator(None, "large", size, values) == "large"  # type: ignore
+    with pytest.raises(ValueError, match=r"must be one of \['small', 'large'\]"):
+        enum_validator(None, "medium", size, values)  # type: ignore
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+def test_resolve_any_of(registry):
+    size = yasl_enum("size", ["small", "large"], "shop")
+    registry.register_enum("size", size, "shop")  # type: ignore
+
+    any_of = resolve_any_of(["int", "str[]", "size", "map[str, str]"], "shop")
+    assert any_of.types == (int, size, dict)
+    for value in [1, True, ["a", "b"], [], "small", size.large, {"a": "b"}]:
+        assert any_of.matches(value), value
+    for value in ["medium", 1.5, ["a", 1], None]:
+        assert not any_of.matches(value), value
+    assert resolve_any_of(["int", "any"], None).types == (int, object)
+
+    # values of these primitives are plain strings or numbers, so they are
+    # validated rather than checked with isinstance
+    any_of = resolve_any_of(["length", "int", "EmailStr", "PositiveInt[]"], None)
+    for value in ["5 m", " 2.5 km", 3, "a@b.com", [1, 2]]:
+        assert any_of.matches(value), value
+    for value in ["5 s", "1.5.3 m", "a@", [1, -2]]:
+        assert not any_of.matches(value), value
+
+    with pytest.raises(ValueError, match="Unknown type 'colour'"):
+        resolve_any_of(["int", "colour"], "shop")
+
+
+def test_any_of_validators(registry):
+    any_of = resolve_any_of(["int", "bool"], None)
+    assert any_of_validator(None, 3, any_of) == 3
+    with pytest.raises(ValueError, match=r"must be one of \['int', 'bool'\]"):
+        any_of_validator(None, "3", any_of)
+
+    assert map_validator(None, {"a": 1, "b": True}, "str", "any", any_of) == {
+        "a": 1,
+        "b": True,
+    }
+    with pytest.raises(ValueError, match="Map values must be one of"):
+        map_validator(None, {"a": 1, "b": "x"}, "str", "any", any_of)
+
+
+def test_markdown_validator():
+    assert (
+        markdown_validator(None, "# Title\n\nSome *text*.") == "# Title\n\nSome *text*."
+    )
+    for value in ["", "  \n", "bad \ud800 surrogate"]:
+        with pytest.raises(ValueError):
+            markdown_validator(None, value)
+    assert markdown_validator(None, "# Title", strict=True) == "# Title"
+    with pytest.raises(ValueError, match="not valid"):
+        markdown_validator(None, "  \n", strict=True)
+
+
+def test_markdown_parser_per_thread():
+    parser = markdown_parser()
+    assert markdown_parser() is parser
+    with ThreadPoolExecutor(1) as pool:
+        assert pool.submit(markdown_parser).result() is not parser
+
+
+def test_markdown_strict_property(registry):
+    schema = load_schema(
+        {
+            "definitions": {
+                "docs": {
+                    "types": {
+                        "page": {
+                            "properties": {
+                                "body": {"type": "markdown"},
+                                "summary": {
+                                    "type": "markdown",
+                                    "markdown_strict": True,
+                                },
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    )
+    assert (
+        schema.definitions["docs"]
+        .types["page"]
+        .properties[  # type: ignore
+            "summary"
+        ]
+        .markdown_strict
+    )
+    assert load_data({"body": "text", "summary": "*short*"}, "page") is not None
+    assert load_data({"body": "text", "summary": " "}, "page") is None
+
+
+ANY_OF_YASL = """
+definitions:
+  shop:
+    types:
+      label:
+        properties:
+          text:
+            type: str
+            presence: required
+      item:
+        properties:
+          tags:
+            type: any
+            any_of:
+              - str[]
+              - int
+          extra:
+            type: any
+            any_of:
+              - label
+              - label[]
+          size:
+            type: any
+            any_of:
+              - length
+              - int
+          contact:
+            type: map[str, any]
+            any_of:
+              - EmailStr
+"""
+
+
+def test_any_of_with_mappings(registry, tmp_path, caplog):
+    path = tmp_path / "shop.yasl"
+    path.write_text(ANY_OF_YASL)
+    assert load_schema_files(str(path)) is not None
+
+    # unhashable items fail the check instead of raising TypeError
+    assert load_data({"tags": [{"a": 1}]}, "item", "shop") is None
+    assert "must be one of ['str[]', 'int']" in caplog.text
+    assert load_data({"tags": ["a", "b"]}, "item", "shop") is not None
+
+    # mappings are validated against the YASL types named in any_of
+    assert load_data({"extra": {"text": "hi"}}, "item", "shop") is not None
+    assert load_data({"extra": [{"text": "a"}, {"text": "b"}]}, "item", "shop")
+    assert load_data({"extra": {"size": 1}}, "item", "shop") is None
+    assert load_data({"extra": [{"text": "a"}, {"size": 1}]}, "item", "shop") is None
+
+    # quantities and pydantic types are validated with their type adapters
+    assert load_data({"size": "5 m"}, "item", "shop") is not None
+    assert load_data({"size": 5}, "item", "shop") is not None
+    assert load_data({"size": "5 s"}, "item", "shop") is None
+    assert load_data({"contact": {"sales": "a@b.com"}}, "item", "shop") is not None
+    assert load_data({"contact": {"sales": "nobody"}}, "item", "shop") is None
@@ -0,0 +1,193 @@
+import os
+from io import StringIO
+
+import pytest
+from test_deferred_references import CUSTOMERS_YAML, ORDERS_YAML, STORE_YASL
+
+from yasl.cache import YaslRegistry
+from yasl.core import setup_logging
+from yasl.watch import Watcher
+
+BASE_YASL = """
+definitions:
+  base:
+    enums:
+      size:
+        values:
+          - small
+          - large
+    types:
+      item:
+        properties:
+          size:
+            type: size
+            presence: required
+"""
+
+SHOP_YASL = """
+imports:
+  - ../lib/base.yasl
+definitions:
+  shop:
+    types:
+      basket:
+        properties:
+          items:
+            type: item[]
+            presence: required
+"""
+
+OTHER_YASL = """
+definitions:
+  other:
+    types:
+      note:
+        properties:
+          text:
+            type: str
+            presence: required
+"""
+
+
+@pytest.fixture
+def registry():
+    reg = YaslRegistry()
+    reg.clear_caches()
+    yield reg
+    reg.clear_caches()
+
+
+@pytest.fixture
+def log():
+    stream = StringIO()
+    setup_logging(
+        disable=False, verbose=False, quiet=False, output="text", stream=stream
+    )
+    return stream
+
+
+def write(path, text):
+    """Write a file so that its modification time is sure to change."""
+    mtime_ns = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+
+def validated(log):
+    return log.getvalue().count("data validation successful")
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "store.yasl").write_text(STORE_YASL)
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "a_orders.yaml").write_text(ORDERS_YAML)
+    (data / "b_customers.yaml").write_text(CUSTOMERS_YAML)
+    for i in range(3):
+        (data / f"c_orders_{i}.yaml").write_text(
+            f"orders:\n  - id: {10 + i}\n    customer_name: Bob\n"
+        )
+    watcher = Watcher(str(tmp_path / "store.yasl"), str(data))
+    return watcher, data
+
+
+def test_data_change_validates_changed_files(registry, log, store):
+    watcher, data = store
+    assert watcher.start()
+    assert validated(log) == 5
+    assert watcher.poll_once() is None
+
+    write(data / "c_orders_1.yaml", "orders:\n  - id: 11\n    customer_name: Alice\n")
+    assert watcher.poll_once() is True
+    assert validated(log) == 6
+
+    # removing a referenced customer fails the files that reference it
+    write(data / "b_customers.yaml", "customers:\n  - name: Bob\n")
+    assert watcher.poll_once() is False
+    assert validated(log) == 7
+    assert "Referenced value 'Alice' does not exist" in log.getvalue()
+
+    # a duplicate unique value fails the new file only
+    write(data / "d_customers.yaml", "customers:\n  - name: Bob\n  - name: Alice\n")
+    assert watcher.poll_once() is False
+    assert watcher.failed == {data / "d_customers.yaml"}
+
+    # once fixed, the failed file is validated again with the other changes
+    write(data / "d_customers.yaml", "customers:\n  - name: Alice\n")
+    assert watcher.poll_once() is True
+    assert watcher.failed == set()
+
+    (data / "d_customers.yaml").unlink()
+    assert watcher.poll_once() is False
+    assert "Referenced value 'Alice' does not exist" in log.getvalue()
+
+
+@pytest.fixture
+def shop(tmp_path):
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "base.yasl").write_text(BASE_YASL)
+    schema = tmp_path / "schema"
+    schema.mkdir()
+    (schema / "shop.yasl").write_text(SHOP_YASL)
+    (schema / "other.yasl").write_text(OTHER_YASL)
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "basket.yaml").write_text("items:\n  - size: small\n")
+    (data / "note.yaml").write_text("text: hello\n")
+    return Watcher(str(schema), str(data)), lib, schema, data
+
+
+def test_schema_change_generates_affected_namespaces(registry, log, shop):
+    watcher, lib, schema, data = shop
+    assert watcher.start()
+    basket = registry.get_type("basket", "shop")
+    note = registry.get_type("note", "other")
+
+    write(schema / "other.yasl", OTHER_YASL.replace("str", "int"))
+    assert watcher.poll_once() is False
+    assert registry.get_type("basket", "shop") is basket
+    assert registry.get_type("note", "other") is not note
+    note = registry.get_type("note", "other")
+
+    # the imported namespace and the namespace using it are generated again
+    write(lib / "base.yasl", BASE_YASL.replace("- large", "- medium"))
+    write(data / "note.yaml", "text: 1\n")
+    assert watcher.poll_once() is True
+    assert registry.get_type("basket", "shop") is not basket
+    assert registry.get_type("note", "other") is note
+    assert [m.value for m in registry.get_enum("size", "base")] == ["small", "medium"]
+
+    write(data / "basket.yaml", "items:\n  - size: large\n")
+    assert watcher.poll_once() is False
+
+
+def test_schema_error_and_import_change_reload(registry, log, shop):
+    watcher, lib, schema, data = shop
+    assert watcher.start()
+    note = registry.get_type("note", "other")
+
+    write(lib / "base.yasl", BASE_YASL.replace("type: size", "type: unknown_type"))
+    assert watcher.poll_once() is False
+    assert registry.get_type("basket", "shop") is None
+
+    write(lib / "base.yasl", BASE_YASL)
+    assert watcher.poll_once() is True
+    assert registry.get_type("note", "other") is not note
+
+    # a file imported by several schemas is only loaded once
+    write(schema / "other.yasl", "imports:\n  - ../lib/base.yasl\n" + OTHER_YASL)
+    assert watcher.poll_once() is True
+    assert "already exists" not in log.getvalue()
+    assert registry.get_type("basket", "shop") is not None
+
+
+def test_remove_namespace(registry, log, shop):
+    watcher, lib, schema, data = shop
+    assert watcher.start()
+    registry.remove_namespace("base")
+    assert registry.get_type("item", "base") is None
+    assert registry.get_enum("size", "base") is None
+    assert registry.find_types_for_keys(["size"]) == []
+    assert registry.get_type("basket", "shop") is not None
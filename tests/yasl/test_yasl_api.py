@@ -147,3 +147,66 @@ def test_yaml_data_validation_errors():
         yaml_data=yaml_data_extra_field,
     )
     assert result is None
+
+
+def test_type_validators_do_not_serialize(monkeypatch):
+    """Type-level validators read presence from the instance instead of dumping it."""
+    from ruamel.yaml import YAML
+
+    from yasl.cache import YaslRegistry
+    from yasl.pydantic_types import YASLBaseModel
+
+    registry = YaslRegistry()
+    registry.clear_caches()
+    with open("features/yasl/data/dir_test/shape.yasl") as f:
+        assert load_schema(YAML(typ="safe").load(f)) is not None
+
+    def fail_dump(self, *args, **kwargs):
+        raise AssertionError("model_dump called during validation")
+
+    monkeypatch.setattr(YASLBaseModel, "model_dump", fail_dump)
+    shape = {"name": "bob", "type": "square", "side_length": 10.0}
+
+    assert load_data({**shape, "color": "red", "location": "top-left"}, "shape")
+    # only_one, at_least_one and if_then still reject invalid data
+    assert load_data({**shape, "location": "top-left"}, "shape") is None
+    assert load_data({**shape, "color": "red"}, "shape") is None
+    assert (
+        load_data(
+            {**shape, "color": "red", "location": "top-left", "radius": 1.0}, "shape"
+        )
+        is None
+    )
+    registry.clear_caches()
+
+
+def test_str_regex_compiled_at_schema_load():
+    """Invalid str_regex patterns are schema errors; valid ones are enforced."""
+    from yasl.cache import YaslRegistry
+
+    registry = YaslRegistry()
+    registry.clear_caches()
+
+    def schema(pattern):
+        return {
+            "definitions": {
+                "regex_ns": {
+                    "types": {
+                        "code": {
+                            "properties": {
+                                "value": {"type": "str", "str_regex": pattern}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    with pytest.raises(ValidationError, match="Invalid str_regex pattern '\\[a-z'"):
+        load_schema(schema("[a-z"))
+    assert registry.get_type("code", "regex_ns") is None
+
+    assert load_schema(schema(r"[A-Z]{3}-\d+")) is not None
+    assert load_data({"value": "ABC-12"}, "code", "regex_ns") is not None
+    assert load_data({"value": "ABC-12x"}, "code", "regex_ns") is None
+    registry.clear_caches()